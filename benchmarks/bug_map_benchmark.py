@@ -0,0 +1,142 @@
+"""
+Benchmark of get_bug_to_tests_map on synthetic STDs.
+
+Compares the vectorized mapping (get_bug_to_tests_map_from_df) with the previous
+row-by-row implementation on DataFrames of 100k+ rows, and checks that both return
+exactly the same map (same bugs in the same order, same test IDs with the same types).
+
+With --excel, the STD is also written to an .xlsx file to time its loading, with and without
+the STD cache (infra/std_cache.py).
+
+Usage (from the project root):
+    python benchmarks/bug_map_benchmark.py
+    python benchmarks/bug_map_benchmark.py --rows 100000 250000 --excel
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from collections import defaultdict
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infra import working_with_exel
+from infra.std_cache import StdCache
+from infra.working_with_exel import (
+    get_bug_to_tests_map, get_bug_to_tests_map_from_df, normalize_columns_pandas, get_column_pandas, load_std_table
+)
+
+
+def legacy_bug_to_tests_map(df):
+    """The row-by-row implementation that get_bug_to_tests_map_from_df replaced (reference for the output)."""
+    df = normalize_columns_pandas(df)
+
+    bug_col = get_column_pandas(df, "bug")
+    id_col = get_column_pandas(df, "id") if "id" in df.columns else None
+    if id_col is None:
+        raise ValueError("No ID column found. Make sure your file has an ID column.")
+
+    with_bugs = df[df[bug_col].apply(lambda x: isinstance(x, (int, float, str)) and not pd.isna(x))]
+
+    bug_to_tests = defaultdict(list)
+    for _, row in with_bugs.iterrows():
+        raw_bug_val = str(row[bug_col])
+        test_id = row[id_col]
+
+        bug_ids = [bug.strip() for bug in str(raw_bug_val).split(",") if bug.strip()]
+
+        for bug_id_str in bug_ids:
+            if bug_id_str.replace(".", "", 1).isdigit():
+                if bug_id_str.endswith(".0"):
+                    bug_id_str = bug_id_str[:-2]
+            bug_to_tests[bug_id_str].append(test_id)
+
+    return dict(bug_to_tests)
+
+
+def make_std(rows, seed=1):
+    """Synthetic STD: about 1 row in 4 has a bug; cells mix numbers, text, several bugs and '1234.0' values."""
+    rng = random.Random(seed)
+    bug_pool = rows // 25 + 1
+
+    def bug_cell():
+        kind = rng.random()
+        if kind < 0.75:
+            return None
+        bug = rng.randint(100000, 100000 + bug_pool)
+        if kind < 0.85:
+            return bug
+        if kind < 0.90:
+            return float(bug)
+        if kind < 0.93:
+            return f"{bug}.0"
+        if kind < 0.98:
+            return f"{bug}, {rng.randint(100000, 100000 + bug_pool)}"
+        return rng.choice(["TBD", " ", "N/A", f" {bug} ,", pd.Timestamp("2024-01-01")])
+
+    return pd.DataFrame({
+        "ID": range(1, rows + 1),
+        "Headline": [f"Test {i}" for i in range(1, rows + 1)],
+        "Expected Results": ["Expected"] * rows,
+        "Test Results": [rng.choice(["Pass", "Fail", "N/A", None]) for _ in range(rows)],
+        "Defect No": [bug_cell() for _ in range(rows)],
+    })
+
+
+def typed(bug_map):
+    """Map with every test ID paired with its type, so equal values of different types do not compare equal."""
+    return [(bug, [(type(tid), tid) for tid in tests]) for bug, tests in bug_map.items()]
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark get_bug_to_tests_map on synthetic STDs")
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 250000], help='STD sizes to test')
+    parser.add_argument('--excel', action='store_true',
+                        help='Also time loading the STD written to an .xlsx file (slow to write)')
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = make_std(rows)
+        legacy, legacy_seconds = timed(legacy_bug_to_tests_map, df.copy())
+        vectorized, vectorized_seconds = timed(get_bug_to_tests_map_from_df, df.copy())
+        if typed(legacy) != typed(vectorized):
+            raise SystemExit(f"{rows} rows: the vectorized map differs from the legacy one")
+
+        print(f"{rows} rows, {len(vectorized)} bugs: legacy {legacy_seconds:.3f}s, "
+              f"vectorized {vectorized_seconds:.3f}s ({legacy_seconds / vectorized_seconds:.1f}x faster), identical")
+
+        if args.excel:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                excel_path = os.path.join(temp_dir, "std.xlsx")
+                df.to_excel(excel_path, index=False)
+                _, pandas_seconds = timed(pd.read_excel, excel_path)
+                _, load_seconds = timed(load_std_table, excel_path)
+                # Uses the table loaded just above, like validate_and_summarize does after the bug map
+                _, map_seconds = timed(get_bug_to_tests_map, excel_path)
+                print(f"  from .xlsx: pd.read_excel {pandas_seconds:.2f}s, load_std_table {load_seconds:.2f}s, "
+                      f"get_bug_to_tests_map on the loaded table {map_seconds:.2f}s")
+
+                cache_folder = os.path.join(temp_dir, "cache")
+                _, store_seconds = timed(get_bug_to_tests_map, excel_path, StdCache(cache_folder))
+                # A repeat run starts in a new process, with nothing loaded in memory
+                working_with_exel._load_std_table.cache_clear()
+                _, table_seconds = timed(load_std_table, excel_path, StdCache(cache_folder))
+                _, cached_map_seconds = timed(get_bug_to_tests_map, excel_path, StdCache(cache_folder))
+                print(f"  STD cache: stored in {store_seconds:.2f}s, repeat run loads the table in "
+                      f"{table_seconds * 1000:.0f} ms and the bug map in {cached_map_seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
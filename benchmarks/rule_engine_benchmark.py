@@ -0,0 +1,94 @@
+"""
+Benchmark of the STD rule validation.
+
+Compares the two ways the rule registry (infra/std_rules.py) is checked: as one mask per rule
+over the whole sheet (CompiledRules.masks, used by validate_and_summarize) and row by row
+(CompiledRules.violations, used by the streaming mode), on synthetic STD tables, and checks
+that both return exactly the same rules dict. The tables are built in memory, so the time to read the Excel
+file is not included.
+
+Usage (from the project root):
+    python benchmarks/rule_engine_benchmark.py
+    python benchmarks/rule_engine_benchmark.py --rows 10000 100000 1000000
+"""
+
+import io
+import os
+import sys
+import time
+import random
+import argparse
+import contextlib
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infra.std_rules import CompiledRules
+from infra.working_with_exel import StdTable, normalize_columns, strip_row, validate_and_summarize
+
+HEADERS = ["ID", "Headline", "Test Description", "Expected Results", "Test Results",
+           "Actual Results", "Defect No", "Comment", "Headline"]
+
+
+def loop_rules(table):
+    """Row-by-row check of the rules (reference for the output)."""
+    compiled = CompiledRules.for_table(table)
+    rules = compiled.empty_results()
+    for row_dict in table.row_dicts():
+        row_dict = strip_row(row_dict)
+        for rule_name in compiled.violations(row_dict):
+            rules[rule_name].append(row_dict)
+    return rules
+
+
+def make_table(rows, odd_rate, seed=1):
+    """
+    Synthetic STD of consistent rows (Pass/Y, Fail/"N, reason"/bug, N/A with a comment...).
+    Each cell is replaced with probability odd_rate by a value the rules treat specially.
+    """
+    rng = random.Random(seed)
+    odd = [None, "", "  ", 0, 0.0, False, True, float("nan"), "None", "nan", " pass ", "Blocked",
+           "N/A", "n, x", "N,", "y", 1234, "55, 66", datetime(2024, 1, 1)]
+
+    data = []
+    for i in range(1, rows + 1):
+        result = rng.choice(["Pass", "Pass", "Pass", "Fail", "Not Tested", "N/A"])
+        actual = {"Pass": "Y", "Fail": "N, crash on save"}.get(result, "N/A")
+        bug = rng.randint(100000, 100000 + rows // 25) if result == "Fail" else None
+        comment = "Not applicable to this build" if result == "N/A" else None
+        row = (i, f"Test {i}", "Open the dialog and press the button", "Dialog closes",
+               result, actual, bug, comment, None)
+        data.append(tuple(rng.choice(odd) if rng.random() < odd_rate else value for value in row))
+    return StdTable(normalize_columns(HEADERS), data)
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the STD rule validation on synthetic tables")
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000], help='STD sizes to test')
+    args = parser.parse_args()
+
+    # A realistic STD with a few violations, and one full of odd cells to check that the output is identical
+    for label, odd_rate in (("typical", 0.005), ("odd cells", 0.3)):
+        print(f"{label} STD:")
+        for rows in args.rows:
+            table = make_table(rows, odd_rate)
+            loop, loop_seconds = timed(loop_rules, table)
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine, engine_seconds = timed(validate_and_summarize, table)
+            if loop != engine:
+                raise SystemExit(f"{rows} rows: the rule engine differs from the row loop")
+
+            violations = sum(len(v) for v in engine.values())
+            print(f"  {rows} rows, {violations} violations: loop {loop_seconds:.2f}s, "
+                  f"rule engine {engine_seconds:.2f}s ({loop_seconds / engine_seconds:.1f}x faster), identical")
+
+
+if __name__ == "__main__":
+    main()
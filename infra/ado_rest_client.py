@@ -0,0 +1,193 @@
+import os
+import random
+import logging
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.constants import RestApi, WorkItemFields
+
+
+def parse_ado_url(url: str) -> Tuple[str, str]:
+    """
+    Split an Azure DevOps project URL into its organization (collection) URL and project name.
+
+    Works for every URL under the project, e.g.:
+    - https://dev.azure.com/{org}/{project}/_workitems  -> (https://dev.azure.com/{org}, {project})
+    - https://{org}.visualstudio.com/{project}/_workitems -> (https://{org}.visualstudio.com, {project})
+    - https://{server}/tfs/{collection}/{project}/_workitems -> (https://{server}/tfs/{collection}, {project})
+
+    :param url: Any Azure DevOps URL inside the project (the config "url")
+    :return: Tuple of (organization_url, project)
+    """
+    parts = urlsplit(url.strip())
+    segments = []
+    for segment in parts.path.split("/"):
+        # Everything from the first "_xxx" route segment on belongs to the page, not the project
+        if segment.startswith("_"):
+            break
+        if segment:
+            segments.append(segment)
+
+    if not parts.scheme or not parts.netloc or not segments:
+        raise ValueError(f"Cannot find the Azure DevOps project in URL: {url}")
+
+    organization_path = "/".join(segments[:-1])
+    organization_url = f"{parts.scheme}://{parts.netloc}" + (f"/{organization_path}" if organization_path else "")
+    return organization_url, segments[-1]
+
+
+def get_field_reference_names(config: dict) -> Dict[str, str]:
+    """
+    Return the REST reference name of every validated field.
+    Defaults come from WorkItemFields.DEFAULT_REFERENCE_NAMES and can be overridden
+    with the "rest_field_reference_names" config key (same keys, e.g. {"STD ID": "Custom.StdId"}).
+    """
+    reference_names = dict(WorkItemFields.DEFAULT_REFERENCE_NAMES)
+    reference_names.update(config.get("rest_field_reference_names", {}))
+    return reference_names
+
+
+def get_work_item_api_url(organization_url: str, project: str, work_item_id: int, fields: List[str]) -> str:
+    """
+    Return the REST URL that reads the given fields of one work item.
+
+    :param organization_url: Organization or collection URL (see parse_ado_url)
+    :param project: Project name
+    :param work_item_id: Work item ID
+    :param fields: Field reference names
+    """
+    return (f"{organization_url.rstrip('/')}/{project}/_apis/wit/workitems/{work_item_id}"
+            f"?fields={','.join(fields)}&api-version={RestApi.API_VERSION}")
+
+
+def get_retry_delay(response: requests.Response, attempt: int) -> float:
+    """
+    Return how long to wait before retrying a throttled (429) or failed (5xx) request.
+    Honors the Retry-After header (seconds or HTTP date); otherwise uses exponential
+    backoff with full jitter, capped at RestApi.MAX_BACKOFF.
+
+    :param response: The response that should be retried
+    :param attempt: Zero-based number of the attempt that just failed
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    return random.uniform(0, min(RestApi.MAX_BACKOFF, RestApi.BACKOFF_FACTOR * (2 ** attempt)))
+
+
+class AdoRestClient:
+    """
+    Minimal Azure DevOps REST client for reading work item fields.
+    Uses one keep-alive HTTP session with a connection pool and PAT authentication.
+    """
+
+    def __init__(self, organization_url: str, project: str, pat: str, verify_ssl: bool = True,
+                 pool_size: int = RestApi.POOL_SIZE, max_retries: int = RestApi.MAX_RETRIES):
+        """
+        :param organization_url: Organization or collection URL, e.g. https://dev.azure.com/my-org
+        :param project: Project name (as it appears in URLs)
+        :param pat: Personal access token with Work Items (Read) scope
+        :param verify_ssl: Verify the server certificate
+        :param pool_size: Number of keep-alive connections kept open
+        :param max_retries: Automatic retries of 429/5xx responses (0 when the caller retries itself)
+        """
+        self.organization_url = organization_url.rstrip("/")
+        self.project = project
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=RestApi.BACKOFF_FACTOR,
+            status_forcelist=RestApi.RETRY_STATUS_CODES,
+            allowed_methods=None,  # the batch endpoint is a read-only POST, so retrying it is safe
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.auth = ("", pat)
+        self._session.verify = verify_ssl
+        self._session.headers.update({"Accept": "application/json"})
+
+    @classmethod
+    def from_config(cls, config: dict, **kwargs) -> "AdoRestClient":
+        """
+        Build a client from config.json: the project comes from "url", the token from
+        "rest_api_pat" or the ADO_PAT environment variable.
+
+        :param kwargs: Extra constructor arguments (pool_size, max_retries)
+        """
+        pat = config.get("rest_api_pat") or os.getenv(RestApi.PAT_ENV_VAR)
+        if not pat:
+            raise ValueError(f"No personal access token: set 'rest_api_pat' in config.json "
+                             f"or the {RestApi.PAT_ENV_VAR} environment variable")
+        organization_url, project = parse_ado_url(config["url"])
+        return cls(organization_url, project, pat, verify_ssl=config.get("rest_verify_ssl", True), **kwargs)
+
+    @property
+    def session(self) -> requests.Session:
+        """The underlying keep-alive HTTP session."""
+        return self._session
+
+    def work_items_batch_url(self) -> str:
+        return f"{self.organization_url}/{self.project}/_apis/wit/workitemsbatch?api-version={RestApi.API_VERSION}"
+
+    def work_item_url(self, work_item_id: int) -> str:
+        return f"{self.organization_url}/{self.project}/_apis/wit/workitems/{work_item_id}"
+
+    def get_work_item_response(self, work_item_id: int, fields: List[str]) -> requests.Response:
+        """
+        Request the given fields of one work item and return the raw response (status not checked),
+        so the caller can decide how to handle 404, 429 and 5xx.
+        """
+        return self._session.get(
+            self.work_item_url(work_item_id),
+            params={"fields": ",".join(fields), "api-version": RestApi.API_VERSION},
+            timeout=RestApi.REQUEST_TIMEOUT,
+        )
+
+    def get_work_items(self, ids: Iterable[int], fields: List[str],
+                       batch_size: int = RestApi.BATCH_SIZE) -> Dict[int, dict]:
+        """
+        Read the given fields of many work items through the batch endpoint.
+
+        :param ids: Work item IDs
+        :param fields: Field reference names to return (e.g. System.IterationPath)
+        :param batch_size: IDs per request (the endpoint accepts at most 200)
+        :return: dict of work item ID -> dict of field reference name -> value. IDs that do not
+                 exist (or cannot be read) are missing from the result.
+        """
+        ids = list(dict.fromkeys(int(i) for i in ids))
+        work_items = {}
+        for start in range(0, len(ids), batch_size):
+            chunk = ids[start:start + batch_size]
+            response = self._session.post(
+                self.work_items_batch_url(),
+                json={"ids": chunk, "fields": fields, "errorPolicy": "omit"},
+                timeout=RestApi.REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            for item in response.json().get("value", []):
+                # With errorPolicy "omit", unreadable IDs come back as null entries
+                if item:
+                    work_items[int(item["id"])] = item.get("fields", {})
+            logging.info(f"Fetched {len(chunk)} work items ({start + len(chunk)}/{len(ids)}) from the REST API")
+        return work_items
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._session.close()
@@ -60,6 +60,19 @@ class BasePage:
             });
         """, element)
 
+    def navigate_in_app(self, url: str):
+        """
+        Move the single-page web app to another URL of the same origin through its client-side router:
+        the URL is pushed to the history and a popstate event is raised, so the app re-renders the
+        route without reloading the page, its scripts or its shell. Nothing is waited for.
+
+        :param url: Absolute URL on the origin of the current page
+        """
+        self._driver.execute_script("""
+            window.history.pushState({}, '', arguments[0]);
+            window.dispatchEvent(new PopStateEvent('popstate', {state: {}}));
+        """, url)
+
     def navigate_with_retry(self, url: str, retries: int = Retries.NAVIGATION_RETRIES):
         """Navigate to a URL and retry if the page fails to load completely."""
         for attempt in range(1, retries + 1):
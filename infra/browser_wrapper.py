@@ -1,11 +1,12 @@
 import os
-import chromedriver_autoinstaller
 
 from selenium import webdriver
 from selenium import common as c
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from infra.chromedriver_resolver import resolve_chromedriver_path
+from infra.lean_browser import apply_lean_options, block_resources, report_lean_savings
 from utils.constants import BrowserOptions
 
 # Disable SSL verification via environment variable
@@ -23,11 +24,13 @@ class BrowserWrapper:
         """
         self._driver = None
 
-    def get_driver(self, url):
+    def get_driver(self, url, lean=False, report_savings=False):
         """
         Initialize the WebDriver based on the configuration and navigate to the specified URL.
 
         :param url: The URL to navigate to.
+        :param lean: Use the lean profile (see infra.lean_browser).
+        :param report_savings: With lean, report what the profile saves per page load, measured on url.
         :return: The WebDriver instance.
         """
         try:
@@ -35,13 +38,20 @@ class BrowserWrapper:
 
             for arg in BrowserOptions.ARGUMENTS:
                 options.add_argument(arg)
+            if lean:
+                apply_lean_options(options)
 
-            # Install once, reuse every time
-            driver_path = chromedriver_autoinstaller.install()
+            # Install once per Chrome version, reuse every time
+            driver_path = resolve_chromedriver_path()
             service = Service(driver_path)
 
             self._driver = webdriver.Chrome(service=service, options=options)
-            self._driver.get(url)
+            if lean:
+                block_resources(self._driver)
+            if lean and report_savings:
+                report_lean_savings(self._driver, url)
+            else:
+                self._driver.get(url)
             self._driver.maximize_window()
             return self._driver
 
@@ -0,0 +1,77 @@
+import os
+import json
+import logging
+import threading
+from typing import Optional
+
+import chromedriver_autoinstaller
+
+from utils.constants import APP_DATA_FOLDER_NAME, ChromeDriverStamp
+
+_lock = threading.Lock()
+
+
+def get_stamp_path() -> str:
+    """Return the stamp file path inside the per-user AppData folder."""
+    appdata = os.getenv('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+    folder = os.path.join(appdata, APP_DATA_FOLDER_NAME)
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, ChromeDriverStamp.FILE_NAME)
+
+
+def read_stamp(path: str) -> Optional[dict]:
+    """Return the stamp content, or None if it is missing or unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_stamp(path: str, chrome_version: str, driver_path: str) -> None:
+    """Write the stamp atomically, so a concurrent run never reads half of it."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"chrome_version": chrome_version, "driver_path": driver_path}, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.warning(f"Could not write ChromeDriver stamp {path}: {e}")
+
+
+def resolve_chromedriver_path(stamp_path: Optional[str] = None) -> str:
+    """
+    Return the ChromeDriver executable matching the installed Chrome.
+
+    In order: the path handed down by the parent process (ChromeDriverStamp.PATH_ENV_VAR),
+    the stamp file if it was written for the installed Chrome version and its driver still
+    exists, and finally chromedriver_autoinstaller.install(), whose result is stamped.
+    The resolved path is then exported to the environment, so threads of this process and
+    worker processes started afterwards reuse it directly.
+
+    :param stamp_path: Stamp file (defaults to AppData/ste_tool_studio/chromedriver_stamp.json)
+    :return: Path of the ChromeDriver executable
+    """
+    driver_path = os.environ.get(ChromeDriverStamp.PATH_ENV_VAR)
+    if driver_path and os.path.isfile(driver_path):
+        return driver_path
+
+    with _lock:
+        driver_path = os.environ.get(ChromeDriverStamp.PATH_ENV_VAR)
+        if driver_path and os.path.isfile(driver_path):
+            return driver_path
+
+        stamp_path = stamp_path or get_stamp_path()
+        chrome_version = chromedriver_autoinstaller.get_chrome_version()
+        stamp = read_stamp(stamp_path)
+        if (chrome_version and stamp and stamp.get("chrome_version") == chrome_version
+                and os.path.isfile(stamp.get("driver_path", ""))):
+            driver_path = stamp["driver_path"]
+        else:
+            driver_path = chromedriver_autoinstaller.install()
+            if chrome_version and driver_path:
+                write_stamp(stamp_path, chrome_version, driver_path)
+            logging.info(f"Resolved ChromeDriver for Chrome {chrome_version}: {driver_path}")
+
+        os.environ[ChromeDriverStamp.PATH_ENV_VAR] = driver_path
+        return driver_path
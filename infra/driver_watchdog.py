@@ -0,0 +1,81 @@
+import os
+import time
+import logging
+import threading
+import subprocess
+from typing import Optional
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; the process tree is then killed with taskkill on Windows
+    psutil = None
+
+
+def kill_driver(driver) -> None:
+    """
+    Kill a ChromeDriver and the Chrome processes it started, without talking to it.
+    Every later WebDriver command on this driver fails right away instead of waiting for its timeout.
+
+    :param driver: Chrome WebDriver instance (possibly hung)
+    """
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        # Not started by a local service: ending the session is the only option
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Could not quit hung driver: {e}")
+        return
+
+    try:
+        if psutil is not None:
+            for child in psutil.Process(process.pid).children(recursive=True):
+                child.kill()
+        elif os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
+    except Exception as e:
+        logging.warning(f"Could not kill the Chrome processes of driver {process.pid}: {e}")
+
+    try:
+        process.kill()
+    except Exception as e:
+        logging.warning(f"Could not kill driver {process.pid}: {e}")
+
+
+class DriverWatchdog:
+    """
+    Wall-clock deadline for the work done on one driver.
+
+    Used as a context manager around the work: if the deadline passes before the block ends,
+    the driver is killed from a timer thread so the blocked WebDriver call returns with an error,
+    and fired is set so the caller knows the result is not valid. fired_at (time.monotonic())
+    tells which results were complete before the kill.
+    """
+
+    def __init__(self, driver, deadline_seconds: float):
+        """
+        :param driver: Driver killed when the deadline passes
+        :param deadline_seconds: Allowed duration of the block
+        """
+        self.driver = driver
+        self.deadline_seconds = deadline_seconds
+        self.fired = False
+        self.fired_at: Optional[float] = None
+        self._timer = None
+
+    def _on_deadline(self) -> None:
+        self.fired_at = time.monotonic()
+        self.fired = True
+        logging.warning(f"Watchdog: deadline of {self.deadline_seconds}s passed, killing the driver")
+        kill_driver(self.driver)
+
+    def __enter__(self) -> "DriverWatchdog":
+        self._timer = threading.Timer(self.deadline_seconds, self._on_deadline)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._timer.cancel()
+        # If the timer already started, wait for the kill to finish before the driver is touched again
+        self._timer.join()
@@ -0,0 +1,114 @@
+import logging
+from typing import Dict, List, Optional
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+from utils.constants import LeanBrowser, Timeouts
+
+# Runs before the page scripts: the default buffer of 250 entries is too small for the web app
+RESOURCE_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(10000);"
+
+# Bytes transferred (document + subresources), request count and load time of the current page.
+# transferSize is 0 for cross-origin resources that do not send Timing-Allow-Origin.
+PAGE_COST_SCRIPT = """
+    var navigation = performance.getEntriesByType('navigation')[0];
+    var resources = performance.getEntriesByType('resource');
+    var bytes = navigation ? navigation.transferSize : 0;
+    resources.forEach(function (entry) { bytes += entry.transferSize || 0; });
+    return {
+        bytes: bytes,
+        requests: resources.length + 1,
+        load_ms: navigation && navigation.loadEventEnd ? navigation.loadEventEnd : performance.now()
+    };
+"""
+
+
+def apply_lean_options(options) -> None:
+    """
+    Add the lean profile switches and the eager page load strategy to Chrome options.
+
+    :param options: webdriver.ChromeOptions being built
+    """
+    for arg in LeanBrowser.ARGUMENTS:
+        options.add_argument(arg)
+    options.page_load_strategy = LeanBrowser.PAGE_LOAD_STRATEGY
+
+
+def block_resources(driver, patterns: Optional[List[str]] = None) -> None:
+    """
+    Block URL patterns in the current tab through the DevTools protocol.
+    The block applies to one tab, so it has to be repeated for every tab opened later.
+
+    :param driver: Chrome WebDriver
+    :param patterns: Network.setBlockedURLs patterns (defaults to LeanBrowser.BLOCKED_URL_PATTERNS)
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or LeanBrowser.BLOCKED_URL_PATTERNS})
+
+
+def load_and_measure(driver, url: str) -> Dict[str, float]:
+    """
+    Load a URL, wait for its load event and return what the page cost (see PAGE_COST_SCRIPT).
+    """
+    driver.get(url)
+    try:
+        WebDriverWait(driver, Timeouts.PAGE_READY_TIMEOUT).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        logging.warning(f"{url} did not finish loading, measuring it as it is")
+    return driver.execute_script(PAGE_COST_SCRIPT)
+
+
+def measure_lean_savings(driver, url: str, patterns: Optional[List[str]] = None) -> Dict[str, float]:
+    """
+    Load a page twice with the cache disabled, first without and then with the resource
+    block, and return the difference. The page is left loaded with the block active.
+
+    :param driver: Chrome WebDriver
+    :param url: Page to measure
+    :param patterns: Blocked URL patterns (defaults to LeanBrowser.BLOCKED_URL_PATTERNS)
+    :return: dict with bytes_saved, ms_saved and requests_saved for one load of the page
+    """
+    patterns = patterns or LeanBrowser.BLOCKED_URL_PATTERNS
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+    buffer_script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RESOURCE_BUFFER_SCRIPT})
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        full = load_and_measure(driver, url)
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        lean = load_and_measure(driver, url)
+    finally:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": buffer_script["identifier"]})
+
+    return {
+        "bytes_saved": full["bytes"] - lean["bytes"],
+        "ms_saved": full["load_ms"] - lean["load_ms"],
+        "requests_saved": full["requests"] - lean["requests"],
+    }
+
+
+def report_lean_savings(driver, url: str, patterns: Optional[List[str]] = None) -> None:
+    """
+    Measure the lean profile on a page (see measure_lean_savings), print and log the result.
+    The page is loaded at the end even if the measurement fails.
+
+    :param driver: Chrome WebDriver with the lean profile
+    :param url: Page to measure and leave loaded
+    :param patterns: Blocked URL patterns (defaults to LeanBrowser.BLOCKED_URL_PATTERNS)
+    """
+    try:
+        savings = measure_lean_savings(driver, url, patterns)
+    except Exception as e:
+        logging.warning(f"Could not measure the lean browser savings: {e}")
+        driver.get(url)
+        return
+
+    message = (f"Lean browser: {savings['bytes_saved'] / 1024:.0f} KB, {savings['ms_saved']:.0f} ms and "
+               f"{savings['requests_saved']} requests saved per page load")
+    print(message)
+    logging.info(message)
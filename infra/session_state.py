@@ -0,0 +1,102 @@
+import json
+import logging
+
+# Cookie fields accepted by the DevTools Network.setCookies command
+COOKIE_PARAM_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+STORAGE_SNAPSHOT_SCRIPT = """
+    var snapshot = function (storage) {
+        var items = {};
+        for (var i = 0; i < storage.length; i++) {
+            var key = storage.key(i);
+            items[key] = storage.getItem(key);
+        }
+        return items;
+    };
+    return {
+        origin: window.location.origin,
+        local_storage: snapshot(window.localStorage),
+        session_storage: snapshot(window.sessionStorage)
+    };
+"""
+
+STORAGE_RESTORE_SCRIPT = """
+(function () {
+    if (window.location.origin !== %(origin)s) { return; }
+    var restore = function (storage, items) {
+        Object.keys(items).forEach(function (key) {
+            if (storage.getItem(key) === null) { storage.setItem(key, items[key]); }
+        });
+    };
+    restore(window.localStorage, %(local_storage)s);
+    restore(window.sessionStorage, %(session_storage)s);
+})();
+"""
+
+
+class SessionState:
+    """
+    Capture the authenticated state of one browser and replay it into other browsers,
+    so only one of them has to go through the sign-in page.
+    """
+
+    @staticmethod
+    def capture(driver) -> dict:
+        """
+        Capture cookies (of every domain, including the SSO ones) and the web storage of the current page.
+
+        :param driver: Chrome WebDriver sitting on an authenticated page
+        :return: Plain dictionary that can be pickled and sent to worker processes
+        """
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        storage = driver.execute_script(STORAGE_SNAPSHOT_SCRIPT)
+        logging.info(f"Captured session state: {len(cookies)} cookies, "
+                     f"{len(storage['local_storage'])} localStorage keys for {storage['origin']}")
+        return {
+            "cookies": cookies,
+            "origin": storage["origin"],
+            "local_storage": storage["local_storage"],
+            "session_storage": storage["session_storage"],
+        }
+
+    @staticmethod
+    def apply(driver, state: dict) -> None:
+        """
+        Inject a captured session into a fresh driver before it loads any page.
+        Cookies are set through DevTools (no page load needed) and the web storage is
+        restored by a script that runs before the page scripts of the captured origin.
+
+        :param driver: Chrome WebDriver that has not navigated yet
+        :param state: Dictionary returned by SessionState.capture
+        """
+        cookies = []
+        for cookie in state.get("cookies", []):
+            param = {key: cookie[key] for key in COOKIE_PARAM_KEYS if key in cookie}
+            # Session cookies are reported with expires = -1, which setCookies would treat as expired
+            if cookie.get("session") or param.get("expires", 0) <= 0:
+                param.pop("expires", None)
+            cookies.append(param)
+
+        driver.execute_cdp_cmd("Network.enable", {})
+        if cookies:
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+        SessionState.apply_storage(driver, state)
+
+    @staticmethod
+    def apply_storage(driver, state: dict) -> None:
+        """
+        Register the web storage restore script on the current tab. The script only runs in the
+        tab it was registered on (cookies are shared by the whole browser), so every tab opened
+        later needs its own call.
+
+        :param driver: Chrome WebDriver switched to the tab
+        :param state: Dictionary returned by SessionState.capture
+        """
+        if state.get("local_storage") or state.get("session_storage"):
+            source = STORAGE_RESTORE_SCRIPT % {
+                "origin": json.dumps(state.get("origin", "")),
+                "local_storage": json.dumps(state.get("local_storage", {})),
+                "session_storage": json.dumps(state.get("session_storage", {})),
+            }
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
@@ -0,0 +1,192 @@
+"""
+STD Cache Module
+
+Parsed STD workbooks kept on disk, so that runs on an Excel file that did not change
+(violations report, then bug validation) skip the openpyxl parsing. An entry is keyed by the
+size, modification time and SHA-256 of the file, and holds:
+
+- codes.npy: the cells of every column as int32 codes (see encode_column), one row per
+  column; it is memory-mapped when loaded, so a column is only read from disk when used
+- table.pkl: the headers and the distinct values of every column
+- bug_map.pkl: the bug -> test case IDs map, once get_bug_to_tests_map computed it
+
+Any failure to read or write the cache is logged and the Excel file is parsed as usual.
+"""
+
+import os
+import pickle
+import shutil
+import hashlib
+import logging
+import tempfile
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from infra.working_with_exel import StdTable, get_bug_to_tests_map
+from utils.constants import APP_DATA_FOLDER_NAME, StdCacheSettings
+
+CODES_FILE = "codes.npy"
+TABLE_FILE = "table.pkl"
+BUG_MAP_FILE = "bug_map.pkl"
+
+
+def get_default_cache_folder() -> str:
+    """Return the cache folder inside the per-user AppData folder."""
+    appdata = os.getenv('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+    return os.path.join(appdata, APP_DATA_FOLDER_NAME, StdCacheSettings.FOLDER_NAME)
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of the file content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(StdCacheSettings.HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class StdCache:
+    """
+    On-disk cache of parsed STD tables and bug maps, one entry (folder) per version of a
+    workbook. The least recently used entries are removed beyond max_entries.
+    """
+
+    def __init__(self, folder: Optional[str] = None, max_entries: int = StdCacheSettings.MAX_ENTRIES):
+        """
+        :param folder: Cache folder (defaults to AppData/ste_tool_studio/std_cache)
+        :param max_entries: Number of workbooks kept
+        """
+        self.folder = folder or get_default_cache_folder()
+        self.max_entries = max_entries
+        # The file is hashed once per run, not once per lookup
+        self._keys: Dict[tuple, str] = {}
+
+    def key(self, excel_path: str) -> str:
+        """Entry name of the current version of the file: content hash, size and modification time."""
+        stat = os.stat(excel_path)
+        file_id = (os.path.abspath(excel_path), stat.st_size, stat.st_mtime_ns)
+        if file_id not in self._keys:
+            self._keys[file_id] = f"{hash_file(excel_path)}-{stat.st_size}-{stat.st_mtime_ns}"
+        return self._keys[file_id]
+
+    def load_table(self, excel_path: str) -> Optional[StdTable]:
+        """Return the cached table of the file, or None if the file has to be parsed."""
+        entry = self._entry(excel_path)
+        meta = self._read_pickle(entry, TABLE_FILE)
+        if meta is None or meta.get("version") != StdCacheSettings.FORMAT_VERSION:
+            return None
+        try:
+            codes = np.load(os.path.join(entry, CODES_FILE), mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read the STD cache entry {entry}: {e}")
+            return None
+        if codes.shape != (len(meta["headers"]), meta["rows"]):
+            return None
+
+        self._touch(entry)
+        logging.info(f"STD loaded from the cache ({meta['rows']} rows)")
+        return StdTable(meta["headers"], columns=list(zip(codes, meta["values"])))
+
+    def save_table(self, excel_path: str, table: StdTable) -> None:
+        """Store a table parsed from the file."""
+        entry = self._entry(excel_path)
+        try:
+            os.makedirs(entry, exist_ok=True)
+            encoded = [table.column_codes(index) for index in range(len(table.headers))]
+            codes = np.array([codes for codes, _ in encoded], dtype=np.int32).reshape(len(encoded), len(table))
+            self._write(entry, CODES_FILE, lambda f: np.save(f, codes, allow_pickle=False))
+            # Written last: an entry without table.pkl is incomplete and is not read
+            self._write_pickle(entry, TABLE_FILE, {
+                "version": StdCacheSettings.FORMAT_VERSION,
+                "headers": list(table.headers),
+                "rows": len(table),
+                "values": [values for _, values in encoded],
+            })
+        except Exception as e:
+            logging.warning(f"Could not write the STD cache entry {entry}: {e}")
+            return
+        self._evict()
+
+    def load_bug_map(self, excel_path: str) -> Optional[Dict[Any, List[Any]]]:
+        """Return the cached bug -> test case IDs map of the file, or None."""
+        entry = self._entry(excel_path)
+        meta = self._read_pickle(entry, BUG_MAP_FILE)
+        if meta is None or meta.get("version") != StdCacheSettings.FORMAT_VERSION:
+            return None
+        self._touch(entry)
+        return meta["bug_map"]
+
+    def get_bug_map(self, excel_path: str) -> Optional[Dict[Any, List[Any]]]:
+        """
+        Return the bug -> test case IDs map of the file from the cache, or None if the file
+        has to be parsed. When only the table is cached (the violations run stores the table),
+        the map is built from it and stored.
+        """
+        bug_map = self.load_bug_map(excel_path)
+        if bug_map is None:
+            table = self.load_table(excel_path)
+            if table is not None:
+                bug_map = get_bug_to_tests_map(table)
+                self.save_bug_map(excel_path, bug_map)
+        return bug_map
+
+    def save_bug_map(self, excel_path: str, bug_map: Dict[Any, List[Any]]) -> None:
+        """Store the bug -> test case IDs map of the file."""
+        entry = self._entry(excel_path)
+        try:
+            os.makedirs(entry, exist_ok=True)
+            self._write_pickle(entry, BUG_MAP_FILE, {"version": StdCacheSettings.FORMAT_VERSION, "bug_map": bug_map})
+        except Exception as e:
+            logging.warning(f"Could not write the STD cache entry {entry}: {e}")
+            return
+        self._evict()
+
+    def _entry(self, excel_path: str) -> str:
+        return os.path.join(self.folder, self.key(excel_path))
+
+    @staticmethod
+    def _read_pickle(entry: str, name: str) -> Optional[Dict[str, Any]]:
+        path = os.path.join(entry, name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logging.warning(f"Could not read the STD cache entry {entry}: {e}")
+            return None
+
+    def _write_pickle(self, entry: str, name: str, data: Dict[str, Any]) -> None:
+        self._write(entry, name, lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def _write(entry: str, name: str, write) -> None:
+        """Write a file of the entry through a temporary file, so a reader never sees it half written."""
+        fd, temp_path = tempfile.mkstemp(dir=entry, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp_path, os.path.join(entry, name))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _touch(entry: str) -> None:
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        try:
+            entries = [os.path.join(self.folder, name) for name in os.listdir(self.folder)]
+            entries = sorted((e for e in entries if os.path.isdir(e)), key=os.path.getmtime, reverse=True)
+        except OSError:
+            return
+        for entry in entries[self.max_entries:]:
+            # A memory-mapped entry still in use cannot be removed on Windows; it goes next time
+            shutil.rmtree(entry, ignore_errors=True)
@@ -0,0 +1,477 @@
+"""
+STD Rules Module
+
+Registry of the STD validation rules. Each rule declares the columns it needs, the columns
+it can do without, and a predicate built from conditions on single cells (Cell), combined
+with & | ~. The same declaration is checked two ways:
+
+- row by row (CompiledRules.violations), for the streaming validation
+- as one boolean mask per rule over the whole sheet (CompiledRules.masks), where every cell
+  condition is evaluated once per distinct value of its column (see RuleColumn)
+
+Rules are compiled once against the resolved headers of a sheet: a rule whose needed
+columns are missing is skipped without touching any row.
+
+Adding a rule:
+    register_rule(StdRule(
+        "Rule9", "Comment filled AND Test Results = Pass",
+        Cell("comment", bool) & Cell("results", lambda v: text_lower(v) == STDConstants.PASS),
+        requires=("comment", "results"),
+    ))
+The column keys are the ones of COLUMN_MAP.
+"""
+
+import time
+import logging
+from abc import ABC, abstractmethod
+from functools import reduce
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.constants import ExcelRules, STDConstants, VALID_TEST_RESULTS
+
+
+def strip_value(value):
+    """Cell value as the rules see it (strings stripped)."""
+    return value.strip() if isinstance(value, str) else value
+
+
+def cell_text(value) -> str:
+    """str(value or '').strip(), the form most rules compare."""
+    return str(value or '').strip()
+
+
+def text_lower(value) -> str:
+    return cell_text(value).lower()
+
+
+def is_filled(value) -> bool:
+    return value is not None and str(value).strip() != ''
+
+
+def is_precondition_row(row, headers):
+    """Check if row is a precondition row (only id/headline/desc filled, rest empty)."""
+    possible_must_have = ExcelRules.POSSIBLE_MUST_HAVE_COLUMNS
+    must_have = [h for h in headers if h in possible_must_have]
+    other_cols = [h for h in headers if h not in must_have]
+
+    for col in must_have:
+        val = row.get(col)
+        if val is None or str(val).strip() == '':
+            return False
+
+    for col in other_cols:
+        val = row.get(col)
+        if val is not None and str(val).strip() != '':
+            return False
+
+    return True
+
+
+def is_precondition_expected_na(row, expected_col):
+    """True when Expected Result is N/A (precondition test - Results/Actual/Bug must be empty)."""
+    exp = row.get(expected_col)
+    exp_str = str(exp or "").strip().lower()
+    return exp_str == STDConstants.N_A
+
+
+def _last_index(headers, header):
+    """Index of a header; with duplicate headers the last one wins, like in a row dict."""
+    return len(headers) - 1 - headers[::-1].index(header)
+
+
+class RuleColumn:
+    """
+    One STD column as codes into its distinct values, for the rule masks.
+
+    Values are the ones a row dict sees (strings stripped; with duplicate headers the last
+    column wins). A condition on the column is evaluated once per distinct value and spread
+    back to the rows with the codes, so its cost does not grow with the sheet: STD columns
+    hold a handful of results and a few hundred bug numbers. The codes come from
+    StdTable.column_codes, which keeps 1, 1.0 and True apart, since str() tells them apart.
+    """
+
+    def __init__(self, table, header):
+        """
+        :param table: StdTable
+        :param header: Column header (None for a missing column: every value is None)
+        """
+        if header is None:
+            self.values = [None]  # code 0 is the empty cell
+            self.codes = np.zeros(len(table), dtype=np.int32)
+            return
+
+        self.codes, values = table.column_codes(_last_index(table.headers, header))
+        self.values = [strip_value(value) for value in values]
+
+    def mask(self, condition):
+        """Boolean array with condition(value) for every row."""
+        results = np.fromiter((bool(condition(value)) for value in self.values), dtype=bool, count=len(self.values))
+        return results[self.codes]
+
+
+def get_precondition_mask(table, rule_columns):
+    """
+    is_precondition_row for every row at once: the must-have columns are filled and every
+    other column is empty. Columns are checked one after another on the rows that can still
+    be preconditions, starting with the ones already loaded for the rules, so the other
+    columns are only read for a handful of rows.
+
+    :param table: StdTable
+    :param rule_columns: Header -> RuleColumn already built
+    """
+    possible_must_have = ExcelRules.POSSIBLE_MUST_HAVE_COLUMNS
+    candidates = np.arange(len(table))
+    for header in sorted(dict.fromkeys(table.headers), key=lambda h: h not in rule_columns):
+        if header in rule_columns:
+            filled = rule_columns[header].mask(is_filled)[candidates]
+        else:
+            index = _last_index(table.headers, header)
+            cells = table.cells(index, candidates.tolist())
+            filled = np.fromiter((is_filled(strip_value(value)) for value in cells),
+                                 dtype=bool, count=len(candidates))
+        candidates = candidates[filled if header in possible_must_have else ~filled]
+
+    mask = np.zeros(len(table), dtype=bool)
+    mask[candidates] = True
+    return mask
+
+
+# ============================================================================
+# Conditions
+# ============================================================================
+class Condition(ABC):
+    """Part of a rule predicate; combine with & (and), | (or) and ~ (not)."""
+
+    def keys(self) -> set:
+        """COLUMN_MAP keys the condition reads."""
+        return set()
+
+    @abstractmethod
+    def compile(self, context: "CompiledRules") -> Callable[[Dict[str, Any]], bool]:
+        """Function checking the condition on one row dict of the sheet the rules are compiled for."""
+
+    @abstractmethod
+    def mask(self, context: "_MaskContext") -> np.ndarray:
+        """The condition for every row of the sheet at once."""
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return AllOf(self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Condition":
+        return Not(self)
+
+
+class Cell(Condition):
+    """test(value) on the cell of one column; a missing (optional) column reads as None."""
+
+    def __init__(self, key: str, test: Callable[[Any], Any]):
+        """
+        :param key: COLUMN_MAP key of the column
+        :param test: Called with the stripped cell value; the result is used as a bool
+        """
+        self.key = key
+        self.test = test
+
+    def keys(self) -> set:
+        return {self.key}
+
+    def compile(self, context):
+        header, test = context.columns.get(self.key), self.test
+        # Cells repeat a handful of values, so each distinct value is tested once
+        results = {}
+
+        def check(row):
+            value = row.get(header)
+            key = (type(value), value)
+            result = results.get(key)
+            if result is None:
+                result = results[key] = bool(test(value))
+            return result
+        return check
+
+    def mask(self, context):
+        return context.column(self.key).mask(self.test)
+
+
+class AllOf(Condition):
+    def __init__(self, *conditions: Condition):
+        # a & b & c is one AllOf of three conditions, not two nested ones
+        self.conditions = tuple(part for c in conditions
+                                for part in (c.conditions if type(c) is type(self) else (c,)))
+
+    def keys(self):
+        return set().union(*(c.keys() for c in self.conditions))
+
+    def compile(self, context):
+        checks = [c.compile(context) for c in self.conditions]
+
+        def check(row):
+            for part in checks:
+                if not part(row):
+                    return False
+            return True
+        return check
+
+    def mask(self, context):
+        return reduce(np.logical_and, (c.mask(context) for c in self.conditions))
+
+
+class AnyOf(AllOf):
+    def compile(self, context):
+        checks = [c.compile(context) for c in self.conditions]
+
+        def check(row):
+            for part in checks:
+                if part(row):
+                    return True
+            return False
+        return check
+
+    def mask(self, context):
+        return reduce(np.logical_or, (c.mask(context) for c in self.conditions))
+
+
+class Not(Condition):
+    def __init__(self, condition: Condition):
+        self.condition = condition
+
+    def keys(self):
+        return self.condition.keys()
+
+    def compile(self, context):
+        part = self.condition.compile(context)
+        return lambda row: not part(row)
+
+    def mask(self, context):
+        return ~self.condition.mask(context)
+
+
+class PreconditionRow(Condition):
+    """The row is a precondition row (see is_precondition_row); reads every column."""
+
+    def compile(self, context):
+        headers = context.headers
+        return lambda row: is_precondition_row(row, headers)
+
+    def mask(self, context):
+        return context.precondition()
+
+
+PRECONDITION = PreconditionRow()
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+class StdRule:
+    """One STD rule: a predicate that is true for the rows breaking it."""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        predicate: Condition,
+        requires: Iterable[str],
+        optional: Iterable[str] = ()
+    ):
+        """
+        :param name: Rule key in the results (e.g. "Rule1")
+        :param description: Text shown in the violations report
+        :param predicate: Condition true for the violating rows
+        :param requires: COLUMN_MAP keys without which the rule is skipped
+        :param optional: COLUMN_MAP keys the rule reads when present (missing cells read as None)
+        """
+        self.name = name
+        self.description = description
+        self.predicate = predicate
+        self.requires = tuple(requires)
+        self.optional = tuple(optional)
+
+        undeclared = predicate.keys() - set(self.requires) - set(self.optional)
+        if undeclared:
+            raise ValueError(f"{name}: columns {sorted(undeclared)} are used but not declared")
+
+
+RULES: Dict[str, StdRule] = {}
+
+
+def register_rule(rule: StdRule) -> StdRule:
+    """Add a rule to the registry (a rule with the same name is replaced)."""
+    RULES[rule.name] = rule
+    return rule
+
+
+def get_rule_description(rule_name: str) -> str:
+    rule = RULES.get(rule_name)
+    return rule.description if rule else ExcelRules.RULE_NAMES.get(rule_name, str(rule_name))
+
+
+def _is_valid_fail(value) -> bool:
+    """Actual Results of a failed test: "N," followed by the reason."""
+    actual_val = cell_text(value)
+    after_comma = (actual_val.split(",", 1)[1].strip() if "," in actual_val else "").strip()
+    return actual_val.upper().startswith(STDConstants.ACTUAL_FAIL_PREFIX.upper()) and after_comma != ""
+
+
+def _results_in(*results: str) -> Condition:
+    return Cell("results", lambda v: text_lower(v) in results)
+
+
+RESULTS_EMPTY = Cell("results", lambda v: cell_text(v) == '')
+BUG_EMPTY = Cell("bug", lambda v: v is None or str(v).strip() == "")
+
+# Rule1: expected filled AND results empty; exclude precondition (Expected=N/A)
+register_rule(StdRule(
+    "Rule1", ExcelRules.RULE_NAMES["Rule1"],
+    Cell("expected", lambda v: v and text_lower(v) != STDConstants.N_A)
+    & (RESULTS_EMPTY | _results_in(STDConstants.NONE, STDConstants.NAN))
+    & ~_results_in(STDConstants.N_A, STDConstants.NOT_TESTED),
+    requires=("expected", "results"),
+))
+
+# Rule2: results filled AND expected empty, excluding precondition
+register_rule(StdRule(
+    "Rule2", ExcelRules.RULE_NAMES["Rule2"],
+    ~RESULTS_EMPTY & Cell("expected", lambda v: v in [None, '']) & ~PRECONDITION,
+    requires=("expected", "results"),
+))
+
+# Rule3: bug filled AND results = pass
+register_rule(StdRule(
+    "Rule3", ExcelRules.RULE_NAMES["Rule3"],
+    Cell("bug", bool) & _results_in(STDConstants.PASS),
+    requires=("bug", "results"),
+))
+
+# Rule4: bug empty AND results = fail
+register_rule(StdRule(
+    "Rule4", ExcelRules.RULE_NAMES["Rule4"],
+    BUG_EMPTY & _results_in(STDConstants.FAIL),
+    requires=("bug", "results"),
+))
+
+# Rule5: Actual Results vs Test Result (Pass=Y, Fail="N, reason", Not Tested/N/A=N/A)
+register_rule(StdRule(
+    "Rule5", ExcelRules.RULE_NAMES["Rule5"],
+    (_results_in(STDConstants.PASS)
+     & Cell("actual", lambda v: text_lower(v) != STDConstants.ACTUAL_PASS_VALUE.lower()))
+    | (_results_in(STDConstants.FAIL) & ~Cell("actual", _is_valid_fail))
+    | (_results_in(STDConstants.NOT_TESTED, STDConstants.N_A)
+       & Cell("actual", lambda v: text_lower(v) != STDConstants.N_A)),
+    requires=("results", "actual"),
+))
+
+# Rule6: Precondition (Expected=N/A) must have empty Results, Actual, Bug
+register_rule(StdRule(
+    "Rule6", ExcelRules.RULE_NAMES["Rule6"],
+    Cell("expected", lambda v: text_lower(v) == STDConstants.N_A)
+    & (~RESULTS_EMPTY | Cell("actual", lambda v: cell_text(v) != "") | ~BUG_EMPTY),
+    requires=("expected", "results", "bug"),
+    optional=("actual",),
+))
+
+# Rule7: Test Result = N/A must have a comment
+register_rule(StdRule(
+    "Rule7", ExcelRules.RULE_NAMES["Rule7"],
+    _results_in(STDConstants.N_A) & Cell("comment", lambda v: cell_text(v) == ""),
+    requires=("results", "comment"),
+))
+
+# Rule8: Test Results must be one of Pass, Fail, Not Tested, N/A (when not empty)
+register_rule(StdRule(
+    "Rule8", ExcelRules.RULE_NAMES["Rule8"],
+    ~RESULTS_EMPTY & ~Cell("results", lambda v: text_lower(v) in VALID_TEST_RESULTS),
+    requires=("results",),
+))
+
+
+# ============================================================================
+# Compiled rules
+# ============================================================================
+class _MaskContext:
+    """Columns and precondition mask of one table, built once and shared by every rule."""
+
+    def __init__(self, table, columns: Dict[str, Optional[str]]):
+        self.table = table
+        self.columns = columns
+        self._rule_columns: Dict[Optional[str], RuleColumn] = {}
+        self._precondition = None
+
+    def column(self, key: str) -> RuleColumn:
+        header = self.columns.get(key)
+        if header not in self._rule_columns:
+            self._rule_columns[header] = RuleColumn(self.table, header)
+        return self._rule_columns[header]
+
+    def precondition(self) -> np.ndarray:
+        if self._precondition is None:
+            loaded = {h: c for h, c in self._rule_columns.items() if h is not None}
+            self._precondition = get_precondition_mask(self.table, loaded)
+        return self._precondition
+
+
+class CompiledRules:
+    """The registry rules bound to the headers of one sheet."""
+
+    def __init__(self, headers: List[str], columns: Dict[str, Optional[str]], rules: Optional[Iterable[StdRule]] = None):
+        """
+        :param headers: Normalized headers of the sheet
+        :param columns: COLUMN_MAP key -> resolved header (None when the sheet has no such column)
+        :param rules: Rules to compile (defaults to the registry)
+        """
+        self.headers = headers
+        self.columns = columns
+        self.rule_names = []
+        self.active: List[StdRule] = []
+        for rule in (RULES.values() if rules is None else rules):
+            self.rule_names.append(rule.name)
+            missing = [key for key in rule.requires if not columns.get(key)]
+            if missing:
+                logging.info(f"{rule.name} skipped: no {', '.join(missing)} column")
+            else:
+                self.active.append(rule)
+        self._checks = [(rule.name, rule.predicate.compile(self)) for rule in self.active]
+
+    @classmethod
+    def for_table(cls, table, rules: Optional[Iterable[StdRule]] = None) -> "CompiledRules":
+        """Compile the rules against a StdTable, resolving every key they use through COLUMN_MAP."""
+        rules = list(RULES.values() if rules is None else rules)
+        keys = dict.fromkeys(key for rule in rules for key in rule.requires + rule.optional)
+        return cls(table.headers, {key: table.column(key, required=False) for key in keys}, rules)
+
+    def empty_results(self) -> Dict[str, list]:
+        """Rule name -> [] for every rule, skipped ones included (they never have violations)."""
+        return {name: [] for name in self.rule_names}
+
+    def violations(self, row: Dict[str, Any]) -> List[str]:
+        """Names of the rules broken by one row ({header: value} with stripped strings)."""
+        return [name for name, check in self._checks if check(row)]
+
+    def masks(self, table) -> Tuple[Dict[str, np.ndarray], Dict[str, float]]:
+        """
+        Evaluate every active rule as a boolean mask over all rows of the table.
+
+        :param table: StdTable with the headers the rules were compiled for
+        :return: (rule name -> mask, step -> seconds); the columns every rule needs are loaded
+                 first under "columns", so each rule's time is its own
+        """
+        context = _MaskContext(table, self.columns)
+        timings = {}
+
+        started = time.perf_counter()
+        for rule in self.active:
+            for key in rule.requires + rule.optional:
+                context.column(key)
+        timings["columns"] = time.perf_counter() - started
+
+        masks = {}
+        for rule in self.active:
+            started = time.perf_counter()
+            masks[rule.name] = rule.predicate.mask(context)
+            timings[rule.name] = time.perf_counter() - started
+        return masks, timings
@@ -0,0 +1,130 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+from typing import Any, Dict, List, Optional
+
+from utils.constants import APP_DATA_FOLDER_NAME, WorkItemCacheSettings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    organization_url TEXT NOT NULL,
+    bug_id TEXT NOT NULL,
+    rev INTEGER NOT NULL,
+    changed_date TEXT,
+    expected_test_ids TEXT NOT NULL,
+    validation_config TEXT NOT NULL,
+    record TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (organization_url, bug_id)
+)
+"""
+
+
+def get_default_cache_path() -> str:
+    """Return the cache database path inside the per-user AppData folder."""
+    appdata = os.getenv('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+    folder = os.path.join(appdata, APP_DATA_FOLDER_NAME)
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, WorkItemCacheSettings.FILE_NAME)
+
+
+def get_validation_config(config: Dict[str, Any]) -> str:
+    """
+    Return the config values a result record depends on, serialized so they can be compared.
+    A cached record is only reused while these are unchanged.
+    """
+    return json.dumps({
+        "current_version": config.get("current_version", ""),
+        "iteration_path": config.get("iteration_path", ""),
+        "std_name": config.get("std_name", ""),
+    }, sort_keys=True)
+
+
+class WorkItemCache:
+    """
+    SQLite cache of validated bugs.
+
+    Every entry holds the result record of one bug together with what it was validated
+    against: the work item revision and changed date, the expected test IDs from the
+    Excel file and the config values. An entry is reused only while all of them are
+    unchanged and it is younger than the TTL.
+    """
+
+    def __init__(self, organization_url: str, path: Optional[str] = None,
+                 ttl_hours: float = WorkItemCacheSettings.DEFAULT_TTL_HOURS):
+        """
+        :param organization_url: Organization or collection URL; work item IDs are only unique inside one
+        :param path: Database file (defaults to AppData/ste_tool_studio/work_item_cache.sqlite3)
+        :param ttl_hours: Maximum age of a reusable entry
+        """
+        self.organization_url = organization_url.rstrip("/")
+        self.path = path or get_default_cache_path()
+        self.ttl_seconds = ttl_hours * 3600
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(SCHEMA)
+        self._connection.commit()
+
+    def get(self, bug_id: str, rev: int, expected_test_ids: List[Any],
+            validation_config: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result record of a bug, or None if it has to be fetched again.
+
+        :param bug_id: Bug ID
+        :param rev: Current revision of the work item
+        :param expected_test_ids: Expected test IDs from the Excel file
+        :param validation_config: Value returned by get_validation_config
+        """
+        row = self._connection.execute(
+            "SELECT rev, expected_test_ids, validation_config, record, fetched_at FROM work_items "
+            "WHERE organization_url = ? AND bug_id = ?",
+            (self.organization_url, str(bug_id))
+        ).fetchone()
+        if row is None:
+            return None
+
+        cached_rev, cached_test_ids, cached_config, record, fetched_at = row
+        if (cached_rev != rev
+                or cached_test_ids != json.dumps([str(tid) for tid in expected_test_ids])
+                or cached_config != validation_config
+                or time.time() - fetched_at > self.ttl_seconds):
+            return None
+        return json.loads(record)
+
+    def put(self, bug_id: str, rev: int, changed_date: Optional[str], expected_test_ids: List[Any],
+            validation_config: str, record: Dict[str, Any]) -> None:
+        """
+        Store (or replace) the result record of a bug.
+
+        :param bug_id: Bug ID
+        :param rev: Revision of the work item the record was built from
+        :param changed_date: System.ChangedDate of that revision
+        :param expected_test_ids: Expected test IDs the record was validated against
+        :param validation_config: Value returned by get_validation_config
+        :param record: Result record (build_result_record format)
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO work_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.organization_url,
+                str(bug_id),
+                rev,
+                changed_date,
+                json.dumps([str(tid) for tid in expected_test_ids]),
+                validation_config,
+                json.dumps(record, ensure_ascii=False),
+                time.time(),
+            )
+        )
+        self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove every entry of this organization."""
+        self._connection.execute("DELETE FROM work_items WHERE organization_url = ?", (self.organization_url,))
+        self._connection.commit()
+        logging.info(f"Cleared work item cache for {self.organization_url}")
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,7 +1,14 @@
+import os
+import logging
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from openpyxl import load_workbook
 from collections import defaultdict
 
+from infra.xlsx_stream_reader import XlsxStreamReader
+from utils.constants import STDConstants
+
 
 def normalize_columns_pandas(df):
     """Normalize column names: lowercase + replace spaces with underscores."""
@@ -24,42 +31,167 @@ def get_column_pandas(df, key, required=True):
     return None
 
 
-def get_bug_to_tests_map(excel_path):
+def get_bug_to_tests_map(excel_path, cache=None):
     """
     Map bug IDs to test case IDs from an STD Excel.
     Handles multiple bug IDs in one cell.
+
+    :param excel_path: STD Excel path, or a StdTable already loaded with load_std_table
+    :param cache: StdCache; the map (or else the table) is taken from it when the file is unchanged
+    """
+    use_cache = cache is not None and not isinstance(excel_path, StdTable)
+    if use_cache:
+        bug_map = cache.load_bug_map(excel_path)
+        if bug_map is not None:
+            return bug_map
+
+    table = as_std_table(excel_path, cache)
+    bug_col = table.column("bug")
+    if "id" not in table.headers:
+        raise ValueError("No ID column found. Make sure your file has an ID column.")
+    bug_map = bugs_to_tests_map(table.values(bug_col), table.values(table.column("id")))
+    if use_cache:
+        cache.save_bug_map(excel_path, bug_map)
+    return bug_map
+
+
+def get_bug_to_tests_map_from_df(df):
+    """
+    Map bug IDs to test case IDs from the STD sheet loaded as a DataFrame (see bugs_to_tests_map).
     """
-    df = pd.read_excel(excel_path)
     df = normalize_columns_pandas(df)
 
     bug_col = get_column_pandas(df, "bug")
     id_col = get_column_pandas(df, "id") if "id" in df.columns else None
     if id_col is None:
         raise ValueError("No ID column found. Make sure your file has an ID column.")
+    return bugs_to_tests_map(df[bug_col], df[id_col])
+
+
+def bugs_to_tests_map(bugs, test_ids):
+    """
+    Map bug IDs to test case IDs with vectorized string operations (no per-row Python loop).
+    Bugs are in order of first appearance; test IDs in row order, once per mention of the bug.
+    Cells that pandas reads as empty ("N/A", "None", ...) have no bug, see split_bug_ids.
+
+    :param bugs: Bug column (pandas Series)
+    :param test_ids: ID column, with the same index as bugs
+    """
+    if pd.api.types.is_numeric_dtype(bugs) or pd.api.types.is_bool_dtype(bugs):
+        has_bug = bugs.notna()
+    elif bugs.dtype == object:
+        # Only numbers and text are bug numbers (not dates or other cell types)
+        has_bug = (bugs.notna() & bugs.map(type).isin((int, float, str, bool))
+                   & ~bugs.isin(STDConstants.NA_CELL_VALUES))
+    else:
+        has_bug = pd.Series(False, index=bugs.index)
+
+    bug_ids = bugs[has_bug].astype(str).str.split(",").explode().str.strip()
+    bug_ids = bug_ids[bug_ids != ""]
 
-    with_bugs = df[df[bug_col].apply(lambda x: isinstance(x, (int, float, str)) and not pd.isna(x))]
+    # Normalize float-y values like '1234.0' → '1234'
+    float_like = bug_ids.str.endswith(".0") & bug_ids.str.replace(".", "", n=1, regex=False).str.isdigit()
+    bug_ids = bug_ids.mask(float_like, bug_ids.str[:-2])
 
-    bug_to_tests = defaultdict(list)
-    for _, row in with_bugs.iterrows():
-        raw_bug_val = str(row[bug_col])
-        test_id = row[id_col]
+    # explode keeps the row index, so the test ID of every mention is a plain index lookup
+    mentions = pd.DataFrame({"bug": bug_ids.to_numpy(), "test": test_ids.loc[bug_ids.index].to_numpy()})
+    return mentions.groupby("bug", sort=False)["test"].agg(list).to_dict()
 
-        bug_ids = [bug.strip() for bug in str(raw_bug_val).split(",") if bug.strip()]
 
-        for bug_id_str in bug_ids:
-            # Ensure we normalize float-y values like '1234.0' → '1234'
-            if bug_id_str.replace(".", "", 1).isdigit():
-                if bug_id_str.endswith(".0"):
-                    bug_id_str = bug_id_str[:-2]
-            bug_to_tests[bug_id_str].append(test_id)
+def split_bug_ids(raw_bug_val):
+    """
+    Return the bug IDs written in one bug cell (comma separated).
+    Float-y values like '1234.0' are normalized to '1234'. A cell that pandas.read_excel
+    reads as empty (STDConstants.NA_CELL_VALUES, e.g. "N/A" or "None") has no bug IDs.
+    """
+    if isinstance(raw_bug_val, str) and raw_bug_val in STDConstants.NA_CELL_VALUES:
+        return []
+    bug_ids = []
+    for bug_id_str in str(raw_bug_val).split(","):
+        bug_id_str = bug_id_str.strip()
+        if not bug_id_str:
+            continue
+        # Ensure we normalize float-y values like '1234.0' → '1234'
+        if bug_id_str.replace(".", "", 1).isdigit():
+            if bug_id_str.endswith(".0"):
+                bug_id_str = bug_id_str[:-2]
+        bug_ids.append(bug_id_str)
+    return bug_ids
+
+
+class BugMapStream:
+    """
+    The bug -> test case IDs map of an STD Excel (see get_bug_to_tests_map), produced while
+    the sheet is being read.
 
-    return dict(bug_to_tests)
+    Iterating yields (bug_id, test_ids) as soon as the last row of that bug has been read, so
+    work on the first bugs starts while the rest of the sheet is still being read. A bug's rows
+    do not have to be grouped: creating the stream runs a fast first pass over the bug column
+    only, which finds the last row of every bug and the number of bugs (total).
+
+    Test IDs keep their cell type, like in get_bug_to_tests_map.
+    """
+
+    def __init__(self, excel_path):
+        """
+        :param excel_path: STD .xlsx file (first worksheet, header in the first row)
+        """
+        self.excel_path = excel_path
+        self._reader = XlsxStreamReader(excel_path)
+
+        rows = self._reader.iter_rows()
+        try:
+            self._header_row, header_values = next(rows, (0, {}))
+        finally:
+            rows.close()
+        headers = normalize_columns([header_values.get(i) for i in range(max(header_values, default=-1) + 1)])
+
+        bug_col = get_column(headers, "bug")
+        if "id" not in headers:
+            raise ValueError("No ID column found. Make sure your file has an ID column.")
+        self._bug_col = headers.index(bug_col)
+        self._id_col = headers.index(get_column(headers, "id"))
+
+        # First pass: the row after which each bug's test ID list is complete
+        self._last_rows = {}
+        for row_number, values in self._reader.iter_rows({self._bug_col}):
+            if row_number > self._header_row:
+                for bug_id_str in self._bug_ids(values):
+                    self._last_rows[bug_id_str] = row_number
+        self.total = len(self._last_rows)
+
+    def __len__(self):
+        return self.total
+
+    @property
+    def bug_ids(self):
+        """Bug IDs in order of first appearance, the order of get_bug_to_tests_map (not the order they are yielded in)."""
+        return list(self._last_rows)
+
+    def _bug_ids(self, values):
+        raw_bug_val = values.get(self._bug_col)
+        if not isinstance(raw_bug_val, (int, float, str)) or pd.isna(raw_bug_val):
+            return []
+        return split_bug_ids(raw_bug_val)
+
+    def __iter__(self):
+        pending = defaultdict(list)
+        for row_number, values in self._reader.iter_rows({self._bug_col, self._id_col}):
+            if row_number <= self._header_row:
+                continue
+            bug_ids = self._bug_ids(values)
+            for bug_id_str in bug_ids:
+                pending[bug_id_str].append(values.get(self._id_col))
+            for bug_id_str in dict.fromkeys(bug_ids):
+                if self._last_rows[bug_id_str] == row_number:
+                    yield bug_id_str, pending.pop(bug_id_str)
 
 
 from openpyxl import load_workbook
 from collections import defaultdict
 
-from utils.constants import COLUMN_MAP, STDConstants, ExcelRules, VALID_TEST_RESULTS
+from infra.std_rules import CompiledRules
+from utils.constants import COLUMN_MAP
 
 
 def normalize_columns(cols):
@@ -86,138 +218,216 @@ def _raise_missing(key):
     raise ValueError(f"Missing required column for key '{key}'")
 
 
-def is_precondition_row(row, headers):
-    """Check if row is a precondition row (only id/headline/desc filled, rest empty)."""
-    possible_must_have = ExcelRules.POSSIBLE_MUST_HAVE_COLUMNS
-    must_have = [h for h in headers if h in possible_must_have]
-    other_cols = [h for h in headers if h not in must_have]
-
-    for col in must_have:
-        val = row.get(col)
-        if val is None or str(val).strip() == '':
-            return False
-
-    for col in other_cols:
-        val = row.get(col)
-        if val is not None and str(val).strip() != '':
-            return False
-
-    return True
-
-
-def is_precondition_expected_na(row, expected_col):
-    """True when Expected Result is N/A (precondition test - Results/Actual/Bug must be empty)."""
-    exp = row.get(expected_col)
-    exp_str = str(exp or "").strip().lower()
-    return exp_str == STDConstants.N_A
-
-
-def validate_and_summarize(file_path):
-    """Validate STD rules using openpyxl."""
-    wb = load_workbook(filename=file_path, data_only=True)
-    ws = wb.active
-
-    headers = normalize_columns([cell.value for cell in ws[1]])
-    expected_col = get_column(headers, "expected")
-    results_col = get_column(headers, "results")
-    bug_col = get_column(headers, "bug")
-    comment_col = get_column(headers, "comment", required=False)
-    id_col = get_column(headers, "id")
-    actual_col = get_column(headers, "actual", required=False)
-
-    data = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        row_dict = dict(zip(headers, row))
-        # Strip strings
-        for k, v in row_dict.items():
-            if isinstance(v, str):
-                row_dict[k] = v.strip()
-        data.append(row_dict)
-
-    # Masks for rules
-    rule1_rows = []
-    rule2_rows = []
-    rule3_rows = []
-    rule4_rows = []
-    rule5_rows = []
-    rule6_rows = []
-    rule7_rows = []
-    rule8_rows = []
-
-    for row in data:
-        res = str(row.get(results_col) or '').strip()
-        res_lower = res.lower()
-        exp = row.get(expected_col)
-        exp_lower = str(exp or "").strip().lower()
-        bug = row.get(bug_col)
-        bug_empty = bug is None or str(bug).strip() == ""
-
-        # Rule1: expected filled AND results empty; exclude precondition (Expected=N/A)
-        if (exp and exp_lower != STDConstants.N_A and
-                (res == '' or res_lower in [STDConstants.NONE, STDConstants.NAN]) and
-                res_lower not in [STDConstants.N_A, STDConstants.NOT_TESTED]):
-            rule1_rows.append(row)
-
-        # Rule2: results filled AND expected empty, excluding precondition
-        if (res != '' and exp in [None, '']) and not is_precondition_row(row, headers):
-            rule2_rows.append(row)
-
-        # Rule3: bug filled AND results = pass
-        if bug and res_lower == STDConstants.PASS:
-            rule3_rows.append(row)
-
-        # Rule4: bug empty AND results = fail
-        if bug_empty and res_lower == STDConstants.FAIL:
-            rule4_rows.append(row)
-
-        # Rule5: Actual Results vs Test Result (only when Actual column exists)
-        if actual_col:
-            actual_val = str(row.get(actual_col) or '').strip()
-            actual_lower = actual_val.lower()
-            test_result_val = res_lower
-
-            if test_result_val == STDConstants.PASS:
-                if actual_lower != STDConstants.ACTUAL_PASS_VALUE.lower():
-                    rule5_rows.append(row)
-            elif test_result_val == STDConstants.FAIL:
-                if not actual_val.upper().startswith(STDConstants.ACTUAL_FAIL_PREFIX.upper()):
-                    rule5_rows.append(row)
-                else:
-                    after_comma = (actual_val.split(",", 1)[1].strip() if "," in actual_val else "").strip()
-                    if not after_comma:
-                        rule5_rows.append(row)
-            elif test_result_val == STDConstants.NOT_TESTED or test_result_val == STDConstants.N_A:
-                if actual_lower != STDConstants.N_A:
-                    rule5_rows.append(row)
-
-        # Rule6: Precondition (Expected=N/A) must have empty Results, Actual, Bug
-        if is_precondition_expected_na(row, expected_col):
-            has_results = res != ""
-            has_actual = actual_col and str(row.get(actual_col) or "").strip() != ""
-            if has_results or has_actual or not bug_empty:
-                rule6_rows.append(row)
-
-        # Rule7: Test Result = N/A must have a comment (when Comment column exists)
-        if comment_col and res_lower == STDConstants.N_A:
-            comment_val = str(row.get(comment_col) or "").strip()
-            if not comment_val:
-                rule7_rows.append(row)
-
-        # Rule8: Test Results must be one of Pass, Fail, Not Tested, N/A (when not empty)
-        if res != "" and res_lower not in VALID_TEST_RESULTS:
-            rule8_rows.append(row)
-
-    rules = {
-        "Rule1": rule1_rows,
-        "Rule2": rule2_rows,
-        "Rule3": rule3_rows,
-        "Rule4": rule4_rows,
-        "Rule5": rule5_rows if actual_col else [],
-        "Rule6": rule6_rows,
-        "Rule7": rule7_rows if comment_col else [],
-        "Rule8": rule8_rows,
+class StdTable:
+    """
+    The first worksheet of an STD workbook, read once and shared by get_bug_to_tests_map and
+    validate_and_summarize. Headers are normalized with normalize_columns, every row has one
+    value per header (cell values as openpyxl returns them with data_only=True), and the
+    COLUMN_MAP columns are resolved once, the first time they are asked for.
+
+    A table loaded from the STD cache (infra/std_cache.py) holds its columns encoded (see
+    encode_column) instead of rows; rows are then only built when they are read.
+    """
+
+    def __init__(self, headers, rows=None, columns=None):
+        """
+        :param headers: Normalized header names
+        :param rows: Data rows (tuples, one value per header)
+        :param columns: Instead of rows, one (codes, values) pair per header as returned by encode_column
+        """
+        self.headers = headers
+        self._rows = rows if columns is None else None
+        self._encoded = columns
+        self._columns = {}
+
+    @property
+    def rows(self):
+        if self._rows is None:
+            self._rows = list(zip(*(self._column_values(index).tolist() for index in range(len(self.headers)))))
+        return self._rows
+
+    def __len__(self):
+        if self._encoded is not None:
+            return len(self._encoded[0][0]) if self._encoded else 0
+        return len(self._rows)
+
+    def column(self, key, required=True):
+        """Header matching key in COLUMN_MAP (see get_column). If required=False, returns None when missing."""
+        if key not in self._columns:
+            self._columns[key] = get_column(self.headers, key, required=False)
+        if self._columns[key] is None and required:
+            _raise_missing(key)
+        return self._columns[key]
+
+    def column_codes(self, index):
+        """Column at index encoded as (codes, values), see encode_column."""
+        if self._encoded is not None:
+            return self._encoded[index]
+        return encode_column([row[index] for row in self._rows])
+
+    def rows_at(self, row_indexes):
+        """Data rows at the given indexes, as tuples."""
+        if self._rows is None:
+            return list(zip(*(self.cells(index, row_indexes) for index in range(len(self.headers)))))
+        return [self._rows[row_index] for row_index in row_indexes]
+
+    def cells(self, index, row_indexes):
+        """Values of the column at index in the given rows."""
+        if self._rows is None:
+            codes, values = self._encoded[index]
+            return _object_array(values)[codes[row_indexes]].tolist()
+        return [self._rows[row_index][index] for row_index in row_indexes]
+
+    def values(self, header):
+        """Values of one column as an object Series (cell types are kept)."""
+        return pd.Series(self._column_values(self.headers.index(header)), dtype=object)
+
+    def _column_values(self, index):
+        if self._encoded is None:
+            return _object_array([row[index] for row in self._rows])
+        codes, values = self._encoded[index]
+        return _object_array(values)[codes]
+
+    def row_dicts(self):
+        """Rows as {header: value} dictionaries."""
+        for row in self.rows:
+            yield dict(zip(self.headers, row))
+
+
+def _object_array(values):
+    """1-D object array of values (np.array would turn tuples or equal-length lists into more dimensions)."""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def encode_column(values):
+    """
+    Encode the values of one column as codes into its distinct values.
+    Code 0 is the empty cell (None). Values are kept exactly, cell type included: 1, 1.0
+    and True get different codes, and so do strings that only differ by spaces.
+
+    :param values: Cell values of the column
+    :return: (int32 array with one code per row, list of distinct values)
+    """
+    raw = _object_array(values)
+    # None and NaN get -1; 1, 1.0 and True share a code, so other cell types are keyed again below
+    codes, uniques = pd.factorize(raw)
+    is_str = np.array([type(value) is str for value in uniques], dtype=bool)
+    remap = np.zeros(len(uniques) + 1, dtype=np.int32)
+    remap[1:][is_str] = np.arange(1, int(is_str.sum()) + 1)
+    distinct = [None] + uniques[is_str].tolist()
+    encoded = remap[codes + 1]
+
+    missing = np.flatnonzero(codes == -1)
+    other_rows = np.concatenate([
+        missing[raw[missing] != None],  # noqa: E711 (elementwise comparison)
+        np.flatnonzero(np.isin(codes, np.flatnonzero(~is_str))),
+    ])
+    keys = {}
+    for row_index, value in zip(other_rows.tolist(), raw[other_rows]):
+        # repr keeps apart what == merges across types and signs (True/1, 0.0/-0.0)
+        key = (type(value), repr(value))
+        if key not in keys:
+            keys[key] = len(distinct)
+            distinct.append(value)
+        encoded[row_index] = keys[key]
+    return encoded, distinct
+
+
+def load_std_table(excel_path, cache=None):
+    """
+    Read the first worksheet of an STD Excel into a StdTable.
+    The last table loaded is kept in memory, so reading the same unchanged file again
+    (bug map then validation) does not parse it a second time.
+
+    :param excel_path: STD Excel path
+    :param cache: StdCache; the table is taken from it when the file is unchanged, and
+                  stored in it after the file is parsed
+    """
+    if cache is not None:
+        table = cache.load_table(excel_path)
+        if table is not None:
+            return table
+    stat = os.stat(excel_path)
+    table = _load_std_table(os.path.abspath(excel_path), stat.st_size, stat.st_mtime_ns)
+    if cache is not None:
+        cache.save_table(excel_path, table)
+    return table
+
+
+@lru_cache(maxsize=1)
+def _load_std_table(path, size, mtime_ns):
+    wb = load_workbook(filename=path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        headers = normalize_columns(next(rows, ()))
+        width = len(headers)
+        # Read-only rows end at the last cell written, so short rows are padded
+        data = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+    finally:
+        wb.close()
+    return StdTable(headers, data)
+
+
+def as_std_table(source, cache=None):
+    """Return source if it is already a StdTable, else load the STD Excel it points to (see load_std_table)."""
+    return source if isinstance(source, StdTable) else load_std_table(source, cache)
+
+
+def get_rule_columns(table):
+    """
+    Main STD columns (comment and actual are None when the sheet has no such column).
+    A sheet without the ID, expected, results or bug column is not an STD: ValueError is raised.
+    """
+    return {
+        "expected": table.column("expected"),
+        "results": table.column("results"),
+        "bug": table.column("bug"),
+        "comment": table.column("comment", required=False),
+        "id": table.column("id"),
+        "actual": table.column("actual", required=False),
     }
 
+
+def strip_row(row_dict):
+    """Strip string values of a {header: value} row in place and return it."""
+    for k, v in row_dict.items():
+        if isinstance(v, str):
+            row_dict[k] = v.strip()
+    return row_dict
+
+
+def validate_and_summarize(file_path, streaming=False, cache=None):
+    """
+    Validate the STD rules of the rule registry (infra/std_rules.py) on the rows of the STD Excel.
+
+    :param file_path: STD Excel path, or a StdTable already loaded with load_std_table
+    :param streaming: Evaluate the rules while the sheet streams past (see validate_streaming);
+                      violations are then compact records instead of full rows
+    :param cache: StdCache used to load the table (see load_std_table); not used when streaming
+    :return: Rule name -> violating rows
+    """
+    if streaming and not isinstance(file_path, StdTable):
+        rules, id_col = validate_streaming(file_path)
+    else:
+        table = as_std_table(file_path, cache)
+        id_col = get_rule_columns(table)["id"]
+        compiled = CompiledRules.for_table(table)
+
+        masks, timings = compiled.masks(table)
+        logging.info("Rule timings: " + ", ".join(f"{step} {seconds * 1000:.1f} ms" for step, seconds in timings.items()))
+
+        # Row dicts are only built for the rows that break a rule, once per row
+        violating = np.flatnonzero(np.logical_or.reduce(list(masks.values()))).tolist() if masks else []
+        row_dicts = {
+            index: strip_row(dict(zip(table.headers, row)))
+            for index, row in zip(violating, table.rows_at(violating))
+        }
+        rules = compiled.empty_results()
+        for rule_name, mask in masks.items():
+            rules[rule_name] = [row_dicts[index] for index in np.flatnonzero(mask).tolist()]
+
     # Print summary
     for rule_name, rows in rules.items():
         if not rows:
@@ -229,3 +439,35 @@ def validate_and_summarize(file_path):
         print("-" * 40)
 
     return rules
+
+
+def validate_streaming(file_path):
+    """
+    Evaluate the STD rules row by row from a read-only openpyxl pass over the first worksheet.
+    Memory stays flat whatever the sheet size: no row is kept, only a compact record per
+    violation with the row number, the test ID (under the ID column name) and the headline.
+
+    :param file_path: STD Excel path
+    :return: (rule name -> violation records, ID column name)
+    """
+    wb = load_workbook(filename=file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        headers = normalize_columns(next(rows, ()))
+        header_table = StdTable(headers, [])
+        id_col = get_rule_columns(header_table)["id"]
+        compiled = CompiledRules.for_table(header_table)
+
+        rules = compiled.empty_results()
+        # Read-only iteration yields empty rows for the gaps, so rows can be counted
+        for row_number, row in enumerate(rows, start=2):
+            row_dict = strip_row(dict(zip(headers, row)))
+            for rule_name in compiled.violations(row_dict):
+                rules[rule_name].append({
+                    "row": row_number,
+                    id_col: row_dict.get(id_col),
+                    "headline": row_dict.get("headline", ""),
+                })
+    finally:
+        wb.close()
+    return rules, id_col
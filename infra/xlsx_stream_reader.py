@@ -0,0 +1,186 @@
+import zipfile
+import posixpath
+from xml.etree.ElementTree import iterparse
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH, CALENDAR_MAC_1904
+
+DIGITS = "0123456789"
+RELATIONSHIP_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+def _local_name(tag: str) -> str:
+    """Tag without its namespace (transitional and strict files use different ones)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def column_index(letters: str) -> int:
+    """Convert column letters to a 0-based index ("A" -> 0, "AB" -> 27)."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+def _number(text: str):
+    """Convert a numeric cell value the way openpyxl does: int unless it has a fraction or exponent."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+class XlsxStreamReader:
+    """
+    Minimal streaming reader of the first worksheet of an .xlsx file.
+
+    Rows are parsed straight from the worksheet XML with iterparse and only the cells of the
+    requested columns are converted, which makes a pass over one or two columns several times
+    faster than openpyxl. Values are returned like openpyxl's values_only: str, int, float,
+    bool, datetime or None. Only the number formats of the cell styles are read, to convert
+    date-formatted numbers and ISO date cells (t="d") the way openpyxl does.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: .xlsx file
+        """
+        self.path = path
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Set[int] = set()
+        self._timedelta_styles: Set[int] = set()
+        self._epoch = WINDOWS_EPOCH
+        with zipfile.ZipFile(path) as archive:
+            self._sheet_path, parts = self._find_parts(archive)
+            self._shared_strings_path = parts.get("sharedStrings")
+            if parts.get("styles") in archive.namelist():
+                self._load_date_styles(archive, parts["styles"])
+
+    def _find_parts(self, archive: zipfile.ZipFile) -> Tuple[str, Dict[str, str]]:
+        """
+        Return the path of the first worksheet and the paths of the shared strings table and
+        of the styles (by relationship type). Also reads the date system of the workbook.
+        """
+        targets, parts = {}, {}
+        for _, element in iterparse(archive.open("xl/_rels/workbook.xml.rels")):
+            if _local_name(element.tag) == "Relationship":
+                target = element.get("Target", "")
+                target = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+                targets[element.get("Id")] = target
+                parts[element.get("Type", "").rsplit("/", 1)[-1]] = target
+
+        for _, element in iterparse(archive.open("xl/workbook.xml")):
+            tag = _local_name(element.tag)
+            if tag == "workbookPr" and element.get("date1904", "").lower() in ("1", "true"):
+                self._epoch = CALENDAR_MAC_1904
+            elif tag == "sheet":
+                return targets[element.get(RELATIONSHIP_ID)], parts
+        raise ValueError("The workbook has no worksheet")
+
+    def _load_date_styles(self, archive: zipfile.ZipFile, styles_path: str) -> None:
+        """Index the cell styles (cellXfs) whose number format is a date or a duration, like openpyxl."""
+        custom_formats: Dict[int, str] = {}
+        style_index = 0
+        in_cell_xfs = False
+        for event, element in iterparse(archive.open(styles_path), events=("start", "end")):
+            tag = _local_name(element.tag)
+            if event == "start":
+                in_cell_xfs = in_cell_xfs or tag == "cellXfs"
+                continue
+            if tag == "numFmt":
+                custom_formats[int(element.get("numFmtId"))] = element.get("formatCode", "")
+            elif tag == "xf" and in_cell_xfs:
+                format_id = int(element.get("numFmtId", 0))
+                number_format = custom_formats.get(format_id) or builtin_format_code(format_id)
+                if number_format and is_date_format(number_format):
+                    self._date_styles.add(style_index)
+                if number_format and is_timedelta_format(number_format):
+                    self._timedelta_styles.add(style_index)
+                style_index += 1
+            elif tag == "cellXfs":
+                in_cell_xfs = False
+
+    def _load_shared_strings(self, archive: zipfile.ZipFile) -> List[str]:
+        strings = []
+        if self._shared_strings_path and self._shared_strings_path in archive.namelist():
+            for _, element in iterparse(archive.open(self._shared_strings_path)):
+                if _local_name(element.tag) == "si":
+                    # Rich text is split in runs; phonetic hints (rPh) are not part of the value
+                    strings.append("".join(
+                        text.text or "" for text in element.iter()
+                        if _local_name(text.tag) == "t" and not _is_phonetic(element, text)
+                    ))
+                    element.clear()
+        return strings
+
+    def iter_rows(self, columns: Optional[Set[int]] = None) -> Iterator[Tuple[int, Dict[int, Any]]]:
+        """
+        Yield every non-empty row of the worksheet.
+
+        :param columns: 0-based indexes of the columns to read (all columns when None)
+        :return: Generator of (1-based row number, {column index: value}); empty cells are left out
+        """
+        with zipfile.ZipFile(self.path) as archive:
+            if self._shared_strings is None:
+                self._shared_strings = self._load_shared_strings(archive)
+
+            row_number = 0
+            values: Dict[int, Any] = {}
+            next_column = 0
+            for _, element in iterparse(archive.open(self._sheet_path)):
+                tag = _local_name(element.tag)
+                if tag == "c":
+                    reference = element.get("r")
+                    column = column_index(reference.rstrip(DIGITS)) if reference else next_column
+                    next_column = column + 1
+                    if columns is None or column in columns:
+                        value = self._cell_value(element)
+                        if value is not None:
+                            values[column] = value
+                elif tag == "row":
+                    row_number = int(element.get("r") or row_number + 1)
+                    element.clear()
+                    if values:
+                        yield row_number, values
+                        values = {}
+                    next_column = 0
+
+    def _cell_value(self, cell) -> Any:
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            # Empty strings are read as empty cells, like openpyxl does
+            return "".join(text.text or "" for text in cell.iter() if _local_name(text.tag) == "t") or None
+
+        raw = None
+        for child in cell:
+            if _local_name(child.tag) == "v":
+                raw = child.text
+                break
+        if raw is None:
+            return None
+        if cell_type == "s":
+            return self._shared_strings[int(raw)] or None
+        if cell_type == "b":
+            return raw == "1"
+        if cell_type in ("str", "e"):
+            return raw or None
+        if cell_type == "d":
+            return from_ISO8601(raw)
+
+        value = _number(raw)
+        style = int(cell.get("s", 0))
+        if style in self._date_styles:
+            try:
+                return from_excel(value, self._epoch, timedelta=style in self._timedelta_styles)
+            except (OverflowError, ValueError):
+                # openpyxl treats a date cell out of the date range as an error cell
+                return "#VALUE!"
+        return value
+
+
+def _is_phonetic(string_item, text) -> bool:
+    """True if the text element belongs to a phonetic run (rPh) of the shared string item."""
+    for child in string_item:
+        if _local_name(child.tag) == "rPh" and any(t is text for t in child.iter()):
+            return True
+    return False
@@ -0,0 +1,176 @@
+"""
+Async REST Fetcher Module
+
+This module fetches work items from the Azure DevOps REST API one request per bug, many at
+once from an asyncio event loop, bounded by a semaphore. Throttled (429) and failed (5xx)
+requests are retried with jittered backoff that honors Retry-After. Every bug is validated
+as soon as its response arrives, so fetching and validation overlap.
+
+The HTTP calls go through the pooled keep-alive requests session of AdoRestClient and run
+in worker threads (asyncio.to_thread), so no extra HTTP library is needed.
+"""
+
+import queue
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterator, Callable
+
+from infra.ado_rest_client import AdoRestClient, get_retry_delay, get_field_reference_names
+from logic.parallel_item_processor import ItemTask, build_error_record
+from logic.rest_item_processor import field_values_from_rest, build_not_found_record
+from utils.std_id_validator import build_record_from_field_values
+from utils.constants import RestApi, ProgressMessages
+
+
+async def fetch_work_item_fields(
+    client: AdoRestClient,
+    work_item_id: int,
+    fields: List[str],
+    semaphore: asyncio.Semaphore,
+    max_retries: int = RestApi.MAX_RETRIES
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the fields of one work item, retrying 429/5xx responses.
+
+    :param client: REST client whose session is used for the request
+    :param work_item_id: Work item ID
+    :param fields: Field reference names to return
+    :param semaphore: Limits how many requests are in flight at once
+    :param max_retries: Retries before the last error is raised
+    :return: Field reference name -> value, or None if the work item does not exist
+    """
+    for attempt in range(max_retries + 1):
+        async with semaphore:
+            response = await asyncio.to_thread(client.get_work_item_response, work_item_id, fields)
+
+        if response.status_code == 404:
+            return None
+        if response.status_code in RestApi.RETRY_STATUS_CODES and attempt < max_retries:
+            # The wait happens outside the semaphore so other requests can use the slot
+            delay = get_retry_delay(response, attempt)
+            logging.warning(f"Work item {work_item_id}: HTTP {response.status_code}, "
+                            f"retry {attempt + 1}/{max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response.json().get("fields", {})
+
+
+async def validate_items_async(
+    item_tasks: List[ItemTask],
+    config: Dict[str, Any],
+    client: AdoRestClient,
+    on_result: Callable[[Dict[str, Any]], None],
+    concurrency: int = RestApi.ASYNC_CONCURRENCY
+) -> None:
+    """
+    Fetch and validate every task concurrently; on_result is called with each record as soon as it is ready.
+
+    :param item_tasks: List of ItemTask objects (only bug_id and test_ids are used)
+    :param config: Configuration dictionary
+    :param client: REST client
+    :param on_result: Callback receiving each result record
+    :param concurrency: Maximum number of requests in flight
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    reference_names = get_field_reference_names(config)
+    fields = list(reference_names.values())
+
+    async def validate(task: ItemTask) -> None:
+        bug_id_str = str(task.bug_id).strip()
+        try:
+            if not bug_id_str.isdigit():
+                # Reported as "Invalid bug number", like the browser flow
+                result = build_record_from_field_values(bug_id_str, task.test_ids, {}, config)
+            else:
+                rest_fields = await fetch_work_item_fields(client, int(bug_id_str), fields, semaphore)
+                if rest_fields is None:
+                    result = build_not_found_record(task)
+                else:
+                    values = field_values_from_rest(rest_fields, reference_names)
+                    result = build_record_from_field_values(bug_id_str, task.test_ids, values, config)
+        except Exception as e:
+            logging.error(f"Error processing item {task.bug_id} through the REST API: {e}")
+            result = build_error_record(task, e)
+        on_result(result)
+
+    await asyncio.gather(*(validate(task) for task in item_tasks))
+
+
+def iter_items_async_rest(
+    item_tasks: List[ItemTask],
+    config: Dict[str, Any],
+    client: Optional[AdoRestClient] = None,
+    concurrency: Optional[int] = None,
+    report_progress: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run validate_items_async on a background event loop and yield records in completion order.
+    A "PROGRESS: i/N" line is printed for every record.
+
+    :param item_tasks: List of ItemTask objects (only bug_id and test_ids are used)
+    :param config: Configuration dictionary
+    :param client: Optional client; by default one is built from config with a pool sized to the concurrency
+    :param concurrency: Requests in flight (defaults to config "rest_concurrency")
+    :param report_progress: Print a progress line to stdout for every record
+    :return: Generator of result dictionaries
+    """
+    if not item_tasks:
+        return
+
+    concurrency = concurrency or config.get("rest_concurrency", RestApi.ASYNC_CONCURRENCY)
+    own_client = client is None
+    if own_client:
+        # Retries are handled here with jitter, so the session itself must not retry
+        client = AdoRestClient.from_config(config, pool_size=concurrency, max_retries=0)
+
+    total = len(item_tasks)
+    # Records, then None once the event loop has stopped
+    results: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+    loop = asyncio.new_event_loop()
+    # asyncio.to_thread runs on the default executor, which must allow `concurrency` threads
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="rest-request"))
+    main_task = loop.create_task(validate_items_async(item_tasks, config, client, results.put, concurrency))
+
+    def run_loop():
+        try:
+            loop.run_until_complete(main_task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logging.error(f"REST fetcher stopped unexpectedly: {e}")
+        finally:
+            loop.close()
+            results.put(None)
+
+    print(f"Processing {total} items through the REST API with {concurrency} concurrent requests")
+    logging.info(f"Processing {total} items through the REST API with {concurrency} concurrent requests")
+
+    runner = threading.Thread(target=run_loop, name="rest-fetcher", daemon=True)
+    runner.start()
+    completed = 0
+    try:
+        while True:
+            result = results.get()
+            if result is None:
+                break
+            completed += 1
+            if report_progress:
+                print(f"{ProgressMessages.PROGRESS_PREFIX} {completed}/{total}", flush=True)
+            yield result
+    finally:
+        if runner.is_alive():
+            # The consumer stopped early: cancel the requests that are still pending
+            try:
+                loop.call_soon_threadsafe(main_task.cancel)
+            except RuntimeError:
+                pass  # the loop closed in the meantime
+        runner.join()
+        if own_client:
+            client.close()
+
+    print(f"Completed processing {completed} items")
+    logging.info(f"Completed processing {completed} items")
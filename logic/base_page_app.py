@@ -1,9 +1,11 @@
 import time
+import logging
 
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 from utils.utils import safe_click
 from utils.constants import Timeouts, Retries
@@ -14,6 +16,8 @@ from infra.base_page import BasePage
 class BasePageApp(BasePage):
     # -----------------Locators Related to Bugs-----------------
     CLOSE_CURRENT_BUG_BUTTON = 'button[title="Close"]'
+    # Header search box, rendered on every project page once the user is signed in
+    APP_HEADER_SEARCH_INPUT = '#l1-search-input'
 
     def __init__(self, driver):
         """
@@ -22,6 +26,19 @@ class BasePageApp(BasePage):
         """
         super().__init__(driver)
 
+    def wait_until_app_ready(self, timeout: int = Timeouts.PAGE_READY_TIMEOUT) -> bool:
+        """
+        Wait until the Azure DevOps app has rendered its header (sign-in redirects are done).
+        Returns False instead of raising when the timeout passes, so callers can go on and let
+        their own element waits report the actual problem.
+        """
+        try:
+            self.wait_visible(By.CSS_SELECTOR, self.APP_HEADER_SEARCH_INPUT, timeout=timeout)
+            return True
+        except TimeoutException:
+            logging.warning(f"Azure DevOps header not rendered after {timeout}s, continuing")
+            return False
+
     def close_current_bug_button(self):
         """
         Exit the opened window of the current bug.
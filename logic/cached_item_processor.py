@@ -0,0 +1,137 @@
+"""
+Cached Item Processor Module
+
+This module skips bugs that did not change since the last run. Before fetching, the current
+revision of every bug is read with one cheap REST batch call (System.Rev and System.ChangedDate
+only, 200 bugs per call). Bugs whose revision, expected test IDs and validation config match a
+cached entry younger than the TTL reuse the cached result record; only the others are passed
+to the real backend (browser or REST), and their new records are stored in the cache.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Iterator, Callable, Tuple
+
+from infra.ado_rest_client import AdoRestClient, parse_ado_url
+from infra.work_item_cache import WorkItemCache, get_validation_config
+from logic.parallel_item_processor import ItemTask, is_error_record
+from utils.constants import Status, WorkItemCacheSettings, ProgressMessages
+
+
+def fetch_revisions(client: AdoRestClient, ids: List[int]) -> Dict[int, Tuple[int, Optional[str]]]:
+    """
+    Read the current revision of many work items.
+
+    :param client: REST client
+    :param ids: Work item IDs
+    :return: dict of work item ID -> (revision, changed date). Missing IDs do not exist.
+    """
+    fields = [WorkItemCacheSettings.REVISION_FIELD, WorkItemCacheSettings.CHANGED_DATE_FIELD]
+    work_items = client.get_work_items(ids, fields)
+    return {
+        work_item_id: (int(values[WorkItemCacheSettings.REVISION_FIELD]),
+                       values.get(WorkItemCacheSettings.CHANGED_DATE_FIELD))
+        for work_item_id, values in work_items.items()
+        if values.get(WorkItemCacheSettings.REVISION_FIELD) is not None
+    }
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """
+    Only records built from a successfully read work item are cached. Error and not-found
+    records, and records of a form whose fields could not all be read (their comment holds
+    Status.FAILED_TO_READ), are fetched again on the next run.
+    """
+    comment = str(result.get("Comments", ""))
+    return (not is_error_record(result)
+            and comment != Status.WORK_ITEM_NOT_FOUND
+            and Status.FAILED_TO_READ not in comment)
+
+
+def iter_items_cached(
+    item_tasks: List[ItemTask],
+    config: Dict[str, Any],
+    fetch: Callable[[List[ItemTask]], Iterator[Dict[str, Any]]],
+    client: Optional[AdoRestClient] = None,
+    cache: Optional[WorkItemCache] = None,
+    report_progress: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one result record per task, taking unchanged bugs from the cache and the others from fetch.
+    Cached records come first, then the fetched ones as they complete. A "PROGRESS: i/N" line is
+    printed for every record, so fetch must not print its own.
+
+    If the revisions cannot be read (no personal access token, network error), every task is fetched.
+
+    :param item_tasks: List of ItemTask objects
+    :param config: Configuration dictionary ("cache_ttl_hours", "force_refresh")
+    :param fetch: Backend iterator called with the tasks that have to be fetched
+    :param client: Optional REST client for the revision check; by default one is built from config
+    :param cache: Optional cache; by default the AppData one for the organization of config "url"
+    :param report_progress: Print a progress line to stdout for every record
+    :return: Generator of result dictionaries
+    """
+    if not item_tasks:
+        return
+
+    total = len(item_tasks)
+    completed = 0
+    own_client = client is None
+    own_cache = cache is None
+    revisions = {}
+
+    try:
+        if own_client:
+            client = AdoRestClient.from_config(config)
+        ids = [int(str(task.bug_id).strip()) for task in item_tasks if str(task.bug_id).strip().isdigit()]
+        revisions = fetch_revisions(client, ids)
+    except Exception as e:
+        logging.warning(f"Work item cache disabled for this run, cannot read revisions: {e}")
+    finally:
+        if own_client and client is not None:
+            client.close()
+
+    if own_cache and revisions:
+        organization_url, _ = parse_ado_url(config["url"])
+        cache = WorkItemCache(organization_url,
+                              ttl_hours=config.get("cache_ttl_hours", WorkItemCacheSettings.DEFAULT_TTL_HOURS))
+
+    try:
+        validation_config = get_validation_config(config)
+        force_refresh = config.get("force_refresh", False)
+        cached_results, pending_tasks = [], []
+        for task in item_tasks:
+            bug_id_str = str(task.bug_id).strip()
+            revision = revisions.get(int(bug_id_str)) if bug_id_str.isdigit() else None
+            result = None
+            if revision and not force_refresh:
+                result = cache.get(bug_id_str, revision[0], task.test_ids, validation_config)
+            if result:
+                cached_results.append(result)
+            else:
+                pending_tasks.append(task)
+
+        if revisions:
+            print(f"Work item cache: {len(cached_results)} of {total} bugs unchanged, {len(pending_tasks)} to fetch")
+            logging.info(f"Work item cache: {len(cached_results)} of {total} bugs unchanged, "
+                         f"{len(pending_tasks)} to fetch")
+
+        tasks_by_bug_id = {str(task.bug_id).strip(): task for task in pending_tasks}
+
+        def fetched_results():
+            for result in fetch(pending_tasks) if pending_tasks else ():
+                bug_id_str = str(result.get("Bug ID", "")).strip()
+                task = tasks_by_bug_id.get(bug_id_str)
+                revision = revisions.get(int(bug_id_str)) if bug_id_str.isdigit() else None
+                if task and revision and is_cacheable(result):
+                    cache.put(bug_id_str, revision[0], revision[1], task.test_ids, validation_config, result)
+                yield result
+
+        for results in (cached_results, fetched_results()):
+            for result in results:
+                completed += 1
+                if report_progress:
+                    print(f"{ProgressMessages.PROGRESS_PREFIX} {completed}/{total}", flush=True)
+                yield result
+    finally:
+        if own_cache and cache is not None:
+            cache.close()
@@ -1,31 +1,45 @@
 """
 Parallel Item Processor Module
 
-This module provides parallel processing of multiple item URLs using multiprocessing.
-Each worker gets its own ChromeDriver instance and processes one item URL independently.
+This module provides parallel processing of multiple item URLs using multiprocessing
+or a thread pool. Each worker gets its own ChromeDriver instance and processes item URLs independently.
 """
 
 import os
 import ssl
 import time
+import queue
 import logging
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
 from multiprocessing import Pool, cpu_count
-from typing import Dict, List, Any, Optional, Tuple
+from multiprocessing.util import Finalize
+from itertools import islice
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Iterable, Callable
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 
-import chromedriver_autoinstaller
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 
 from infra.base_page import BasePage
+from infra.session_state import SessionState
+from infra.driver_watchdog import DriverWatchdog
+from infra.chromedriver_resolver import resolve_chromedriver_path
+from infra.lean_browser import apply_lean_options, block_resources, report_lean_savings
+from infra.ado_rest_client import parse_ado_url, get_work_item_api_url, get_field_reference_names
 from infra.config_provider import ConfigProvider
 from logic.work_item import WorkItem
 from logic.base_page_app import BasePageApp
 from logic.work_items_search import WorkItemsSearch
-from utils.std_id_validator import validate_std_id, build_result_record
-from utils.additional_info_extract_std_tc_id import extract_tc_ids_from_additional_info
+from logic.worker_autoscaler import WorkerAutoscaler, can_measure_driver_memory
+from utils.std_id_validator import (
+    validate_std_id, build_result_record, check_field_values, validate_additional_info_std_id,
+    build_record_from_field_values
+)
 from utils.constants import (
-    Timeouts, Status, STDConstants, BrowserOptions
+    Timeouts, Retries, Status, BrowserOptions, ProgressMessages, ParallelEngines, WorkItemFields
 )
 
 # Configure logging for multiprocessing
@@ -47,12 +61,18 @@ class ItemTask:
     use_direct_navigation: bool = True
 
 
-def create_chrome_driver(base_url: Optional[str] = None) -> webdriver.Chrome:
+def create_chrome_driver(
+    base_url: Optional[str] = None,
+    lean: bool = False,
+    report_savings: bool = False
+) -> webdriver.Chrome:
     """
     Create and configure a Chrome WebDriver instance.
     Each worker process will call this to get its own driver.
     
     :param base_url: Optional base URL to navigate to initially
+    :param lean: Use the lean profile: no background networking, eager page loads, images/fonts/avatars/telemetry blocked
+    :param report_savings: With lean, measure on the base URL what the profile saves per page load and report it
     :return: Configured Chrome WebDriver instance
     """
     try:
@@ -60,18 +80,25 @@ def create_chrome_driver(base_url: Optional[str] = None) -> webdriver.Chrome:
         
         for arg in BrowserOptions.ARGUMENTS:
             options.add_argument(arg)
+        if lean:
+            apply_lean_options(options)
         
-        # Install/update ChromeDriver
-        driver_path = chromedriver_autoinstaller.install()
+        # Resolved once per Chrome version (see resolve_chromedriver_path), not installed per driver
+        driver_path = resolve_chromedriver_path()
         service = Service(driver_path)
         
         driver = webdriver.Chrome(service=service, options=options)
         driver.maximize_window()
+        if lean:
+            block_resources(driver)
         
         # Navigate to base URL if provided
         if base_url:
-            driver.get(base_url)
-            time.sleep(Timeouts.PAGE_LOAD_SLEEP)
+            if lean and report_savings:
+                report_lean_savings(driver, base_url)
+            else:
+                driver.get(base_url)
+            BasePageApp(driver).wait_until_app_ready()
         
         return driver
     
@@ -80,7 +107,11 @@ def create_chrome_driver(base_url: Optional[str] = None) -> webdriver.Chrome:
         raise RuntimeError(f"Failed to create ChromeDriver: {e}")
 
 
-def process_single_item(task: ItemTask, config: Dict[str, Any]) -> Dict[str, Any]:
+def process_single_item(
+    task: ItemTask,
+    config: Dict[str, Any],
+    session_state: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Process a single item URL. This is the worker function that runs in each process.
     
@@ -93,35 +124,111 @@ def process_single_item(task: ItemTask, config: Dict[str, Any]) -> Dict[str, Any
     
     :param task: ItemTask containing URL, bug_id, and test_ids
     :param config: Configuration dictionary with validation settings
+    :param session_state: Optional session captured by login_once, injected instead of loading the base URL
     :return: Result dictionary matching the format of build_result_record
     """
-    driver = None
+    # Setup SSL context (if needed)
+    ssl._create_default_https_context = ssl._create_unverified_context
+    
+    # Create driver and navigate to base URL first (for authentication/context)
+    return process_item_with_deadline(task, config, *_fresh_driver_handlers(config, session_state))
+
+
+def process_batch_in_tabs(
+    batch: List[ItemTask],
+    config: Dict[str, Any],
+    session_state: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Worker function for tabs mode without persistent drivers: open a fresh ChromeDriver,
+    process the batch with one tab per item (see iter_items_in_tabs) and quit it.
+    
+    :param batch: ItemTasks processed together, one per tab
+    :param config: Configuration dictionary with validation settings
+    :param session_state: Optional session captured by login_once, injected instead of loading the base URL
+    :return: One result dictionary per task, in task order
+    """
+    ssl._create_default_https_context = ssl._create_unverified_context
+    return process_items_in_tabs_with_deadline(batch, config, *_fresh_driver_handlers(config, session_state),
+                                               session_state=session_state)
+
+
+def _fresh_driver_handlers(
+    config: Dict[str, Any],
+    session_state: Optional[Dict[str, Any]] = None
+) -> Tuple[Callable[[], webdriver.Chrome], Callable[[webdriver.Chrome, bool], None]]:
+    """Acquire/release pair that opens a new driver for every attempt and always quits it."""
+    def acquire() -> webdriver.Chrome:
+        return open_authenticated_driver(config, session_state)
+    
+    def release(driver: webdriver.Chrome, killed: bool) -> None:
+        # Always clean up the driver
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing driver: {e}")
+    
+    return acquire, release
+
+
+def open_authenticated_driver(
+    config: Dict[str, Any],
+    session_state: Optional[Dict[str, Any]] = None
+) -> webdriver.Chrome:
+    """
+    Create a ChromeDriver that holds an authenticated context.
+    
+    With a session_state (see login_once) the captured cookies and storage are injected and no
+    page is loaded, so the first navigation can go straight to an item URL. Otherwise the
+    configured base URL is loaded to authenticate.
+    
+    :param config: Configuration dictionary (uses the "url" key)
+    :param session_state: Optional session captured by login_once
+    :return: Chrome WebDriver instance
+    """
+    lean = config.get("lean_browser", False)
+    if session_state:
+        driver = create_chrome_driver(lean=lean)
+        try:
+            SessionState.apply(driver, session_state)
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+    
+    base_url = config.get("url", "")
+    driver = create_chrome_driver(base_url, lean=lean, report_savings=config.get("lean_browser_report", False))
+
     try:
-        # Setup SSL context (if needed)
-        ssl._create_default_https_context = ssl._create_unverified_context
-        
-        # Get config values
-        base_url = config.get("url", "")
-        last_reproduced_in_config = config.get("current_version", "")
-        iteration_path_config = config.get("iteration_path", "")
-        std_name_config = config.get("std_name", "")
-        
-        # Create driver and navigate to base URL first (for authentication/context)
-        driver = create_chrome_driver(base_url)
-        base_page = BasePage(driver)
-        
         # Navigate to base URL if not already there
         if base_url and driver.current_url != base_url:
-            base_page.navigate_with_retry(base_url)
-            time.sleep(Timeouts.PAGE_LOAD_SLEEP)
-        
+            BasePage(driver).navigate_with_retry(base_url)
+            BasePageApp(driver).wait_until_app_ready()
+    except Exception:
+        driver.quit()
+        raise
+
+    return driver
+
+
+def process_item_with_driver(task: ItemTask, config: Dict[str, Any], driver: webdriver.Chrome) -> Dict[str, Any]:
+    """
+    Run the automation flow for one item on an already authenticated driver.
+    The driver is left open so the caller can reuse it for the next item.
+    
+    :param task: ItemTask containing URL, bug_id, and test_ids
+    :param config: Configuration dictionary with validation settings
+    :param driver: Chrome WebDriver instance owned by the caller
+    :return: Result dictionary matching the format of build_result_record
+    """
+    try:
         # Initialize page objects
+        base_page = BasePage(driver)
         work_items_search = WorkItemsSearch(driver)
         work_item = WorkItem(driver)
         
         # Prepare result variables
         bug_id_str = str(task.bug_id).strip()
-        expected_test_ids = [str(tid) for tid in task.test_ids]
         comment = ""
         
         # Validate bug ID format
@@ -142,123 +249,514 @@ def process_single_item(task: ItemTask, config: Dict[str, Any]) -> Dict[str, Any
         if task.use_direct_navigation:
             # Direct URL navigation approach
             try:
-                base_page.navigate_with_retry(task.url)
-                time.sleep(Timeouts.PAGE_LOAD_SLEEP)
+                if not (config.get("spa_navigation", False) and open_item_in_app(driver, task.url, bug_id_str)):
+                    base_page.navigate_with_retry(task.url)
+                    work_item.wait_until_form_ready()
             except Exception as e:
                 logging.warning(f"Direct navigation to {task.url} failed: {e}. Falling back to search.")
                 # Fallback to search if direct navigation fails
                 work_items_search.fill_bug_id_input_and_press_enter(bug_id_str)
+                work_item.wait_until_form_ready()
         else:
             # Search-based approach (original method)
             work_items_search.fill_bug_id_input_and_press_enter(bug_id_str)
+            work_item.wait_until_form_ready()
         
-        # Get STD ID value
+        return build_record_from_form(work_item, bug_id_str, task.test_ids, config)
+    
+    except Exception as e:
+        # Handle any unexpected errors
+        logging.error(f"Error processing item {task.bug_id} ({task.url}): {e}")
+        return build_error_record(task, e)
+
+
+def open_item_in_app(driver: webdriver.Chrome, url: str, bug_id_str: str) -> bool:
+    """
+    Open a work item through the web app's client-side routing instead of a full page load.
+    Only possible when the driver already shows the Work Items hub on the same origin; the
+    bug counts as opened once the page shows its ID (WorkItem.wait_until_work_item_shown).
+    
+    :param driver: Chrome WebDriver holding the loaded web app
+    :param url: Direct URL of the work item
+    :param bug_id_str: Bug ID expected on the page
+    :return: True if the work item is shown; False if the caller has to load the URL
+    """
+    current = urlsplit(driver.current_url)
+    target = urlsplit(url)
+    if (current.scheme, current.netloc) != (target.scheme, target.netloc) or "/_workitems" not in current.path:
+        return False
+    
+    BasePage(driver).navigate_in_app(url)
+    if WorkItem(driver).wait_until_work_item_shown(bug_id_str):
+        return True
+    
+    logging.info(f"In-app navigation to bug {bug_id_str} was not confirmed, loading the page")
+    return False
+
+
+def build_record_from_form(
+    work_item: WorkItem,
+    bug_id_str: str,
+    test_ids: List[int],
+    config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Validate the work item form that is open in the browser and build its result record.
+    All fields are read with one WorkItem.read_fields call. When the STD ID does not match,
+    Additional Info is taken from the page if its tab is displayed, otherwise read through
+    the REST API from inside the page, and only as a last resort by opening its tab.
+    
+    :param work_item: WorkItem page object of the open (rendered) form
+    :param bug_id_str: Bug ID (digits only)
+    :param test_ids: Expected test IDs from the Excel file
+    :param config: Configuration dictionary with current_version, iteration_path and std_name
+    :return: Result dictionary matching the format of build_result_record
+    """
+    expected_test_ids = [str(tid) for tid in test_ids]
+    comment = ""
+    # Kept in the comment even on a match, so the record is not cached (see is_cacheable)
+    read_errors = ""
+    values = work_item.read_fields()
+    
+    # Validate STD ID
+    std_id_field_val = values.get(WorkItemFields.STD_ID)
+    if std_id_field_val is None:
+        logging.error(f"Failed to get STD ID for bug {bug_id_str}: field not found on the form")
+        std_id_field_val = ""
+        read_errors += f"{Status.FAILED_TO_READ} STD ID field: not found on the form. "
+    
+    ok, std_comment = validate_std_id(std_id_field_val, expected_test_ids)
+    comment += std_comment
+    status_str = Status.SUCCESS if ok else Status.FAILURE
+    
+    # Check other fields
+    field_texts = [values.get(WorkItemFields.LAST_REPRODUCED_IN),
+                   values.get(WorkItemFields.ITERATION_PATH),
+                   values.get(WorkItemFields.STD_NAME)]
+    if None in field_texts:
+        logging.error(f"Failed to get field values for bug {bug_id_str}: {values}")
+        read_errors += f"{Status.FAILED_TO_READ} fields: not found on the form. "
+        last_reproduced_status = iteration_path_status = std_name_status = Status.FAILURE
+    else:
+        last_reproduced_status, iteration_path_status, std_name_status = check_field_values(
+            *field_texts,
+            config.get("current_version", ""),
+            config.get("iteration_path", ""),
+            config.get("std_name", "")
+        )
+    
+    # Check Additional Info as fallback if STD ID validation failed
+    if not ok:
+        additional_info_text = values.get(WorkItemFields.ADDITIONAL_INFO)
+        if additional_info_text is None:
+            additional_info_text = read_additional_info_from_api(work_item, bug_id_str, config)
+        if additional_info_text is not None:
+            matched = validate_additional_info_std_id(additional_info_text, expected_test_ids)
+        else:
+            matched = handle_additional_info_std_id(work_item, expected_test_ids)
+        if matched:
+            std_id_field_val = ", ".join(expected_test_ids)
+            status_str = Status.SUCCESS
+            comment = Status.MATCH
+    
+    return build_result_record(
+        bug_id_str,
+        test_ids,
+        std_id_field_val,
+        status_str,
+        read_errors + comment,
+        last_reproduced_status,
+        iteration_path_status,
+        std_name_status
+    )
+
+
+def read_additional_info_from_api(work_item: WorkItem, bug_id_str: str, config: Dict[str, Any]) -> Optional[str]:
+    """
+    Read the Additional Info field of a bug through the REST API, from inside the signed-in page.
+    
+    :return: The field text, or None if it could not be read (the caller then opens the tab)
+    """
+    try:
+        reference_name = get_field_reference_names(config)[WorkItemFields.ADDITIONAL_INFO]
+        organization_url, project = parse_ado_url(config.get("url", ""))
+        api_url = get_work_item_api_url(organization_url, project, int(bug_id_str), [reference_name])
+        return work_item.get_rich_text_field_from_api(api_url, reference_name)
+    except Exception as e:
+        logging.warning(f"Could not read Additional Info of bug {bug_id_str} from the API: {e}")
+        return None
+
+
+def process_item_with_deadline(
+    task: ItemTask,
+    config: Dict[str, Any],
+    acquire: Callable[[], webdriver.Chrome],
+    release: Callable[[webdriver.Chrome, bool], None]
+) -> Dict[str, Any]:
+    """
+    Run process_item_with_driver under a wall-clock deadline (see process_items_with_deadline).
+    
+    :param task: ItemTask containing URL, bug_id, and test_ids
+    :param config: Configuration dictionary with validation settings
+    :param acquire: Returns the driver to use for an attempt
+    :param release: Called with the driver and whether it was killed once the attempt ends
+    :return: Result dictionary matching the format of build_result_record
+    """
+    def run(tasks: List[ItemTask], driver: webdriver.Chrome) -> Iterator[Dict[str, Any]]:
+        yield process_item_with_driver(tasks[0], config, driver)
+    
+    return process_items_with_deadline([task], config, acquire, release, run)[0]
+
+
+def process_items_with_deadline(
+    tasks: List[ItemTask],
+    config: Dict[str, Any],
+    acquire: Callable[[], webdriver.Chrome],
+    release: Callable[[webdriver.Chrome, bool], None],
+    run: Callable[[List[ItemTask], webdriver.Chrome], Iterable[Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Run items on one driver under a wall-clock deadline of config "item_timeout_seconds" per item.
+    
+    If the items are still running at the deadline the driver is killed, which makes the hung
+    WebDriver call fail at once. Only the records finished before the kill are kept: the page
+    readers fall back on errors, so a record finished after it may be a mismatch caused by the
+    dead driver. The other items are tried again on a fresh driver, up to config
+    "item_timeout_retries" times, and finally reported as timeout error records. An attempt that
+    raises (e.g. the driver died while its tabs were opened) is retried the same way.
+    
+    :param tasks: ItemTasks to run together on the driver
+    :param config: Configuration dictionary with validation settings
+    :param acquire: Returns the driver to use for an attempt
+    :param release: Called with the driver and whether it was killed (or failed) once the attempt ends
+    :param run: Processes the given tasks on the driver, yielding one record per task in task order
+                as soon as it is finished
+    :return: Result dictionaries in task order
+    """
+    item_deadline = config.get("item_timeout_seconds", Timeouts.ITEM_DEADLINE)
+    attempts = 1 + config.get("item_timeout_retries", Retries.ITEM_TIMEOUT_RETRIES)
+    results: Dict[int, Dict[str, Any]] = {}
+    pending = list(range(len(tasks)))
+    
+    for attempt in range(1, attempts + 1):
         try:
-            std_id_field_val = work_item.get_std_id_value()
+            driver = acquire()
         except Exception as e:
-            logging.error(f"Failed to get STD ID for bug {bug_id_str}: {e}")
-            std_id_field_val = ""
-            comment += f"Failed to read STD ID field: {str(e)}. "
+            for index in pending:
+                logging.error(f"Error processing item {tasks[index].bug_id} ({tasks[index].url}): {e}")
+                results[index] = build_error_record(tasks[index], e)
+            return [results[index] for index in range(len(tasks))]
         
-        # Validate STD ID
-        ok, std_comment = validate_std_id(std_id_field_val, expected_test_ids)
-        comment += std_comment
-        
-        status_str = Status.SUCCESS if ok else Status.FAILURE
-        
-        # Check other fields
+        deadline = item_deadline * len(pending)
+        watchdog = DriverWatchdog(driver, deadline)
+        finished: Dict[int, Tuple[Dict[str, Any], float]] = {}
+        failure: Optional[Exception] = None
         try:
-            last_reproduced_status, iteration_path_status, std_name_status = check_fields(
-                work_item, last_reproduced_in_config, iteration_path_config, std_name_config
-            )
+            with watchdog:
+                for index, record in zip(pending, run([tasks[index] for index in pending], driver)):
+                    finished[index] = (record, time.monotonic())
         except Exception as e:
-            logging.error(f"Failed to check fields for bug {bug_id_str}: {e}")
-            last_reproduced_status = Status.FAILURE
-            iteration_path_status = Status.FAILURE
-            std_name_status = Status.FAILURE
-            comment += f"Field validation error: {str(e)}. "
+            failure = e
+        finally:
+            release(driver, watchdog.fired or failure is not None)
         
-        # Check Additional Info tab as fallback if STD ID validation failed
-        if not ok:
+        # Items finished before the kill keep their result; the others are tried again
+        killed_at = watchdog.fired_at if watchdog.fired else float("inf")
+        results.update((index, record) for index, (record, finished_at) in finished.items() if finished_at < killed_at)
+        pending = [index for index in pending if index not in results]
+        if not pending:
+            return [results[index] for index in range(len(tasks))]
+        
+        retrying = ", retrying on a fresh driver" if attempt < attempts else ""
+        if watchdog.fired:
+            failure = TimeoutError(f"{Status.ITEM_TIMED_OUT} after {item_deadline}s ({attempts} attempts)")
+            logging.warning(f"Items {[tasks[index].bug_id for index in pending]} passed their {deadline}s deadline "
+                            f"(attempt {attempt}/{attempts})" + retrying)
+        else:
+            logging.error(f"Items {[tasks[index].bug_id for index in pending]} stopped on a failed driver: {failure} "
+                          f"(attempt {attempt}/{attempts})" + retrying)
+    
+    for index in pending:
+        results[index] = build_error_record(tasks[index], failure)
+    return [results[index] for index in range(len(tasks))]
+
+
+def iter_items_in_tabs(
+    tasks: List[ItemTask],
+    config: Dict[str, Any],
+    driver: webdriver.Chrome,
+    session_state: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Process several items at once in separate tabs of one driver.
+    
+    Every tab first starts loading its work item without waiting for it; then the tabs are read
+    one after another, so the items still loading keep loading while the first ones are validated.
+    A tab counts as loaded once it shows its bug ID and a rendered form; otherwise the URL is
+    loaded again in that tab the usual way.
+    
+    :param tasks: ItemTasks, one per tab
+    :param config: Configuration dictionary with validation settings
+    :param driver: Chrome WebDriver owned by the caller; missing tabs are opened and left open for reuse
+    :param session_state: Session injected into the driver (see login_once), whose storage new tabs need too
+    :return: Generator of one result dictionary per task, in task order, each yielded once it is finished
+    """
+    handles = open_tabs(driver, len(tasks), lean=config.get("lean_browser", False), session_state=session_state)
+    
+    for task, handle in zip(tasks, handles):
+        if str(task.bug_id).strip().isdigit():
             try:
-                if handle_additional_info_std_id(work_item, expected_test_ids):
-                    std_id_field_val = ", ".join(expected_test_ids)
-                    status_str = Status.SUCCESS
-                    comment = Status.MATCH
+                driver.switch_to.window(handle)
+                # Assigning the location starts the load without waiting for it (unlike driver.get)
+                driver.execute_script("window.location.href = arguments[0];", task.url)
             except Exception as e:
-                logging.warning(f"Additional info check failed for bug {bug_id_str}: {e}")
-        
-        # Build and return result
-        result = build_result_record(
-            bug_id_str,
-            task.test_ids,
-            std_id_field_val,
-            status_str,
-            comment,
-            last_reproduced_status,
-            iteration_path_status,
-            std_name_status
-        )
-        
-        return result
+                logging.warning(f"Could not start loading bug {task.bug_id} in its tab: {e}")
     
-    except Exception as e:
-        # Handle any unexpected errors
-        logging.error(f"Error processing item {task.bug_id} ({task.url}): {e}")
-        return build_result_record(
-            str(task.bug_id),
-            task.test_ids,
-            Status.PLACEHOLDER,
-            Status.FAILURE,
-            f"Processing error: {str(e)}",
-            Status.PLACEHOLDER,
-            Status.PLACEHOLDER,
-            Status.PLACEHOLDER
-        )
+    for task, handle in zip(tasks, handles):
+        bug_id_str = str(task.bug_id).strip()
+        try:
+            if not bug_id_str.isdigit():
+                # Reported as "Invalid bug number", like the single-item flow
+                record = build_record_from_field_values(bug_id_str, task.test_ids, {}, config)
+            else:
+                driver.switch_to.window(handle)
+                work_item = WorkItem(driver)
+                if not work_item.wait_until_work_item_shown(bug_id_str, timeout=Timeouts.PAGE_READY_TIMEOUT):
+                    logging.info(f"Bug {bug_id_str} did not show up in its tab, loading it again")
+                    BasePage(driver).navigate_with_retry(task.url)
+                    work_item.wait_until_form_ready()
+                record = build_record_from_form(work_item, bug_id_str, task.test_ids, config)
+        except Exception as e:
+            logging.error(f"Error processing item {task.bug_id} ({task.url}): {e}")
+            record = build_error_record(task, e)
+        yield record
+
+
+def open_tabs(
+    driver: webdriver.Chrome,
+    count: int,
+    lean: bool = False,
+    session_state: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    Make sure the driver has at least count tabs and return the handles of the first count.
+    New tabs get what the first one was given per tab: with lean the resource block, with a
+    session_state the web storage restore script.
+    """
+    while len(driver.window_handles) < count:
+        driver.switch_to.new_window("tab")
+        if lean:
+            block_resources(driver)
+        if session_state:
+            SessionState.apply_storage(driver, session_state)
+    return driver.window_handles[:count]
+
+
+def process_items_in_tabs_with_deadline(
+    tasks: List[ItemTask],
+    config: Dict[str, Any],
+    acquire: Callable[[], webdriver.Chrome],
+    release: Callable[[webdriver.Chrome, bool], None],
+    session_state: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run iter_items_in_tabs under a wall-clock deadline (see process_items_with_deadline).
+    """
+    def run(pending: List[ItemTask], driver: webdriver.Chrome) -> Iterator[Dict[str, Any]]:
+        return iter_items_in_tabs(pending, config, driver, session_state)
+    
+    return process_items_with_deadline(tasks, config, acquire, release, run)
+
+
+def login_once(config: Dict[str, Any], autoscaler: Optional[WorkerAutoscaler] = None) -> Dict[str, Any]:
+    """
+    Authenticate a single browser on the base URL and capture its session for the workers.
     
+    :param config: Configuration dictionary (uses the "url" key)
+    :param autoscaler: Optional autoscaler that measures the browser's memory before it is quit
+    :return: Session state to pass to open_authenticated_driver
+    """
+    driver = open_authenticated_driver(config)
+    try:
+        if autoscaler:
+            autoscaler.observe_driver(driver)
+        return SessionState.capture(driver)
     finally:
-        # Always clean up the driver
-        if driver:
+        driver.quit()
+
+
+def calibrate_autoscaler(
+    autoscaler: WorkerAutoscaler,
+    config: Dict[str, Any],
+    session_state: Optional[Dict[str, Any]] = None,
+    driver_pool: Optional["DriverPool"] = None
+) -> int:
+    """
+    Measure the memory of one authenticated driver, then pick the starting worker count from it
+    (see WorkerAutoscaler.initial_workers). Nothing is opened when a driver was already measured
+    (login_once) or psutil is not installed.
+    
+    :param autoscaler: Autoscaler of the run
+    :param config: Configuration dictionary
+    :param session_state: Optional session captured by login_once
+    :param driver_pool: Pool of the thread engine; the measured driver is its first driver and
+                        stays in it. Without a pool the driver is opened only to be measured.
+    :return: Starting number of workers
+    """
+    running_workers = 0
+    if not autoscaler.measured and can_measure_driver_memory():
+        if driver_pool is not None:
+            # The pool measures every new driver (on_new_driver)
+            driver_pool.prefill(1)
+            running_workers = 1 if autoscaler.measured else 0
+        else:
             try:
-                driver.quit()
+                driver = open_authenticated_driver(config, session_state)
             except Exception as e:
-                logging.warning(f"Error closing driver for bug {task.bug_id}: {e}")
+                logging.warning(f"[Autoscaler] Could not open a driver to measure: {e}")
+            else:
+                try:
+                    autoscaler.observe_driver(driver)
+                finally:
+                    driver.quit()
+    return autoscaler.initial_workers(running_workers)
 
 
-def check_fields(
-    work_item: WorkItem,
-    last_reproduced_in_config: str,
-    iteration_path_config: str,
-    std_name_config: str
-) -> Tuple[str, str, str]:
+def build_error_record(task: ItemTask, error: Exception) -> Dict[str, Any]:
     """
-    Compare the Last_reproduced_in, Iteration_path, and STD Name fields to config values.
-    This is extracted from the original TestBugSTDValidation.check_fields method.
+    Build the result record reported for an item whose processing raised an unexpected error.
     """
+    return build_result_record(
+        str(task.bug_id),
+        task.test_ids,
+        Status.PLACEHOLDER,
+        Status.FAILURE,
+        f"{Status.PROCESSING_ERROR}: {str(error)}",
+        Status.PLACEHOLDER,
+        Status.PLACEHOLDER,
+        Status.PLACEHOLDER
+    )
+
+
+def is_error_record(result: Dict[str, Any]) -> bool:
+    """Return True if the result record was built by build_error_record."""
+    return str(result.get("Comments", "")).startswith(Status.PROCESSING_ERROR)
+
+
+def order_results(results: Iterable[Dict[str, Any]], bug_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Sort result records (in completion order) into the order of their bugs, so a report lists
+    the bugs the same way on every run. Records of bugs not in bug_ids go last.
+    
+    :param results: Result records
+    :param bug_ids: Bug IDs in the wanted order (e.g. the tasks' or the bug map's)
+    :return: Sorted list of the records
+    """
+    positions = {}
+    for bug_id in bug_ids:
+        positions.setdefault(str(bug_id).strip(), len(positions))
+    return sorted(results, key=lambda result: positions.get(str(result.get("Bug ID", "")).strip(), len(positions)))
+
+
+# ============================================================================
+# Persistent worker drivers
+# ============================================================================
+# Driver owned by the current pool worker process when running with persistent drivers.
+# It is created by init_persistent_worker and reused by every task the worker receives.
+_worker_driver: Optional[webdriver.Chrome] = None
+# Session captured by the parent (see login_once), reused whenever this worker opens a driver.
+_worker_session_state: Optional[Dict[str, Any]] = None
+
+
+def init_persistent_worker(config: Dict[str, Any], session_state: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Pool initializer: build one authenticated ChromeDriver for this worker process.
+    
+    The driver is quit by a multiprocessing finalizer when the worker exits, which happens
+    when the pool is closed and joined. Creation errors are logged instead of raised, because
+    a failing initializer makes the pool respawn the worker forever; the driver is then
+    created lazily by the first task.
+    
+    :param config: Configuration dictionary
+    :param session_state: Optional session captured by login_once
+    """
+    global _worker_driver, _worker_session_state
+    ssl._create_default_https_context = ssl._create_unverified_context
+    _worker_session_state = session_state
+    
     try:
-        last_reproduced_in_text = work_item.get_last_reproduce_in_value()
-        iteration_path_text = work_item.get_iteration_path_value()
-        std_name_text = work_item.get_std_name_value()
+        _worker_driver = open_authenticated_driver(config, session_state)
     except Exception as e:
-        logging.error(f"Failed to get field values: {e}")
-        return Status.FAILURE, Status.FAILURE, Status.FAILURE
+        logging.error(f"Worker {os.getpid()} could not create its driver at startup: {e}")
+        _worker_driver = None
+    
+    Finalize(None, _quit_worker_driver, exitpriority=10)
+
+
+def _quit_worker_driver() -> None:
+    """Quit the driver owned by this worker process, if any."""
+    global _worker_driver
+    if _worker_driver:
+        try:
+            _worker_driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing driver of worker {os.getpid()}: {e}")
+        finally:
+            _worker_driver = None
+
+
+def _is_driver_alive(driver: webdriver.Chrome) -> bool:
+    """Return True if the WebDriver session still answers commands."""
+    try:
+        _ = driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def process_item_with_worker_driver(task: ItemTask, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker function for persistent mode: process one item on the driver owned by this worker.
     
-    last_reproduced_status = Status.SUCCESS if last_reproduced_in_text == last_reproduced_in_config else Status.FAILURE
+    If the driver was never created, its session died (e.g. Chrome crashed) or it was killed
+    at the item deadline, it is replaced with a fresh one so the remaining items of this
+    worker are not affected.
     
-    # Base comparison for iteration path
-    iteration_path_status = Status.SUCCESS if iteration_path_text == iteration_path_config else Status.FAILURE
+    :param task: ItemTask containing URL, bug_id, and test_ids
+    :param config: Configuration dictionary with validation settings
+    :return: Result dictionary matching the format of build_result_record
+    """
+    return process_item_with_deadline(task, config, *_worker_driver_handlers(config))
+
+
+def process_batch_with_worker_driver(batch: List[ItemTask], config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Worker function for persistent tabs mode: process a batch in the tabs of the driver owned by this worker.
     
-    # Legacy fallback: replace last segment with "Legacy" if iteration path was not found
-    if iteration_path_status == Status.FAILURE and "/" in iteration_path_config:
-        parts = iteration_path_config.rsplit("/", 1)
-        iteration_path_config_legacy = parts[0] + "/Legacy"
-        if iteration_path_text == iteration_path_config_legacy:
-            iteration_path_status = Status.SUCCESS
+    :param batch: ItemTasks processed together, one per tab
+    :param config: Configuration dictionary with validation settings
+    :return: One result dictionary per task, in task order
+    """
+    return process_items_in_tabs_with_deadline(batch, config, *_worker_driver_handlers(config),
+                                               session_state=_worker_session_state)
+
+
+def _worker_driver_handlers(
+    config: Dict[str, Any]
+) -> Tuple[Callable[[], webdriver.Chrome], Callable[[webdriver.Chrome, bool], None]]:
+    """Acquire/release pair for the driver owned by this worker process, recreated when it died or was killed."""
+    def acquire() -> webdriver.Chrome:
+        global _worker_driver
+        if _worker_driver is None:
+            _worker_driver = open_authenticated_driver(config, _worker_session_state)
+        return _worker_driver
     
-    # Compare STD Name field to config
-    std_name_status = Status.SUCCESS if std_name_text == std_name_config else Status.FAILURE
+    def release(driver: webdriver.Chrome, killed: bool) -> None:
+        if killed or not _is_driver_alive(driver):
+            logging.warning(f"Driver of worker {os.getpid()} is no longer responding, it will be recreated")
+            _quit_worker_driver()
     
-    return last_reproduced_status, iteration_path_status, std_name_status
+    return acquire, release
 
 
 def handle_additional_info_std_id(work_item: WorkItem, expected_test_ids: List[str]) -> bool:
@@ -269,51 +767,661 @@ def handle_additional_info_std_id(work_item: WorkItem, expected_test_ids: List[s
     try:
         work_item.click_on_additional_info_tab()
         additional_info_text = work_item.get_additional_info_value()
-        tc_id_list = extract_tc_ids_from_additional_info(STDConstants.DEFAULT_STD_NAME, additional_info_text)
-        return sorted(tc_id_list) == sorted(expected_test_ids)
+        return validate_additional_info_std_id(additional_info_text, expected_test_ids)
     except Exception as e:
         logging.warning(f"Additional info check failed: {e}")
         return False
 
 
+# ============================================================================
+# Thread engine
+# ============================================================================
+class DriverPool:
+    """
+    Thread-safe pool of authenticated ChromeDrivers shared by the worker threads of one process.
+    
+    A thread borrows a driver for one item and gives it back afterwards, so each driver is
+    only ever used by one thread at a time and is reused for many items.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        on_new_driver: Optional[Callable[[webdriver.Chrome], None]] = None,
+        session_state: Optional[Dict[str, Any]] = None
+    ):
+        """
+        :param config: Configuration dictionary used to open new drivers
+        :param on_new_driver: Optional callback invoked with every newly opened driver
+        :param session_state: Optional session captured by login_once, injected into new drivers
+        """
+        self._config = config
+        self.session_state = session_state
+        self._on_new_driver = on_new_driver
+        self._idle: List[webdriver.Chrome] = []
+        self._drivers: List[webdriver.Chrome] = []
+        self._max_size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> webdriver.Chrome:
+        """Return an idle driver, or open a new one if every driver is busy."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        
+        # Opened outside the lock so several threads can start their browsers at once
+        return self._open_driver()
+    
+    def _open_driver(self) -> webdriver.Chrome:
+        """Open a new authenticated driver owned by the pool (not idle)."""
+        driver = open_authenticated_driver(self._config, self.session_state)
+        with self._lock:
+            self._drivers.append(driver)
+        if self._on_new_driver:
+            self._on_new_driver(driver)
+        return driver
+    
+    def prefill(self, count: int) -> None:
+        """
+        Open drivers, all at once, until the pool holds count of them, and keep them idle.
+        Drivers that fail to open are logged; acquire opens them later on demand.
+        """
+        with self._lock:
+            missing = count - len(self._drivers)
+        if missing <= 0:
+            return
+        
+        with ThreadPoolExecutor(max_workers=missing, thread_name_prefix="driver-warmup") as executor:
+            futures = [executor.submit(self._open_driver) for _ in range(missing)]
+        for future in futures:
+            try:
+                driver = future.result()
+            except Exception as e:
+                logging.warning(f"Could not open a driver in advance: {e}")
+                continue
+            with self._lock:
+                self._idle.append(driver)
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Give a driver back to the pool. A driver whose session died, or one above the size
+        limit, is quit instead.
+        """
+        if not _is_driver_alive(driver):
+            logging.warning("Pooled driver is no longer responding, it will be replaced")
+            self.discard(driver)
+            return
+        with self._lock:
+            over_limit = self._max_size is not None and len(self._drivers) > self._max_size
+            if not over_limit:
+                self._idle.append(driver)
+                return
+        self.discard(driver)
+
+    def set_max_size(self, max_size: int) -> None:
+        """
+        Limit how many drivers the pool keeps. Idle drivers above the limit are quit now,
+        busy ones when they are released.
+        """
+        with self._lock:
+            self._max_size = max_size
+            surplus = max(0, len(self._drivers) - max_size)
+            to_quit = self._idle[:surplus]
+        for driver in to_quit:
+            self.discard(driver)
+
+    def discard(self, driver: webdriver.Chrome) -> None:
+        """Remove a driver from the pool and quit it."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            if driver in self._idle:
+                self._idle.remove(driver)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error closing pooled driver: {e}")
+
+    def close(self) -> None:
+        """Quit every driver owned by the pool."""
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self.discard(driver)
+
+
+def process_item_with_pool(task: ItemTask, config: Dict[str, Any], driver_pool: DriverPool) -> Dict[str, Any]:
+    """
+    Worker function for the thread engine: process one item on a driver borrowed from the pool.
+    
+    :param task: ItemTask containing URL, bug_id, and test_ids
+    :param config: Configuration dictionary with validation settings
+    :param driver_pool: Pool the driver is borrowed from and returned to
+    :return: Result dictionary matching the format of build_result_record
+    """
+    return process_item_with_deadline(task, config, *_pool_driver_handlers(driver_pool))
+
+
+def process_batch_with_pool(batch: List[ItemTask], config: Dict[str, Any], driver_pool: DriverPool) -> List[Dict[str, Any]]:
+    """
+    Worker function for the thread engine in tabs mode: process a batch in the tabs of a pooled driver.
+    
+    :param batch: ItemTasks processed together, one per tab
+    :param config: Configuration dictionary with validation settings
+    :param driver_pool: Pool the driver is borrowed from and returned to
+    :return: One result dictionary per task, in task order
+    """
+    return process_items_in_tabs_with_deadline(batch, config, *_pool_driver_handlers(driver_pool),
+                                               session_state=driver_pool.session_state)
+
+
+def _pool_driver_handlers(
+    driver_pool: DriverPool
+) -> Tuple[Callable[[], webdriver.Chrome], Callable[[webdriver.Chrome, bool], None]]:
+    """Acquire/release pair that borrows a pooled driver; a killed driver is removed from the pool."""
+    def release(driver: webdriver.Chrome, killed: bool) -> None:
+        if killed:
+            driver_pool.discard(driver)
+        else:
+            driver_pool.release(driver)
+    
+    return driver_pool.acquire, release
+
+
+def _iter_thread_engine(
+    item_tasks: Iterable[ItemTask],
+    config: Dict[str, Any],
+    num_workers: int,
+    autoscaler: Optional[WorkerAutoscaler] = None,
+    session_state: Optional[Dict[str, Any]] = None,
+    tabs_per_browser: int = 1,
+    driver_pool: Optional[DriverPool] = None,
+    initial_workers: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run the items on up to num_workers threads of this process, each driving its own ChromeDriver.
+    With tabs_per_browser > 1 every thread handles a batch of that many items at once, one per tab.
+    A driver_pool opened in advance (see WorkerWarmup) is used instead of a new one, together with
+    the initial_workers it was sized for: asking the autoscaler again would count the memory of
+    those open drivers as used and shrink the run.
+    
+    The per-item work is mostly waiting on the WebDriver HTTP protocol, so threads give the
+    same concurrency as processes without re-importing pandas/selenium in every worker.
+    Drivers are reused across items and quit when the run ends.
+    
+    Only as many items as the current target are in flight at once. With an autoscaler the
+    target follows its decisions during the run and surplus drivers are quit.
+    """
+    ssl._create_default_https_context = ssl._create_unverified_context
+    
+    if driver_pool is None:
+        driver_pool = DriverPool(
+            config,
+            on_new_driver=autoscaler.observe_driver if autoscaler else None,
+            session_state=session_state
+        )
+    executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="item-worker")
+    if initial_workers is not None:
+        target = initial_workers
+    else:
+        target = calibrate_autoscaler(autoscaler, config, session_state, driver_pool) if autoscaler else num_workers
+    if tabs_per_browser > 1:
+        pending = iter(batch_tasks(item_tasks, tabs_per_browser))
+        worker = process_batch_with_pool
+    else:
+        pending = iter(item_tasks)
+        worker = process_item_with_pool
+    in_flight: Dict[Future, float] = {}
+    finished = False
+    
+    def submit_up_to_target():
+        while len(in_flight) < target:
+            task = next(pending, None)
+            if task is None:
+                return
+            in_flight[executor.submit(worker, task, config, driver_pool)] = time.monotonic()
+    
+    try:
+        submit_up_to_target()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                started = in_flight.pop(future)
+                results = future.result() if tabs_per_browser > 1 else [future.result()]
+                for result in results:
+                    if autoscaler:
+                        # Items of a batch share the elapsed time
+                        autoscaler.record((time.monotonic() - started) / len(results), is_error_record(result))
+                    yield result
+            
+            if autoscaler:
+                target = autoscaler.adjust()
+                driver_pool.set_max_size(target)
+            submit_up_to_target()
+        finished = True
+    finally:
+        # An aborted run does not wait for in-flight items; closing their drivers stops them
+        executor.shutdown(wait=finished, cancel_futures=True)
+        driver_pool.close()
+
+
+# ============================================================================
+# Process engine
+# ============================================================================
+def _iter_process_engine(
+    item_tasks: Iterable[ItemTask],
+    config: Dict[str, Any],
+    num_workers: int,
+    persistent_drivers: bool,
+    session_state: Optional[Dict[str, Any]] = None,
+    tabs_per_browser: int = 1,
+    pool: Optional[Pool] = None,
+    autoscaler: Optional[WorkerAutoscaler] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Run the items on a pool of num_workers processes, yielding results as they finish.
+    With tabs_per_browser > 1 every process handles a batch of that many items at once, one per tab.
+    A pool started in advance with create_process_pool (see WorkerWarmup) is used instead of a new one.
+    
+    With an autoscaler only as many items as its target are in flight (see _imap_autoscaled). A
+    process pool cannot grow, so num_workers is the most the target can reach.
+    """
+    tabs_mode = tabs_per_browser > 1
+    if pool is None:
+        pool = create_process_pool(config, num_workers, persistent_drivers, session_state)
+    if persistent_drivers:
+        worker = partial(process_batch_with_worker_driver if tabs_mode else process_item_with_worker_driver,
+                         config=config)
+    else:
+        worker = partial(process_batch_in_tabs if tabs_mode else process_single_item,
+                         config=config, session_state=session_state)
+    units = batch_tasks(item_tasks, tabs_per_browser) if tabs_mode else item_tasks
+    if autoscaler:
+        autoscaler.max_workers = min(autoscaler.max_workers, num_workers)
+        outcomes = _imap_autoscaled(pool, worker, units, autoscaler, tabs_mode)
+    else:
+        # chunksize=1 hands out one item (or batch) at a time, so results stream back as they finish
+        outcomes = pool.imap_unordered(worker, units, chunksize=1)
+    
+    finished = False
+    try:
+        for outcome in outcomes:
+            yield from (outcome if tabs_mode else [outcome])
+        finished = True
+    finally:
+        # Closing (rather than terminating) lets persistent workers run the finalizers that
+        # quit their drivers. An aborted run is terminated right away.
+        if finished:
+            pool.close()
+        else:
+            pool.terminate()
+        pool.join()
+
+
+def _imap_autoscaled(
+    pool: Pool,
+    worker: Callable[[Any], Any],
+    units: Iterable[Any],
+    autoscaler: WorkerAutoscaler,
+    tabs_mode: bool
+) -> Iterator[Any]:
+    """
+    pool.imap_unordered with at most autoscaler.target units (items or batches) in flight.
+    Every finished unit is recorded and the target adjusted, like on the thread engine; the
+    processes above the target stay idle until it rises again. An idle worker with per-item
+    drivers has no Chrome open, so scaling down frees memory; a persistent worker keeps its
+    driver, so it only frees CPU and network.
+    """
+    done: queue.SimpleQueue = queue.SimpleQueue()
+    pending = iter(units)
+    in_flight = 0
+    
+    def submit_up_to_target():
+        nonlocal in_flight
+        while in_flight < autoscaler.target:
+            unit = next(pending, None)
+            if unit is None:
+                return
+            started = time.monotonic()
+            pool.apply_async(
+                worker, (unit,),
+                callback=lambda outcome, started=started: done.put((outcome, None, started)),
+                error_callback=lambda error, started=started: done.put((None, error, started))
+            )
+            in_flight += 1
+    
+    submit_up_to_target()
+    while in_flight:
+        outcome, error, started = done.get()
+        in_flight -= 1
+        if error is not None:
+            raise error
+        results = outcome if tabs_mode else [outcome]
+        for result in results:
+            # Items of a batch share the elapsed time
+            autoscaler.record((time.monotonic() - started) / len(results), is_error_record(result))
+        yield outcome
+        
+        autoscaler.adjust()
+        submit_up_to_target()
+
+
+def create_process_pool(
+    config: Dict[str, Any],
+    num_workers: int,
+    persistent_drivers: bool,
+    session_state: Optional[Dict[str, Any]] = None
+) -> Pool:
+    """
+    Start the worker processes of the process engine. With persistent drivers every process
+    starts opening its authenticated driver right away (see init_persistent_worker).
+    """
+    # Note: On Windows, multiprocessing uses 'spawn' by default which is what we want
+    if persistent_drivers:
+        return Pool(processes=num_workers, initializer=init_persistent_worker, initargs=(config, session_state))
+    return Pool(processes=num_workers)
+
+
+def batch_tasks(item_tasks: Iterable[ItemTask], size: int) -> Iterator[List[ItemTask]]:
+    """Split the tasks into consecutive batches of at most size items (one batch per multi-tab worker call)."""
+    item_tasks = iter(item_tasks)
+    while True:
+        batch = list(islice(item_tasks, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ============================================================================
+# Warm-up
+# ============================================================================
+class WorkerWarmup:
+    """
+    Start the workers of a parallel run in the background before the task list is known,
+    e.g. while the Excel file is being parsed, and hand them to iter_items_parallel.
+    
+    The warm-up does what iter_items_parallel would otherwise do before the first item runs:
+    resolve ChromeDriver, log in once (share_session) and start the engine's workers. For the
+    thread engine that is a DriverPool filled with authenticated drivers; for the process
+    engine it is the process pool, whose persistent workers open their drivers at startup.
+    
+    A warm-up is used by at most one run. If no run takes it, close() releases its workers.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        num_workers: Optional[int] = None,
+        persistent_drivers: bool = False,
+        engine: Optional[str] = None,
+        autoscale: Optional[bool] = None,
+        share_session: Optional[bool] = None
+    ):
+        """
+        Same settings as iter_items_parallel; they are fixed once the warm-up starts.
+        """
+        self.config = config
+        self.num_workers = num_workers or cpu_count()
+        self.persistent_drivers = persistent_drivers
+        self.engine = engine or config.get("parallel_engine", ParallelEngines.DEFAULT)
+        if autoscale is None:
+            autoscale = config.get("autoscale_workers", False)
+        self.share_session = config.get("share_session", False) if share_session is None else share_session
+        self.autoscaler = WorkerAutoscaler(max_workers=self.num_workers) if autoscale else None
+        # Starting worker count the workers were opened for (taken by the run instead of a new decision)
+        self.initial_workers = self.num_workers
+        self.session_state: Optional[Dict[str, Any]] = None
+        self.driver_pool: Optional[DriverPool] = None
+        self.pool: Optional[Pool] = None
+        self._thread: Optional[threading.Thread] = None
+        self._taken = False
+
+    def start(self) -> "WorkerWarmup":
+        """Start warming up on a background thread."""
+        self._thread = threading.Thread(target=self._warm_up, name="worker-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def _warm_up(self) -> None:
+        started = time.monotonic()
+        try:
+            resolve_chromedriver_path()
+        except Exception as e:
+            logging.warning(f"Could not resolve ChromeDriver up front, workers will try on their own: {e}")
+        
+        if self.share_session:
+            try:
+                self.session_state = login_once(self.config, self.autoscaler)
+            except Exception as e:
+                logging.warning(f"Login-once failed, every worker will authenticate on its own: {e}")
+        
+        try:
+            if self.engine == ParallelEngines.THREAD:
+                self.driver_pool = DriverPool(
+                    self.config,
+                    on_new_driver=self.autoscaler.observe_driver if self.autoscaler else None,
+                    session_state=self.session_state
+                )
+            if self.autoscaler:
+                self.initial_workers = calibrate_autoscaler(self.autoscaler, self.config, self.session_state,
+                                                            self.driver_pool)
+            if self.engine == ParallelEngines.THREAD:
+                self.driver_pool.prefill(self.initial_workers)
+            elif self.engine == ParallelEngines.PROCESS:
+                self.num_workers = self.initial_workers
+                self.pool = create_process_pool(self.config, self.num_workers, self.persistent_drivers,
+                                                self.session_state)
+        except Exception as e:
+            logging.warning(f"Worker warm-up failed, workers will start with the run: {e}")
+        
+        logging.info(f"Worker warm-up finished in {time.monotonic() - started:.1f}s")
+
+    def take(self) -> "WorkerWarmup":
+        """Wait until the warm-up is done and hand it over to a run, which then owns its workers."""
+        if self._taken:
+            raise RuntimeError("This worker warm-up was already used by a run")
+        if self._thread:
+            self._thread.join()
+        self._taken = True
+        return self
+
+    def close(self) -> None:
+        """Release the workers if no run took them."""
+        if self._taken:
+            return
+        self.take()
+        if self.driver_pool:
+            self.driver_pool.close()
+        if self.pool:
+            self.pool.terminate()
+            self.pool.join()
+
+
+# ============================================================================
+# Entry points
+# ============================================================================
 def process_items_parallel(
     item_tasks: List[ItemTask],
     config: Dict[str, Any],
-    num_workers: Optional[int] = None
+    num_workers: Optional[int] = None,
+    persistent_drivers: bool = False,
+    engine: Optional[str] = None,
+    autoscale: Optional[bool] = None,
+    share_session: Optional[bool] = None,
+    tabs_per_browser: Optional[int] = None,
+    warmup: Optional[WorkerWarmup] = None
 ) -> List[Dict[str, Any]]:
     """
-    Process multiple item URLs in parallel using multiprocessing.
+    Process multiple item URLs in parallel.
+    Collects everything produced by iter_items_parallel; results are in task order (see order_results).
     
     :param item_tasks: List of ItemTask objects to process
     :param config: Configuration dictionary
     :param num_workers: Number of parallel workers (defaults to CPU count)
+    :param persistent_drivers: Reuse one driver per worker process instead of one per item
+    :param engine: ParallelEngines.PROCESS or ParallelEngines.THREAD (defaults to config "parallel_engine")
+    :param autoscale: Size the workers from memory and load (defaults to config "autoscale_workers")
+    :param share_session: Log in once and inject the session into every worker (defaults to config "share_session")
+    :param tabs_per_browser: Items each worker's browser loads at once in separate tabs (defaults to config "tabs_per_browser", 1)
+    :param warmup: Optional started WorkerWarmup whose workers are used (its settings replace the ones above)
     :return: List of result dictionaries
     """
-    if not item_tasks:
-        return []
+    results = iter_items_parallel(
+        item_tasks, config, num_workers, persistent_drivers,
+        engine=engine, autoscale=autoscale, share_session=share_session, tabs_per_browser=tabs_per_browser,
+        warmup=warmup
+    )
+    return order_results(results, (task.bug_id for task in item_tasks))
+
+
+def iter_items_parallel(
+    item_tasks: Iterable[ItemTask],
+    config: Dict[str, Any],
+    num_workers: Optional[int] = None,
+    persistent_drivers: bool = False,
+    report_progress: bool = True,
+    engine: Optional[str] = None,
+    autoscale: Optional[bool] = None,
+    share_session: Optional[bool] = None,
+    tabs_per_browser: Optional[int] = None,
+    warmup: Optional[WorkerWarmup] = None,
+    total: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Process multiple item URLs in parallel and yield each result as soon as its item finishes.
     
-    # Determine number of workers
-    if num_workers is None:
-        num_workers = cpu_count()
+    Results come back in completion order (not task order), so one slow bug does not hold
+    back the others. A "PROGRESS: i/N" line is printed for every finished item, the same
+    format the sequential run emits for the WPF front end.
     
-    # Limit workers to number of tasks to avoid unnecessary overhead
-    num_workers = min(num_workers, len(item_tasks))
+    Two engines are available:
+    - ParallelEngines.PROCESS: a multiprocessing pool. By default every item gets a fresh
+      ChromeDriver; with persistent_drivers=True each pool process builds one authenticated
+      driver in the pool initializer and quits it only when the pool shuts down.
+    - ParallelEngines.THREAD: a thread pool inside this process sharing a DriverPool. Drivers
+      are always reused, and startup and memory are lower than spawning processes.
     
-    print(f"Processing {len(item_tasks)} items with {num_workers} parallel workers")
-    logging.info(f"Processing {len(item_tasks)} items with {num_workers} parallel workers")
+    With autoscale enabled, num_workers becomes an upper bound: a WorkerAutoscaler picks the
+    starting count from free memory and keeps adjusting it from the observed latency, error
+    rate and free memory. A process pool cannot grow, so the process engine starts that many
+    processes and scales between one and that count by how many items it keeps in flight.
     
-    # Prepare arguments for worker function
-    # We need to pass both task and config to each worker
-    worker_args = [(task, config) for task in item_tasks]
+    With share_session enabled, the parent logs in once on the base URL and every worker
+    driver gets that browser's cookies and storage injected, so workers skip the base URL
+    load and go straight to the item URL.
     
-    # Process items in parallel
-    # Note: On Windows, multiprocessing uses 'spawn' by default which is what we want
-    with Pool(processes=num_workers) as pool:
-        results = pool.starmap(process_single_item, worker_args)
+    With tabs_per_browser = K > 1 the run is W browsers x K tabs: each worker takes K items at
+    once, starts loading every one of them in its own tab, then reads the tabs one after another
+    while the others keep loading (see iter_items_in_tabs). Results of a batch come back together.
+    
+    With a warmup (see WorkerWarmup) the workers were started before the tasks were known,
+    so the run begins on drivers that are already open and authenticated.
+    
+    item_tasks may also be a generator (see BugMapStream): tasks are then handed to the
+    workers while it is still producing them, and total must be given.
+    
+    :param item_tasks: List (or iterable, with total) of ItemTask objects to process
+    :param config: Configuration dictionary
+    :param num_workers: Number of parallel workers (defaults to CPU count)
+    :param persistent_drivers: Reuse one driver per worker process instead of one per item (process engine)
+    :param report_progress: Print a progress line to stdout for every finished item
+    :param engine: ParallelEngines.PROCESS or ParallelEngines.THREAD (defaults to config "parallel_engine")
+    :param autoscale: Size the workers from memory and load (defaults to config "autoscale_workers")
+    :param share_session: Log in once and inject the session into every worker (defaults to config "share_session")
+    :param tabs_per_browser: Items each worker's browser loads at once in separate tabs (defaults to config "tabs_per_browser", 1)
+    :param warmup: Optional started WorkerWarmup whose workers are used (its settings replace the ones above)
+    :param total: Number of tasks, required when item_tasks is not a list
+    :return: Generator of result dictionaries
+    """
+    if total is None:
+        total = len(item_tasks)
+    if not total:
+        return
+    
+    tabs_per_browser = max(1, int(tabs_per_browser or config.get("tabs_per_browser", 1)))
+    # Limit workers to number of tasks (batches in tabs mode) to avoid unnecessary overhead
+    max_useful_workers = -(-total // tabs_per_browser)
+    
+    if warmup is not None:
+        warmup.take()
+        engine, persistent_drivers = warmup.engine, warmup.persistent_drivers
+        autoscaler, session_state = warmup.autoscaler, warmup.session_state
+        driver_pool, pool = warmup.driver_pool, warmup.pool
+        num_workers = warmup.num_workers
+        initial_workers = None
+        if driver_pool:
+            num_workers = min(num_workers, max_useful_workers)
+            # The run starts with the count the pool was filled for
+            initial_workers = min(warmup.initial_workers, num_workers)
+            # Drivers opened in advance for workers the run does not need are quit
+            driver_pool.set_max_size(num_workers)
+    else:
+        engine = engine or config.get("parallel_engine", ParallelEngines.DEFAULT)
+        if autoscale is None:
+            autoscale = config.get("autoscale_workers", False)
+        if share_session is None:
+            share_session = config.get("share_session", False)
+        
+        # Determine number of workers
+        if num_workers is None:
+            num_workers = cpu_count()
+        num_workers = min(num_workers, max_useful_workers)
+        autoscaler = WorkerAutoscaler(max_workers=num_workers) if autoscale else None
+        driver_pool, pool, initial_workers = None, None, None
+        
+        try:
+            # Workers inherit the resolved path instead of each running the installer
+            resolve_chromedriver_path()
+        except Exception as e:
+            logging.warning(f"Could not resolve ChromeDriver up front, workers will try on their own: {e}")
+        
+        session_state = None
+        if share_session:
+            try:
+                session_state = login_once(config, autoscaler)
+            except Exception as e:
+                logging.warning(f"Login-once failed, every worker will authenticate on its own: {e}")
+    
+    if engine == ParallelEngines.THREAD:
+        results = _iter_thread_engine(
+            item_tasks, config, num_workers, autoscaler, session_state, tabs_per_browser, driver_pool,
+            initial_workers
+        )
+        mode = "thread engine" + (", autoscaled" if autoscaler else "")
+    elif engine == ParallelEngines.PROCESS:
+        if autoscaler and pool is None:
+            num_workers = calibrate_autoscaler(autoscaler, config, session_state)
+        results = _iter_process_engine(
+            item_tasks, config, num_workers, persistent_drivers, session_state, tabs_per_browser, pool,
+            autoscaler
+        )
+        mode = "process engine, " + ("persistent" if persistent_drivers else "per-item") + " drivers"
+        if autoscaler:
+            mode += ", autoscaled"
+    else:
+        raise ValueError(f"Unknown parallel engine '{engine}'. Expected one of: "
+                         f"{ParallelEngines.PROCESS}, {ParallelEngines.THREAD}")
+    
+    workers_text = f"up to {num_workers}" if autoscaler else str(num_workers)
+    if warmup is not None:
+        mode += ", warmed up"
+    if tabs_per_browser > 1:
+        mode += f", {tabs_per_browser} tabs per browser"
+    print(f"Processing {total} items with {workers_text} parallel workers ({mode})")
+    logging.info(f"Processing {total} items with {workers_text} parallel workers ({mode})")
+    
+    completed = 0
+    try:
+        for result in results:
+            completed += 1
+            if report_progress:
+                print(f"{ProgressMessages.PROGRESS_PREFIX} {completed}/{total}", flush=True)
+            yield result
+    finally:
+        results.close()
     
-    print(f"Completed processing {len(results)} items")
-    logging.info(f"Completed processing {len(results)} items")
-    return results
+    print(f"Completed processing {completed} items")
+    logging.info(f"Completed processing {completed} items")
 
 
 def build_item_url(base_url: str, bug_id: str) -> str:
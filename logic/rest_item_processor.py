@@ -0,0 +1,132 @@
+"""
+REST Item Processor Module
+
+This module validates bugs by reading their fields from the Azure DevOps REST API
+(work items batch endpoint, up to 200 IDs per call) instead of scraping the work item form.
+It takes the same ItemTask input and produces the same result records as the browser flow.
+"""
+
+import logging
+from typing import Dict, List, Any, Optional, Iterator
+
+from infra.ado_rest_client import AdoRestClient, get_field_reference_names
+from logic.parallel_item_processor import ItemTask, build_error_record
+from utils.std_id_validator import build_record_from_field_values, build_result_record
+from utils.additional_info_extract_std_tc_id import html_to_text
+from utils.constants import Status, WorkItemFields, RestApi, ProgressMessages
+
+
+def field_values_from_rest(rest_fields: Dict[str, Any], reference_names: Dict[str, str]) -> Dict[str, str]:
+    """
+    Convert the "fields" object of a REST work item to the values shown on the work item form.
+
+    :param rest_fields: Field reference name -> value, as returned by the REST API
+    :param reference_names: Field name (WorkItemFields) -> reference name
+    :return: Field name (WorkItemFields) -> text value ("" when the field is not set)
+    """
+    values = {}
+    for field_name, reference_name in reference_names.items():
+        value = rest_fields.get(reference_name)
+        values[field_name] = "" if value is None else str(value)
+
+    # Rich-text field: the API returns HTML, the form shows text
+    values[WorkItemFields.ADDITIONAL_INFO] = html_to_text(values.get(WorkItemFields.ADDITIONAL_INFO, ""))
+    return values
+
+
+def build_not_found_record(task: ItemTask) -> Dict[str, Any]:
+    """Build the result record for a bug ID that the REST API did not return."""
+    return build_result_record(
+        str(task.bug_id).strip(),
+        task.test_ids,
+        Status.PLACEHOLDER,
+        Status.FAILURE,
+        Status.WORK_ITEM_NOT_FOUND,
+        Status.PLACEHOLDER,
+        Status.PLACEHOLDER,
+        Status.PLACEHOLDER
+    )
+
+
+def iter_items_rest(
+    item_tasks: List[ItemTask],
+    config: Dict[str, Any],
+    client: Optional[AdoRestClient] = None,
+    report_progress: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate bugs from the REST API and yield one result record per task.
+
+    Tasks are fetched in batches of RestApi.BATCH_SIZE; the records of a batch are yielded
+    as soon as its response arrives. A "PROGRESS: i/N" line is printed for every record.
+
+    :param item_tasks: List of ItemTask objects (only bug_id and test_ids are used)
+    :param config: Configuration dictionary
+    :param client: Optional client; by default one is built from config (see AdoRestClient.from_config)
+    :param report_progress: Print a progress line to stdout for every record
+    :return: Generator of result dictionaries
+    """
+    if not item_tasks:
+        return
+
+    own_client = client is None
+    if own_client:
+        client = AdoRestClient.from_config(config)
+    reference_names = get_field_reference_names(config)
+    total = len(item_tasks)
+    completed = 0
+
+    print(f"Processing {total} items through the REST API ({client.organization_url}/{client.project})")
+    logging.info(f"Processing {total} items through the REST API ({client.organization_url}/{client.project})")
+
+    try:
+        for start in range(0, total, RestApi.BATCH_SIZE):
+            chunk = item_tasks[start:start + RestApi.BATCH_SIZE]
+            ids = [int(str(task.bug_id).strip()) for task in chunk if str(task.bug_id).strip().isdigit()]
+
+            try:
+                work_items = client.get_work_items(ids, list(reference_names.values())) if ids else {}
+                error = None
+            except Exception as e:
+                logging.error(f"REST batch request failed for {len(ids)} work items: {e}")
+                work_items, error = {}, e
+
+            for task in chunk:
+                bug_id_str = str(task.bug_id).strip()
+                if not bug_id_str.isdigit():
+                    # Reported as "Invalid bug number", like the browser flow
+                    result = build_record_from_field_values(bug_id_str, task.test_ids, {}, config)
+                elif error:
+                    result = build_error_record(task, error)
+                elif int(bug_id_str) not in work_items:
+                    result = build_not_found_record(task)
+                else:
+                    fields = field_values_from_rest(work_items[int(bug_id_str)], reference_names)
+                    result = build_record_from_field_values(bug_id_str, task.test_ids, fields, config)
+
+                completed += 1
+                if report_progress:
+                    print(f"{ProgressMessages.PROGRESS_PREFIX} {completed}/{total}", flush=True)
+                yield result
+    finally:
+        if own_client:
+            client.close()
+
+    print(f"Completed processing {completed} items")
+    logging.info(f"Completed processing {completed} items")
+
+
+def process_items_rest(
+    item_tasks: List[ItemTask],
+    config: Dict[str, Any],
+    client: Optional[AdoRestClient] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate bugs from the REST API. Collects everything produced by iter_items_rest.
+
+    :param item_tasks: List of ItemTask objects (only bug_id and test_ids are used)
+    :param config: Configuration dictionary
+    :param client: Optional client; by default one is built from config
+    :return: List of result dictionaries
+    """
+    return list(iter_items_rest(item_tasks, config, client))
@@ -1,9 +1,14 @@
+import re
+import logging
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
 from utils.utils import safe_click
-from utils.constants import Timeouts
+from utils.additional_info_extract_std_tc_id import html_to_text
+from utils.constants import Timeouts, WorkItemFields
 from infra.base_page import BasePage
 
 
@@ -17,6 +22,57 @@ class WorkItem(BasePage):
     LAST_REPRODUCED_IN_FIELD = 'input[aria-label="LastRepreducedIn"]'
     ITERATION_PATH_FIELD = 'input.treepicker-item-title-input[readonly][aria-label="Iteration Path"]'
 
+    # Every field read by read_fields, keyed by its WorkItemFields name
+    FIELD_LOCATORS = {
+        WorkItemFields.STD_ID: STD_ID_FIELD,
+        WorkItemFields.STD_NAME: STD_NAME_FIELD,
+        WorkItemFields.LAST_REPRODUCED_IN: LAST_REPRODUCED_IN_FIELD,
+        WorkItemFields.ITERATION_PATH: ITERATION_PATH_FIELD,
+        WorkItemFields.ADDITIONAL_INFO: ADDITIONAL_INFO_FILED,
+    }
+
+    # Inputs give their value, other controls their rendered text. A control that is not in
+    # the DOM gives null; so does a text control that is not displayed (e.g. on a hidden tab),
+    # because its text would lose the line breaks the form shows.
+    READ_FIELDS_SCRIPT = """
+        var locators = arguments[0];
+        var values = {};
+        Object.keys(locators).forEach(function (name) {
+            var element = document.querySelector(locators[name]);
+            if (!element) {
+                values[name] = null;
+            } else if (element.tagName === 'INPUT' || element.tagName === 'TEXTAREA') {
+                values[name] = element.value;
+            } else {
+                values[name] = element.offsetParent !== null ? element.innerText : null;
+            }
+        });
+        return values;
+    """
+
+    # Fetches a REST URL with the page's own sign-in cookies; returns the work item "fields" object,
+    # or null on any error so the caller can fall back to the form
+    FETCH_FIELDS_SCRIPT = """
+        var url = arguments[0];
+        var done = arguments[arguments.length - 1];
+        var controller = new AbortController();
+        var timer = setTimeout(function () { controller.abort(); }, arguments[1]);
+        fetch(url, {credentials: 'include', headers: {'Accept': 'application/json'}, signal: controller.signal})
+            .then(function (response) { return response.ok ? response.json() : null; })
+            .then(function (body) { clearTimeout(timer); done(body ? (body.fields || {}) : null); })
+            .catch(function () { clearTimeout(timer); done(null); });
+    """
+
+    # The form is rendered once its STD ID control is displayed and the Iteration Path control
+    # holds a value (every work item has an iteration path, so it is never legitimately empty)
+    FORM_READY_SCRIPT = """
+        var stdId = document.querySelector(arguments[0]);
+        var iterationPath = document.querySelector(arguments[1]);
+        return document.readyState === 'complete'
+            && !!stdId && stdId.offsetParent !== null
+            && !!iterationPath && !!iterationPath.value;
+    """
+
     def __init__(self, driver):
         """
         Initializes the BoardPage with the provided WebDriver instance.
@@ -24,6 +80,63 @@ class WorkItem(BasePage):
         """
         super().__init__(driver)
 
+    def wait_until_work_item_shown(self, bug_id, timeout: int = Timeouts.SPA_NAVIGATION_TIMEOUT) -> bool:
+        """
+        Wait until the page shows the given work item: the window title starts with "<Type> <id>:"
+        (e.g. "Bug 1234: ...") and its form is ready. Used after client-side navigation, where the
+        previous work item stays on screen until the new one is loaded.
+        Returns False instead of raising when the timeout passes.
+        """
+        title_pattern = re.compile(rf"(^|\s){re.escape(str(bug_id))}:")
+        try:
+            WebDriverWait(self._driver, timeout, poll_frequency=Timeouts.POLL_FREQUENCY).until(
+                lambda d: title_pattern.search(d.title or "")
+                and d.execute_script(self.FORM_READY_SCRIPT, self.STD_ID_FIELD, self.ITERATION_PATH_FIELD)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_until_form_ready(self, timeout: int = Timeouts.PAGE_READY_TIMEOUT) -> bool:
+        """
+        Wait until the work item form has rendered its field controls with their values.
+        Returns False instead of raising when the timeout passes; the field getters then
+        wait (and fail) on their own.
+        """
+        try:
+            WebDriverWait(self._driver, timeout, poll_frequency=Timeouts.POLL_FREQUENCY).until(
+                lambda d: d.execute_script(self.FORM_READY_SCRIPT, self.STD_ID_FIELD, self.ITERATION_PATH_FIELD)
+            )
+            return True
+        except TimeoutException:
+            logging.warning(f"Work item form not ready after {timeout}s, reading the fields anyway")
+            return False
+
+    def read_fields(self):
+        """
+        Read every field of FIELD_LOCATORS in a single script call, without waiting.
+        Call wait_until_form_ready first.
+        :return: dict keyed by WorkItemFields names; the value is None when the control was not found
+                 (AdditionalInfo is only found while its tab is displayed)
+        """
+        return self._driver.execute_script(self.READ_FIELDS_SCRIPT, self.FIELD_LOCATORS)
+
+    def get_rich_text_field_from_api(self, api_url, reference_name):
+        """
+        Read a rich-text field (e.g. AdditionalInfo) through the REST API from inside the signed-in page,
+        so no tab has to be opened and rendered. The page's cookies authenticate the request.
+        :param api_url: Work item REST URL requesting the field (see get_work_item_api_url)
+        :param reference_name: Reference name of the field, e.g. Custom.AdditionalInfo
+        :return: The field as the form shows it (plain text, "" when empty), or None if the request failed
+        """
+        self._driver.set_script_timeout(Timeouts.IN_PAGE_FETCH_TIMEOUT + Timeouts.SHORT_TIMEOUT)
+        fields = self._driver.execute_async_script(
+            self.FETCH_FIELDS_SCRIPT, api_url, Timeouts.IN_PAGE_FETCH_TIMEOUT * 1000
+        )
+        if fields is None:
+            return None
+        return html_to_text(fields.get(reference_name) or "")
+
     def get_std_id_value(self):
         """
         Wait for the STD_ID input field to be visible and return its current value attribute.
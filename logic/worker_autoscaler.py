@@ -0,0 +1,202 @@
+"""
+Worker Autoscaler Module
+
+Picks the number of parallel ChromeDriver workers from the free memory of the machine and the
+measured memory of one Chrome, then adjusts it during the run from the observed per-item
+latency and error rate. Every scaling decision is logged.
+"""
+
+import sys
+import ctypes
+import logging
+import statistics
+from typing import List, Optional, Tuple
+
+from utils.constants import Autoscaling
+
+try:
+    import psutil
+except ImportError:  # psutil is optional; memory is then read from the OS directly
+    psutil = None
+
+
+def get_available_memory_mb() -> Optional[float]:
+    """
+    Return the memory currently available to new processes, in MB, or None if unknown.
+    """
+    if psutil is not None:
+        return psutil.virtual_memory().available / (1024 * 1024)
+
+    if sys.platform == "win32":
+        class MemoryStatusEx(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MemoryStatusEx()
+        status.dwLength = ctypes.sizeof(MemoryStatusEx)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys / (1024 * 1024)
+        return None
+
+    try:
+        with open("/proc/meminfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def can_measure_driver_memory() -> bool:
+    """True if the memory of a driver can be measured (psutil is installed)."""
+    return psutil is not None
+
+
+def measure_driver_memory_mb(driver) -> Optional[float]:
+    """
+    Return the resident memory of a ChromeDriver and all the Chrome processes it started, in MB.
+    Requires psutil; returns None when it is not installed or the processes cannot be read.
+    """
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception as e:
+        logging.warning(f"[Autoscaler] Could not measure driver memory: {e}")
+        return None
+
+
+class WorkerAutoscaler:
+    """
+    Chooses and adjusts the number of parallel workers.
+
+    - The starting count is what fits in free memory (minus a reserve) at the per-driver memory,
+      measured on one authenticated driver (see calibrate_autoscaler in parallel_item_processor).
+      Without psutil nothing can be measured and the count rests on DEFAULT_DRIVER_MEMORY_MB.
+    - While the run progresses, results are recorded with record(); every few items adjust()
+      removes a worker when errors or latency degrade, and adds one while latency stays close
+      to the best observed and memory allows it.
+    """
+
+    def __init__(self, max_workers: int, min_workers: int = Autoscaling.MIN_WORKERS):
+        """
+        :param max_workers: Upper bound for the number of workers
+        :param min_workers: Lower bound for the number of workers
+        """
+        self.max_workers = max(1, max_workers)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        self.driver_memory_mb = float(Autoscaling.DEFAULT_DRIVER_MEMORY_MB)
+        # False while driver_memory_mb is the default estimate
+        self.measured = False
+        self.target = self.min_workers
+
+        self._samples: List[Tuple[float, bool]] = []
+        self._best_latency: Optional[float] = None
+
+    # ---------- Memory ----------
+    def memory_limit(self, running_workers: int = 0) -> int:
+        """
+        Return how many workers fit in memory, counting the ones already running.
+
+        :param running_workers: Workers whose drivers are already included in used memory
+        """
+        available_mb = get_available_memory_mb()
+        if available_mb is None:
+            return self.max_workers
+        spare_mb = available_mb - Autoscaling.MEMORY_RESERVE_MB
+        # Negative when memory is already below the reserve, which removes running workers
+        return max(0, running_workers + int(spare_mb // self.driver_memory_mb))
+
+    def initial_workers(self, running_workers: int = 0) -> int:
+        """
+        Pick the starting number of workers and log the decision.
+
+        :param running_workers: Drivers already open (e.g. the one measured), included in used memory
+        """
+        limit = self.memory_limit(running_workers)
+        self.target = max(self.min_workers, min(self.max_workers, limit))
+        if self.measured:
+            per_driver = f"{self.driver_memory_mb:.0f} MB per driver (measured)"
+        elif can_measure_driver_memory():
+            per_driver = f"{self.driver_memory_mb:.0f} MB per driver (estimate, no driver could be measured)"
+        else:
+            per_driver = f"{self.driver_memory_mb:.0f} MB per driver (fixed estimate, psutil is not installed)"
+        logging.info(
+            f"[Autoscaler] Starting with {self.target} workers "
+            f"(memory allows {limit} at {per_driver}, max {self.max_workers})"
+        )
+        return self.target
+
+    def observe_driver(self, driver) -> None:
+        """
+        Measure a freshly opened driver. The first measurement replaces the default estimate;
+        later ones only raise it.
+        """
+        measured_mb = measure_driver_memory_mb(driver)
+        if measured_mb:
+            self.driver_memory_mb = max(self.driver_memory_mb, measured_mb) if self.measured else measured_mb
+            self.measured = True
+            logging.info(f"[Autoscaler] Measured {measured_mb:.0f} MB per driver")
+
+    # ---------- Run-time scaling ----------
+    def record(self, latency: float, failed: bool) -> None:
+        """
+        Record one finished item.
+
+        :param latency: Wall-clock seconds the item took
+        :param failed: True if the item ended with a processing error
+        """
+        self._samples.append((latency, failed))
+
+    def adjust(self) -> int:
+        """
+        Re-evaluate the worker count once enough items finished since the last decision.
+        :return: The (possibly unchanged) target number of workers
+        """
+        window = max(Autoscaling.DECISION_WINDOW_PER_WORKER * self.target, 1)
+        if len(self._samples) < window:
+            return self.target
+
+        samples, self._samples = self._samples, []
+        latency = statistics.median(latency for latency, _ in samples)
+        error_rate = sum(1 for _, failed in samples if failed) / len(samples)
+        if self._best_latency is None or latency < self._best_latency:
+            self._best_latency = latency
+
+        memory_limit = self.memory_limit(running_workers=self.target)
+        stats = f"median latency {latency:.1f}s (best {self._best_latency:.1f}s), error rate {error_rate:.0%}"
+
+        if error_rate > Autoscaling.MAX_ERROR_RATE:
+            self._scale_to(self.target - 1, f"error rate above {Autoscaling.MAX_ERROR_RATE:.0%}; {stats}")
+        elif latency > self._best_latency * Autoscaling.LATENCY_DEGRADATION_FACTOR:
+            self._scale_to(self.target - 1, f"latency degraded; {stats}")
+        elif memory_limit < self.target:
+            self._scale_to(memory_limit, f"free memory only fits {memory_limit} workers; {stats}")
+        elif latency <= self._best_latency * Autoscaling.LATENCY_HEADROOM_FACTOR and self.target < memory_limit:
+            self._scale_to(self.target + 1, f"latency healthy; {stats}")
+        else:
+            logging.info(f"[Autoscaler] Keeping {self.target} workers; {stats}")
+
+        return self.target
+
+    def _scale_to(self, workers: int, reason: str) -> None:
+        """Clamp the new worker count to the bounds and log the decision."""
+        workers = max(self.min_workers, min(self.max_workers, workers))
+        if workers == self.target:
+            logging.info(f"[Autoscaler] Keeping {self.target} workers (at limit); {reason}")
+            return
+        direction = "up" if workers > self.target else "down"
+        logging.info(f"[Autoscaler] Scaling {direction} from {self.target} to {workers} workers: {reason}")
+        self.target = workers
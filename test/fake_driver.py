@@ -0,0 +1,41 @@
+import threading
+
+
+class FakeDriver:
+    """
+    ChromeDriver stand-in for the parallel engine tests: no browser and no local service (the
+    watchdog kills it by calling quit). It answers like a live session until it is quit, and
+    records the tabs it opens and the scripts and DevTools commands sent to each tab.
+    """
+
+    def __init__(self, url=""):
+        self.url = url
+        self.window_handles = ["tab-1"]
+        self.current = "tab-1"
+        self.switch_to = self
+        self.commands = []
+        self.scripts = []
+        self.killed = threading.Event()
+
+    @property
+    def current_url(self):
+        if self.killed.is_set():
+            raise RuntimeError("invalid session id")
+        return self.url
+
+    def quit(self):
+        self.killed.set()
+
+    def new_window(self, kind):
+        self.current = f"tab-{len(self.window_handles) + 1}"
+        self.window_handles.append(self.current)
+
+    def window(self, handle):
+        self.current = handle
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((self.current, command))
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scripts.append((self.current, args))
@@ -0,0 +1,157 @@
+import json, base64, threading, unittest
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from infra.ado_rest_client import AdoRestClient, parse_ado_url
+from logic.parallel_item_processor import ItemTask
+from logic.rest_item_processor import process_items_rest
+from logic.async_rest_fetcher import iter_items_async_rest
+
+from utils.constants import Status, WorkItemFields
+
+PAT = "stub-token"
+FIELDS = WorkItemFields.DEFAULT_REFERENCE_NAMES
+CONFIG = {
+    "url": "",
+    "current_version": "v2.1.0",
+    "iteration_path": "Project/Sprint 7",
+    "std_name": "Feather STD",
+}
+
+
+def make_work_item(work_item_id, std_id, additional_info="", rev=3):
+    return {
+        "id": work_item_id,
+        "rev": rev,
+        "fields": {
+            "System.Rev": rev,
+            "System.ChangedDate": "2025-01-01T00:00:00Z",
+            FIELDS[WorkItemFields.STD_ID]: std_id,
+            FIELDS[WorkItemFields.STD_NAME]: CONFIG["std_name"],
+            FIELDS[WorkItemFields.LAST_REPRODUCED_IN]: CONFIG["current_version"],
+            FIELDS[WorkItemFields.ITERATION_PATH]: "Project/Legacy",
+            FIELDS[WorkItemFields.ADDITIONAL_INFO]: additional_info,
+        },
+    }
+
+
+class StubAdoHandler(BaseHTTPRequestHandler):
+    """Serves the work items endpoints from StubAdoHandler.work_items."""
+    work_items = {}
+    requests = []
+    # Work item ID -> number of 429 responses to send before answering
+    throttled = {}
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        StubAdoHandler.requests.append({"path": self.path, "auth": self.headers.get("Authorization"), "body": body})
+
+        value = [self.work_items.get(i) for i in body["ids"]]
+        payload = json.dumps({"count": len(value), "value": value}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        work_item_id = int(urlsplit(self.path).path.rsplit("/", 1)[1])
+        StubAdoHandler.requests.append({"path": self.path, "auth": self.headers.get("Authorization")})
+
+        if StubAdoHandler.throttled.get(work_item_id):
+            StubAdoHandler.throttled[work_item_id] -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        work_item = self.work_items.get(work_item_id)
+        payload = json.dumps(work_item).encode("utf-8") if work_item else b""
+        self.send_response(200 if work_item else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAdoRestClient(unittest.TestCase):
+    def setUp(self):
+        StubAdoHandler.requests = []
+        StubAdoHandler.work_items = {}
+        StubAdoHandler.throttled = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubAdoHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.config = dict(CONFIG, url=f"http://127.0.0.1:{self.server.server_port}/org/Project/_workitems")
+        organization_url, project = parse_ado_url(self.config["url"])
+        self.client = AdoRestClient(organization_url, project, PAT)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_parse_ado_url(self):
+        self.assertEqual(parse_ado_url("https://dev.azure.com/my-org/My%20Project/_workitems/edit/12"),
+                         ("https://dev.azure.com/my-org", "My%20Project"))
+        self.assertEqual(parse_ado_url("https://my-org.visualstudio.com/Proj/_workitems"),
+                         ("https://my-org.visualstudio.com", "Proj"))
+        self.assertEqual(parse_ado_url("https://tfs.local/tfs/Coll/Proj/_queries"),
+                         ("https://tfs.local/tfs/Coll", "Proj"))
+
+    def test_batches_of_200_with_pat_auth(self):
+        StubAdoHandler.work_items = {i: make_work_item(i, "1") for i in range(1, 451)}
+
+        work_items = self.client.get_work_items(range(1, 451), list(FIELDS.values()))
+
+        self.assertEqual(len(work_items), 450)
+        self.assertEqual([len(r["body"]["ids"]) for r in StubAdoHandler.requests], [200, 200, 50])
+        expected_auth = "Basic " + base64.b64encode(f":{PAT}".encode()).decode()
+        self.assertTrue(all(r["auth"] == expected_auth for r in StubAdoHandler.requests))
+        self.assertTrue(StubAdoHandler.requests[0]["path"].startswith("/org/Project/_apis/wit/workitemsbatch"))
+
+    def test_records_match_browser_flow(self):
+        StubAdoHandler.work_items = {
+            101: make_work_item(101, "11, 12"),
+            102: make_work_item(102, "", "<div>Feather - Unique Functionality STD</div><div>21, 22</div>"),
+            103: make_work_item(103, "31"),
+        }
+        tasks = [
+            ItemTask(url="", bug_id="101", test_ids=[11, 12]),
+            ItemTask(url="", bug_id="102", test_ids=[21, 22]),
+            ItemTask(url="", bug_id="103", test_ids=[39]),
+            ItemTask(url="", bug_id="104", test_ids=[41]),
+            ItemTask(url="", bug_id="abc", test_ids=[51]),
+        ]
+
+        results = {r["Bug ID"]: r for r in process_items_rest(tasks, self.config, self.client)}
+
+        self.assertEqual(results["101"]["Test Case ID Status"], Status.SUCCESS)
+        self.assertEqual(results["101"]["Iteration Path Status"], Status.SUCCESS)
+        self.assertEqual(results["101"]["STD Name Status"], Status.SUCCESS)
+        self.assertEqual(results["102"]["STD ID in VSTS"], "21, 22")
+        self.assertEqual(results["102"]["Comments"], Status.MATCH)
+        self.assertEqual(results["103"]["Comments"], Status.TC_IDS_DONT_MATCH)
+        self.assertEqual(results["104"]["Comments"], Status.WORK_ITEM_NOT_FOUND)
+        self.assertEqual(results["abc"]["Test Case ID Status"], Status.PLACEHOLDER)
+        self.assertEqual(len(StubAdoHandler.requests), 1)
+
+    def test_async_fetcher_retries_throttled_requests(self):
+        StubAdoHandler.work_items = {i: make_work_item(i, str(i)) for i in range(1, 41)}
+        StubAdoHandler.throttled = {3: 2, 7: 1}
+        tasks = [ItemTask(url="", bug_id=str(i), test_ids=[i]) for i in range(1, 43)]
+
+        results = list(iter_items_async_rest(tasks, self.config, self.client, concurrency=8, report_progress=False))
+
+        by_id = {r["Bug ID"]: r for r in results}
+        self.assertEqual(len(results), 42)
+        self.assertTrue(all(by_id[str(i)]["Test Case ID Status"] == Status.SUCCESS for i in range(1, 41)))
+        self.assertEqual(by_id["41"]["Comments"], Status.WORK_ITEM_NOT_FOUND)
+        self.assertEqual(len(StubAdoHandler.requests), 42 + 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os, tempfile, unittest
+from datetime import datetime
+
+import pandas as pd
+from openpyxl import Workbook
+
+from infra.std_cache import StdCache
+from infra.working_with_exel import get_bug_to_tests_map, get_bug_to_tests_map_from_df, load_std_table, BugMapStream
+
+ROWS = [
+    (101, "Login", "1234", "Pass"),
+    (102, "Logout", "1234, 5678", "Fail"),
+    (103, "Settings", None, "Pass"),
+    (104, "Profile", 5678.0, "Fail"),
+    (105, "Search", "  ", "Fail"),
+    (106, "Export", "1234", "Fail"),
+    (107, "Import", "abc", "Fail"),
+    (108, "Print", 9999, "Fail"),
+]
+
+
+class TestBugMapStream(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path = os.path.join(self.temp_dir.name, "std.xlsx")
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["ID", "Headline", "Defect No", "Test Results"])
+        for row in ROWS:
+            sheet.append(row)
+        workbook.create_sheet("Notes").append(["Not", "the", "STD"])
+        workbook.save(self.excel_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_std(self, name, rows):
+        path = os.path.join(self.temp_dir.name, name)
+        workbook = Workbook()
+        workbook.active.append(["ID", "Headline", "Defect No", "Test Results"])
+        for row in rows:
+            workbook.active.append(row)
+        workbook.save(path)
+        return path
+
+    def write_dated_std(self, iso_dates):
+        """STD with date cells in the bug and ID columns, stored as serials or as ISO text (t="d")."""
+        path = os.path.join(self.temp_dir.name, f"dated-{iso_dates}.xlsx")
+        workbook = Workbook()
+        workbook.iso_dates = iso_dates
+        sheet = workbook.active
+        sheet.append(["ID", "Headline", "Defect No", "Test Results"])
+        sheet.append((101, "Login", "1234", "Fail"))
+        sheet.append((102, "Logout", datetime(2024, 1, 1), "Fail"))
+        sheet.append((datetime(2024, 2, 3, 4, 5), "Search", 1234, "Fail"))
+        workbook.save(path)
+        return path
+
+    def test_same_map_as_loaded_table(self):
+        stream = BugMapStream(self.excel_path)
+
+        self.assertEqual(len(stream), 4)
+        self.assertEqual(stream.bug_ids, list(get_bug_to_tests_map(self.excel_path)))
+        self.assertEqual(dict(stream), get_bug_to_tests_map(self.excel_path))
+
+    def test_date_cells_are_read_like_openpyxl(self):
+        for iso_dates in (False, True):
+            with self.subTest(iso_dates=iso_dates):
+                path = self.write_dated_std(iso_dates)
+
+                # The date in the bug column is not a bug; the date in the ID column stays a datetime
+                self.assertEqual(dict(BugMapStream(path)), {"1234": [101, datetime(2024, 2, 3, 4, 5)]})
+                self.assertEqual(dict(BugMapStream(path)), get_bug_to_tests_map(path))
+
+    def test_na_strings_are_empty_bug_cells(self):
+        path = self.write_std("na.xlsx", [
+            (101, "Login", "1234", "Fail"),
+            (102, "Logout", "N/A", "Pass"),
+            (103, "Settings", "None", "Pass"),
+            (104, "Profile", "NA", "Pass"),
+            (105, "Search", "1234, 5678", "Fail"),
+            (106, "Export", " N/A ", "Fail"),
+        ])
+        # pandas.read_excel only empties a cell that is exactly an NA string
+        expected = {"1234": [101, 105], "5678": [105], "N/A": [106]}
+
+        self.assertEqual(get_bug_to_tests_map_from_df(pd.read_excel(path)), expected)
+        self.assertEqual(get_bug_to_tests_map(path), expected)
+        self.assertEqual(dict(BugMapStream(path)), expected)
+        cache = StdCache(os.path.join(self.temp_dir.name, "cache"))
+        cache.save_table(path, load_std_table(path))
+        self.assertEqual(cache.get_bug_map(path), expected)
+
+    def test_bug_is_yielded_after_its_last_row(self):
+        self.assertEqual(list(BugMapStream(self.excel_path)), [
+            ("5678", [102, 104]),
+            ("1234", [101, 102, 106]),
+            ("abc", [107]),
+            ("9999", [108]),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,43 +1,98 @@
-import os, ssl, time, unittest
+import os, ssl, unittest
+from concurrent.futures import ThreadPoolExecutor
 
+from infra.std_cache import StdCache
 from infra.base_page import BasePage
 from infra.config_provider import ConfigProvider
 from infra.browser_wrapper import BrowserWrapper
-from infra.working_with_exel import get_bug_to_tests_map, validate_and_summarize
+from infra.working_with_exel import get_bug_to_tests_map, validate_and_summarize, BugMapStream
 
 from logic.work_item import WorkItem
 from logic.base_page_app import BasePageApp
 from logic.work_items_search import WorkItemsSearch
-from logic.parallel_item_processor import ItemTask
+from logic.parallel_item_processor import ItemTask, WorkerWarmup, is_error_record, build_record_from_form
 
+from utils.results_journal import ResultsJournal
 from utils.report_automation_results import export_automation_results_html
-from utils.std_id_validator import validate_std_id, build_result_record
-from utils.additional_info_extract_std_tc_id import extract_tc_ids_from_additional_info
+from utils.std_id_validator import build_result_record
 from utils.constants import (
-    Timeouts, Status, STDConstants, APP_DATA_FOLDER_NAME, 
-    CONFIG_FILE_NAME, ProgressMessages
+    Status, APP_DATA_FOLDER_NAME,
+    CONFIG_FILE_NAME, ProgressMessages, FetchBackends
 )
 
 
 class TestBugSTDValidation(unittest.TestCase):
+    # Set by --resume: skip the bugs already written to the results journal by the previous run
+    resume = False
+
     def setUp(self):
         """
          Initialize test environment: load config, start browser, fetch bug map and Excel violations.
         """
         ssl._create_default_https_context = ssl._create_unverified_context
         self.config = ConfigProvider.load_config_json()
+        self.fetch_backend = self.config.get("fetch_backend", FetchBackends.DEFAULT)
         self.browser = BrowserWrapper()
-        self.driver = self.browser.get_driver(self.config["url"])
-        self.bug_map_dict = get_bug_to_tests_map(self.config["excel_path"])
+        # The REST backend reads the fields over HTTP and does not need a browser
+        self.driver = None
+        self.warmup = None
+        use_browser = self.fetch_backend == FetchBackends.BROWSER
+        use_parallel = self.config.get("use_parallel_processing", False)
+
+        if use_browser and use_parallel and self.config.get("prewarm_workers", True):
+            # The parallel workers start and log in while the Excel file is parsed
+            self.warmup = WorkerWarmup(
+                self.config,
+                num_workers=self.config.get("parallel_workers", None),
+                persistent_drivers=self.config.get("persistent_worker_drivers", False)
+            ).start()
+            self.addCleanup(self.warmup.close)
+
+        # The parallel browser run hands each bug to the workers as soon as its rows are read.
+        # Resumed and cached runs filter the whole bug list first, so they load it up front.
+        # A bug map (or table) already in the STD cache loads faster than any stream.
+        self.bug_stream = None
+        self.bug_map_dict = None
+        std_cache = StdCache() if self.config.get("std_cache", True) else None
+        cached_bug_map = std_cache.get_bug_map(self.config["excel_path"]) if std_cache else None
+        stream_bugs = (cached_bug_map is None and use_browser and use_parallel and not self.resume
+                       and not self.config.get("use_work_item_cache", False)
+                       and self.config.get("stream_std_rows", True)
+                       and self.config["excel_path"].lower().endswith((".xlsx", ".xlsm")))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The sequential browser starts while the Excel file is parsed
+            browser_ready = executor.submit(self.start_browser) if use_browser and not use_parallel else None
+            try:
+                if stream_bugs:
+                    self.bug_stream = BugMapStream(self.config["excel_path"])
+                elif cached_bug_map is not None:
+                    self.bug_map_dict = cached_bug_map
+                else:
+                    self.bug_map_dict = get_bug_to_tests_map(self.config["excel_path"], cache=std_cache)
+            finally:
+                if browser_ready:
+                    self.driver = browser_ready.result()
+        self.journal = ResultsJournal.for_excel(self.config["excel_path"])
 
         self.last_reproduced_in_config = self.config["current_version"]
         self.iteration_path_config = self.config["iteration_path"]
         self.std_name_config = self.config.get("std_name", "")
 
-        base_page = BasePage(self.driver)
+    def start_browser(self):
+        """
+         Open the browser used by the sequential run on the configured URL and wait for the app.
+        """
+        driver = self.browser.get_driver(
+            self.config["url"],
+            lean=self.config.get("lean_browser", False),
+            report_savings=self.config.get("lean_browser_report", False)
+        )
+        base_page = BasePage(driver)
         base_page.navigate_with_retry(self.config["url"])
 
-        time.sleep(Timeouts.PAGE_LOAD_SLEEP)
+        BasePageApp(driver).wait_until_app_ready()
+        return driver
 
     def tearDown(self):
         """
@@ -48,8 +103,12 @@ class TestBugSTDValidation(unittest.TestCase):
     def test_unique_bugs_std_id(self):
         """
          Validate each bug's STD_ID against expected Test Case IDs and generate HTML report.
-         Uses parallel processing if configured, otherwise sequential.
+         Uses the REST backend or parallel processing if configured, otherwise sequential.
         """
+        if self.fetch_backend in (FetchBackends.REST, FetchBackends.REST_ASYNC):
+            self.test_unique_bugs_std_id_rest()
+            return
+
         # Check if parallel processing is enabled
         use_parallel = self.config.get("use_parallel_processing", False)
         
@@ -73,16 +132,14 @@ class TestBugSTDValidation(unittest.TestCase):
         total_bugs = len(self.bug_map_dict)
         print(f"{ProgressMessages.PROGRESS_TOTAL_PREFIX} {total_bugs}", flush=True)
 
-        try:
-            # --- NEW: Iterate with index to emit progress ---
-            for index, (bug_id, test_ids) in enumerate(self.bug_map_dict.items(), start=1):
-                opened = self.process_single_bug(bug_id, test_ids, work_item, work_items_search, results)
+        item_tasks = [ItemTask(url="", bug_id=bug_id, test_ids=test_ids) for bug_id, test_ids in self.bug_map_dict.items()]
 
-                # --- NEW: Emit live progress to stdout ---
-                print(f"{ProgressMessages.PROGRESS_PREFIX} {index}/{total_bugs}", flush=True)
+        def fetch(tasks, report_progress):
+            return self.iter_bugs_sequential(tasks, work_item, work_items_search, report_progress)
 
-                if opened:
-                    BasePageApp(self.driver).close_current_bug_button()
+        try:
+            for result in self.iter_results(item_tasks, fetch):
+                results.append(result)
 
         finally:
             if results:
@@ -94,51 +151,181 @@ class TestBugSTDValidation(unittest.TestCase):
 
     def test_unique_bugs_std_id_parallel(self):
         """
-        Parallel version: Validate each bug's STD_ID using multiprocessing with direct URL navigation.
+        Parallel version: Validate each bug's STD_ID on the configured parallel engine with direct URL navigation.
         Much faster than sequential processing.
         """
-        from logic.parallel_item_processor import (
-            process_items_parallel,
-            build_item_url
-        )
+        from logic.parallel_item_processor import iter_items_parallel, order_results
         
+        total_bugs = len(self.bug_stream) if self.bug_stream is not None else len(self.bug_map_dict)
+
         # Check if there are no bugs to process
-        if not self.bug_map_dict:
+        if not total_bugs:
             print(ProgressMessages.NO_BUGS_FOUND)
             export_automation_results_html([])
             return
         
-        total_bugs = len(self.bug_map_dict)
         print(f"{ProgressMessages.PROGRESS_TOTAL_PREFIX} {total_bugs}", flush=True)
         
-        # Build item URLs from bug IDs using base URL
+        if self.bug_stream is not None:
+            # Tasks are produced while the rest of the Excel file is read
+            item_tasks = self.iter_item_tasks(self.bug_stream)
+        else:
+            item_tasks = self.build_item_tasks()
+        
+        # Get number of workers from config, or use default (CPU count)
+        num_workers = self.config.get("parallel_workers", None)
+        
+        # Process in parallel; results stream back (with PROGRESS lines) as each bug finishes
+        def fetch(tasks, report_progress):
+            return iter_items_parallel(
+                item_tasks=tasks,
+                config=self.config,
+                num_workers=num_workers,
+                persistent_drivers=self.config.get("persistent_worker_drivers", False),
+                report_progress=report_progress,
+                warmup=self.warmup,
+                total=total_bugs if self.bug_stream is not None else None
+            )
+
+        results = []
+        try:
+            for result in self.iter_results(item_tasks, fetch):
+                results.append(result)
+        finally:
+            # Export results, in the order of the Excel file rather than the order they finished in
+            if results:
+                bug_ids = self.bug_stream.bug_ids if self.bug_stream is not None else self.bug_map_dict
+                export_automation_results_html(order_results(results, bug_ids))
+            
+            print(ProgressMessages.PROCESS_FINISHED, flush=True)
+
+    def test_unique_bugs_std_id_rest(self):
+        """
+        REST version: Validate each bug's STD_ID with fields read from the Azure DevOps REST API.
+        No browser is involved; work items are fetched in batches of up to 200 ("rest"),
+        or one request per bug with many requests in flight ("rest_async").
+        """
+        from logic.rest_item_processor import iter_items_rest
+        from logic.async_rest_fetcher import iter_items_async_rest
+
+        # Check if there are no bugs to process
+        if not self.bug_map_dict:
+            print(ProgressMessages.NO_BUGS_FOUND)
+            export_automation_results_html([])
+            return
+
+        total_bugs = len(self.bug_map_dict)
+        print(f"{ProgressMessages.PROGRESS_TOTAL_PREFIX} {total_bugs}", flush=True)
+
+        results = []
+        try:
+            iter_items = iter_items_async_rest if self.fetch_backend == FetchBackends.REST_ASYNC else iter_items_rest
+
+            def fetch(tasks, report_progress):
+                return iter_items(tasks, self.config, report_progress=report_progress)
+
+            for result in self.iter_results(self.build_item_tasks(), fetch):
+                results.append(result)
+        finally:
+            if results:
+                export_automation_results_html(results)
+
+            print(ProgressMessages.PROCESS_FINISHED, flush=True)
+
+    def iter_results(self, item_tasks, fetch):
+        """
+        Run fetch(tasks, report_progress) on the item tasks and write every record to the results journal.
+        With --resume, bugs already in the journal are taken from it instead of being fetched again.
+        With use_work_item_cache, bugs that did not change since the last run are taken from the local cache.
+        """
+        done = self.load_resumed_results(item_tasks) if self.resume else {}
+        # Without resumed bugs the tasks are passed on as they are (possibly a stream)
+        pending_tasks = [task for task in item_tasks if str(task.bug_id).strip() not in done] if done else item_tasks
+
+        self.journal.start(resume=self.resume)
+        try:
+            if not done and not self.config.get("use_work_item_cache", False):
+                # Nothing to merge: fetch reports the progress itself
+                for result in fetch(pending_tasks, report_progress=True):
+                    self.journal.append(result)
+                    yield result
+                return
+
+            if self.config.get("use_work_item_cache", False):
+                from logic.cached_item_processor import iter_items_cached
+                fetched = iter_items_cached(pending_tasks, self.config,
+                                            lambda tasks: fetch(tasks, report_progress=False), report_progress=False)
+            else:
+                fetched = fetch(pending_tasks, report_progress=False)
+
+            total_bugs = len(item_tasks)
+            completed = 0
+            for results, journaled in ((list(done.values()), True), (fetched, False)):
+                for result in results:
+                    if not journaled:
+                        self.journal.append(result)
+                    completed += 1
+                    print(f"{ProgressMessages.PROGRESS_PREFIX} {completed}/{total_bugs}", flush=True)
+                    yield result
+        finally:
+            self.journal.close()
+
+    def load_resumed_results(self, item_tasks):
+        """
+        Return the journaled records of the previous run that can be reused, keyed by Bug ID:
+        the bug is still in the Excel file with the same test IDs and was processed without error.
+        """
+        journaled = self.journal.load()
+        done = {}
+        for task in item_tasks:
+            bug_id_str = str(task.bug_id).strip()
+            record = journaled.get(bug_id_str)
+            if (record and not is_error_record(record)
+                    and record.get("STD ID in DOORS") == ", ".join(str(tid) for tid in task.test_ids)):
+                done[bug_id_str] = record
+
+        print(f"Resuming: {len(done)} of {len(item_tasks)} bugs already done ({self.journal.path})")
+        return done
+
+    def iter_bugs_sequential(self, item_tasks, work_item, work_items_search, report_progress=True):
+        """
+        Process the bugs one by one in the current browser and yield their result records.
+        """
+        total_bugs = len(item_tasks)
+        for index, task in enumerate(item_tasks, start=1):
+            bug_results = []
+            opened = self.process_single_bug(task.bug_id, task.test_ids, work_item, work_items_search, bug_results)
+
+            # --- Emit live progress to stdout ---
+            if report_progress:
+                print(f"{ProgressMessages.PROGRESS_PREFIX} {index}/{total_bugs}", flush=True)
+
+            if opened:
+                BasePageApp(self.driver).close_current_bug_button()
+
+            yield from bug_results
+
+    def build_item_tasks(self):
+        """
+        Build one ItemTask per bug of the bug map, with its direct work item URL.
+        """
+        return list(self.iter_item_tasks(self.bug_map_dict.items()))
+
+    def iter_item_tasks(self, bug_tests):
+        """
+        Yield one ItemTask, with its direct work item URL, per (bug_id, test_ids) pair.
+        """
+        from logic.parallel_item_processor import build_item_url
+
         base_url = self.config["url"]
-        item_tasks = []
-        for bug_id, test_ids in self.bug_map_dict.items():
+        for bug_id, test_ids in bug_tests:
             bug_id_str = str(bug_id).strip()
-            item_url = build_item_url(base_url, bug_id_str)
-            item_tasks.append(ItemTask(
-                url=item_url,
+            yield ItemTask(
+                url=build_item_url(base_url, bug_id_str),
                 bug_id=bug_id_str,
                 test_ids=test_ids,
                 use_direct_navigation=True
-            ))
-        
-        # Get number of workers from config, or use default (CPU count)
-        num_workers = self.config.get("parallel_workers", None)
-        
-        # Process in parallel
-        results = process_items_parallel(
-            item_tasks=item_tasks,
-            config=self.config,
-            num_workers=num_workers
-        )
-        
-        # Export results
-        if results:
-            export_automation_results_html(results)
-        
-        print(ProgressMessages.PROCESS_FINISHED, flush=True)
+            )
 
     def process_single_bug(self, bug_id, test_ids, work_item, work_items_search, results):
         """
@@ -150,8 +337,6 @@ class TestBugSTDValidation(unittest.TestCase):
 
         comment = ""
 
-        expected_test_ids = [str(tid) for tid in test_ids]
-
         # Validate the BUG ID (digits only)
         bug_id_str = str(bug_id).strip()
         if not bug_id_str.isdigit():
@@ -170,73 +355,19 @@ class TestBugSTDValidation(unittest.TestCase):
 
         # Try to open the bug details
         work_items_search.fill_bug_id_input_and_press_enter(bug_id_str)
+        work_item.wait_until_form_ready()
 
-        std_id_field_val = work_item.get_std_id_value()
-
-        ok, std_comment = validate_std_id(std_id_field_val, expected_test_ids)
-        comment += std_comment
-
-        status_str = Status.SUCCESS if ok else Status.FAILURE
-        last_reproduced_status, iteration_path_status, std_name_status = self.check_fields(work_item)
-
-        if not ok and self.handle_additional_info_std_id(work_item, expected_test_ids):
-            std_id_field_val = ", ".join(expected_test_ids)
-            status_str = Status.SUCCESS
-            comment = Status.MATCH
-
-        results.append(build_result_record(
-            bug_id_str,
-            test_ids,
-            std_id_field_val,
-            status_str,
-            comment,
-            last_reproduced_status,
-            iteration_path_status,
-            std_name_status
-        ))
+        # Read and validate every field of the form in one round trip
+        results.append(build_record_from_form(work_item, bug_id_str, test_ids, self.config))
 
         return True
 
-    @staticmethod
-    def handle_additional_info_std_id(work_item, expected_test_ids):
-        """
-         Check 'Additional Info' tab for STD_ID fallback; return True if IDs match expected list.
-        """
-        work_item.click_on_additional_info_tab()
-        additional_info_text = work_item.get_additional_info_value()
-        tc_id_list = extract_tc_ids_from_additional_info(STDConstants.DEFAULT_STD_NAME, additional_info_text)
-        return sorted(tc_id_list) == sorted(expected_test_ids)
-
-    def check_fields(self, work_item):
-        """
-        Compare the Last_reproduced_in, Iteration_path, and STD Name fields to the config.json file
-        """
-        last_reproduced_in_text = work_item.get_last_reproduce_in_value()
-        iteration_path_text = work_item.get_iteration_path_value()
-        std_name_text = work_item.get_std_name_value()
-
-        last_reproduced_status = Status.SUCCESS if last_reproduced_in_text == self.last_reproduced_in_config else Status.FAILURE
-
-        # Base comparison for iteration path
-        iteration_path_status = Status.SUCCESS if iteration_path_text == self.iteration_path_config else Status.FAILURE
-
-        # Legacy fallback: replace last segment with "Legacy" if iteration path was not found
-        if "/" in self.iteration_path_config:
-            parts = self.iteration_path_config.rsplit("/", 1)
-            iteration_path_config_legacy = parts[0] + "/Legacy"
-            if iteration_path_text == iteration_path_config_legacy:
-                iteration_path_status = Status.SUCCESS
-
-        # Compare STD Name field to config
-        std_name_status = Status.SUCCESS if std_name_text == self.std_name_config else Status.FAILURE
-
-        return last_reproduced_status, iteration_path_status, std_name_status
-
 
 if __name__ == "__main__":
     import os
     import sys
     import logging
+    import argparse
     from infra import logger_setup
 
     # Grab the logger configured by infra.logger_setup
@@ -250,6 +381,12 @@ if __name__ == "__main__":
 
     config = ConfigProvider.load_config_json(config_path)
 
+    parser = argparse.ArgumentParser(description="Validate the STD IDs of the bugs in the Excel file")
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip the bugs already validated by the previous (interrupted) run')
+    args, _ = parser.parse_known_args()
+    TestBugSTDValidation.resume = args.resume
+
     suite = unittest.TestSuite()
     suite.addTest(TestBugSTDValidation('test_unique_bugs_std_id'))
     result = unittest.TextTestRunner(verbosity=2).run(suite)
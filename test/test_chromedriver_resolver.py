@@ -0,0 +1,55 @@
+import os, tempfile, unittest
+from unittest import mock
+
+from infra.chromedriver_resolver import resolve_chromedriver_path, read_stamp
+from utils.constants import ChromeDriverStamp
+
+
+class TestChromeDriverResolver(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.stamp_path = os.path.join(self.temp_dir.name, ChromeDriverStamp.FILE_NAME)
+        self.driver_path = os.path.join(self.temp_dir.name, "chromedriver")
+        self.environ = mock.patch.dict(os.environ)
+        self.environ.start()
+        os.environ.pop(ChromeDriverStamp.PATH_ENV_VAR, None)
+
+    def tearDown(self):
+        self.environ.stop()
+        self.temp_dir.cleanup()
+
+    def install(self):
+        open(self.driver_path, "w").close()
+        return self.driver_path
+
+    def resolve(self, chrome_version):
+        """Resolve as a new run would: nothing inherited from a parent process."""
+        os.environ.pop(ChromeDriverStamp.PATH_ENV_VAR, None)
+        with mock.patch("chromedriver_autoinstaller.get_chrome_version", return_value=chrome_version), \
+                mock.patch("chromedriver_autoinstaller.install", side_effect=self.install) as install:
+            path = resolve_chromedriver_path(self.stamp_path)
+            # Later calls in the same process (and its workers) use the exported path
+            self.assertEqual(resolve_chromedriver_path(self.stamp_path), path)
+        return path, install.call_count
+
+    def test_installs_once_per_chrome_version(self):
+        self.assertEqual(self.resolve("120.0.6099.110"), (self.driver_path, 1))
+        self.assertEqual(read_stamp(self.stamp_path),
+                         {"chrome_version": "120.0.6099.110", "driver_path": self.driver_path})
+
+        self.assertEqual(self.resolve("120.0.6099.110"), (self.driver_path, 0))
+        self.assertEqual(os.environ[ChromeDriverStamp.PATH_ENV_VAR], self.driver_path)
+
+        self.assertEqual(self.resolve("121.0.6167.85"), (self.driver_path, 1))
+
+    def test_missing_driver_is_installed_again(self):
+        self.resolve("120.0.6099.110")
+        os.remove(self.driver_path)
+
+        _, install_calls = self.resolve("120.0.6099.110")
+
+        self.assertEqual(install_calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from logic import parallel_item_processor
+from logic.parallel_item_processor import ItemTask, DriverPool, iter_items_parallel
+from test.fake_driver import FakeDriver
+from utils.constants import ParallelEngines
+
+CONFIG = {"url": "https://dev.azure.com/org/project"}
+
+
+class TestDriverPool(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+        patch = mock.patch.object(parallel_item_processor, "open_authenticated_driver", side_effect=self.open_driver)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.observed = []
+        self.pool = DriverPool(CONFIG, on_new_driver=self.observed.append)
+
+    def open_driver(self, config, session_state=None):
+        self.drivers.append(FakeDriver(config["url"]))
+        return self.drivers[-1]
+
+    def test_released_driver_is_lent_again(self):
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.pool.release(first)
+
+        self.assertIsNot(first, second)
+        self.assertIs(self.pool.acquire(), first)
+        self.assertEqual(self.observed, [first, second])
+
+    def test_dead_driver_is_replaced(self):
+        driver = self.pool.acquire()
+        driver.quit()
+        self.pool.release(driver)
+
+        replacement = self.pool.acquire()
+        self.assertIsNot(replacement, driver)
+        self.assertEqual(len(self.drivers), 2)
+
+    def test_surplus_drivers_are_quit(self):
+        self.pool.prefill(3)
+        busy = self.pool.acquire()
+
+        self.pool.set_max_size(1)
+        self.assertEqual(sum(driver.killed.is_set() for driver in self.drivers), 2)
+        self.assertFalse(busy.killed.is_set())
+
+        self.pool.close()
+        self.assertTrue(all(driver.killed.is_set() for driver in self.drivers))
+
+
+class TestThreadEngine(unittest.TestCase):
+    def setUp(self):
+        self.drivers = []
+        self.busy_drivers = set()
+        self.shared_drivers = []
+        self.lock = threading.Lock()
+        patches = [
+            mock.patch.object(parallel_item_processor, "open_authenticated_driver", side_effect=self.open_driver),
+            mock.patch.object(parallel_item_processor, "process_item_with_driver", side_effect=self.process_item),
+            mock.patch.object(parallel_item_processor, "resolve_chromedriver_path"),
+            mock.patch("builtins.print"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def open_driver(self, config, session_state=None):
+        with self.lock:
+            self.drivers.append(FakeDriver(config["url"]))
+            return self.drivers[-1]
+
+    def process_item(self, task, config, driver):
+        with self.lock:
+            if driver in self.busy_drivers:
+                self.shared_drivers.append(driver)
+            self.busy_drivers.add(driver)
+        time.sleep(0.01)
+        with self.lock:
+            self.busy_drivers.remove(driver)
+        return {"Bug ID": task.bug_id, "Comments": ""}
+
+    def test_workers_share_their_drivers(self):
+        tasks = [ItemTask(url=f"{CONFIG['url']}/{bug}", bug_id=str(bug), test_ids=[bug]) for bug in range(10)]
+
+        results = list(iter_items_parallel(tasks, CONFIG, num_workers=3, engine=ParallelEngines.THREAD,
+                                           report_progress=False))
+
+        self.assertEqual(sorted(int(r["Bug ID"]) for r in results), list(range(10)))
+        # Never more drivers than threads, each used by one thread at a time, all quit at the end
+        self.assertLessEqual(len(self.drivers), 3)
+        self.assertEqual(self.shared_drivers, [])
+        self.assertTrue(all(driver.killed.is_set() for driver in self.drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import os, unittest
 
+from infra.std_cache import StdCache
 from infra.config_provider import ConfigProvider
 from infra.working_with_exel import validate_and_summarize
 
@@ -14,7 +15,11 @@ class TestExcelViolations(unittest.TestCase):
 
     def test_excel_violations(self):
         """Validate that STD Excel is 100% valid with zero violations; generate HTML report."""
-        violations = validate_and_summarize(self.std_excel_path)
+        violations = validate_and_summarize(
+            self.std_excel_path,
+            streaming=self.config.get("stream_validation", False),
+            cache=StdCache() if self.config.get("std_cache", True) else None
+        )
 
         # Export HTML report for violations
         export_excel_violations_html(violations)
@@ -0,0 +1,65 @@
+import unittest
+
+from logic.parallel_item_processor import ItemTask, process_items_with_deadline, is_error_record
+from test.fake_driver import FakeDriver
+
+CONFIG = {"item_timeout_seconds": 0.2, "item_timeout_retries": 1}
+
+
+class TestItemDeadline(unittest.TestCase):
+    def setUp(self):
+        self.tasks = [ItemTask(url=f"https://example/{bug}", bug_id=str(bug), test_ids=[bug]) for bug in (1, 2)]
+        self.drivers = []
+        self.released = []
+
+    def acquire(self):
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+    def attempt(self, driver):
+        return self.drivers.index(driver) + 1
+
+    def release(self, driver, killed):
+        self.released.append(killed)
+
+    def process(self, run):
+        return process_items_with_deadline(self.tasks, CONFIG, self.acquire, self.release, run)
+
+    def test_record_finished_after_the_kill_is_retried(self):
+        def run(tasks, driver):
+            for task in tasks:
+                if self.attempt(driver) == 1 and task.bug_id == "2":
+                    # The page readers swallow the dead driver's errors and report a plain mismatch
+                    driver.killed.wait()
+                yield {"Bug ID": task.bug_id, "Comments": f"mismatch on attempt {self.attempt(driver)}"}
+
+        results = self.process(run)
+
+        self.assertEqual([r["Comments"] for r in results], ["mismatch on attempt 1", "mismatch on attempt 2"])
+        self.assertEqual(self.released, [True, False])
+
+    def test_failed_driver_is_retried_on_a_fresh_one(self):
+        def run(tasks, driver):
+            if self.attempt(driver) == 1:
+                raise RuntimeError("chrome not reachable")
+            for task in tasks:
+                yield {"Bug ID": task.bug_id, "Comments": "ok"}
+
+        results = self.process(run)
+
+        self.assertEqual([r["Comments"] for r in results], ["ok", "ok"])
+        self.assertEqual(self.released, [True, False])
+
+    def test_items_fail_when_every_attempt_fails(self):
+        def run(tasks, driver):
+            raise RuntimeError("chrome not reachable")
+            yield
+
+        results = self.process(run)
+
+        self.assertTrue(all(is_error_record(r) and "chrome not reachable" in r["Comments"] for r in results))
+        self.assertEqual(len(self.drivers), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
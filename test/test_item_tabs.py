@@ -0,0 +1,105 @@
+import unittest
+from unittest import mock
+
+from logic import parallel_item_processor
+from logic.parallel_item_processor import ItemTask, batch_tasks, iter_items_in_tabs, iter_items_parallel
+from test.fake_driver import FakeDriver
+from utils.constants import ParallelEngines, Status, WorkItemFields
+
+CONFIG = {
+    "url": "https://dev.azure.com/org/Project/_workitems",
+    "current_version": "v2.1.0",
+    "iteration_path": "Project/Sprint 7",
+    "std_name": "Feather STD",
+}
+STD_IDS = {"11": "101", "12": ""}
+ADDITIONAL_INFO = "Feather - Unique Functionality STD\n21, 22"
+
+
+class FakeWorkItem:
+    """Form of the work item loaded in the current tab of a FakeDriver."""
+
+    def __init__(self, driver, calls):
+        self.driver = driver
+        self.calls = calls
+
+    def shown_bug(self):
+        urls = [args[0] for tab, args in self.driver.scripts if tab == self.driver.current]
+        return urls[-1].rsplit("/", 1)[-1] if urls else None
+
+    def wait_until_work_item_shown(self, bug_id, timeout=None):
+        return self.shown_bug() == bug_id
+
+    def read_fields(self):
+        # Additional Info is not in the DOM while its tab is hidden
+        return {
+            WorkItemFields.STD_ID: STD_IDS.get(self.shown_bug(), ""),
+            WorkItemFields.LAST_REPRODUCED_IN: CONFIG["current_version"],
+            WorkItemFields.ITERATION_PATH: CONFIG["iteration_path"],
+            WorkItemFields.STD_NAME: CONFIG["std_name"],
+            WorkItemFields.ADDITIONAL_INFO: None,
+        }
+
+    def get_rich_text_field_from_api(self, api_url, reference_name):
+        self.calls.append(("api", api_url))
+        return ADDITIONAL_INFO
+
+    def click_on_additional_info_tab(self):
+        self.calls.append(("tab", self.shown_bug()))
+
+
+class TestItemTabs(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        patch = mock.patch.object(parallel_item_processor, "WorkItem",
+                                  side_effect=lambda driver: FakeWorkItem(driver, self.calls))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def make_tasks(self, bugs, test_ids=None):
+        return [ItemTask(url=f"{CONFIG['url']}/edit/{bug}", bug_id=bug, test_ids=(test_ids or {}).get(bug, [bug]))
+                for bug in bugs]
+
+    def test_tasks_are_split_into_batches(self):
+        batches = list(batch_tasks(iter(self.make_tasks(["1", "2", "3", "4", "5"])), 2))
+
+        self.assertEqual([[task.bug_id for task in batch] for batch in batches], [["1", "2"], ["3", "4"], ["5"]])
+
+    def test_every_item_loads_in_its_own_tab(self):
+        driver = FakeDriver()
+        tasks = self.make_tasks(["11", "abc", "12"], {"11": [101], "12": [21, 22]})
+
+        results = list(iter_items_in_tabs(tasks, CONFIG, driver))
+
+        self.assertEqual(driver.window_handles, ["tab-1", "tab-2", "tab-3"])
+        # Both loads start before the first tab is read; the invalid bug is never loaded
+        self.assertEqual(driver.scripts[:2], [("tab-1", (tasks[0].url,)), ("tab-3", (tasks[2].url,))])
+        self.assertEqual([r["Bug ID"] for r in results], ["11", "abc", "12"])
+        self.assertEqual(results[0]["Comments"], Status.MATCH)
+        self.assertTrue(results[1]["Comments"].startswith("Invalid bug number"))
+        # Bug 12 matches on the Additional Info read through the API, without opening its tab
+        self.assertEqual(results[2]["Comments"], Status.MATCH)
+        self.assertEqual([kind for kind, _ in self.calls], ["api"])
+        self.assertIn("/_apis/wit/workitems/12?", self.calls[0][1])
+
+    def test_thread_workers_take_batches_of_tabs(self):
+        drivers = []
+
+        def open_driver(config, session_state=None):
+            drivers.append(FakeDriver(config["url"]))
+            return drivers[-1]
+
+        with mock.patch.object(parallel_item_processor, "open_authenticated_driver", side_effect=open_driver), \
+                mock.patch.object(parallel_item_processor, "resolve_chromedriver_path"), \
+                mock.patch("builtins.print"):
+            results = list(iter_items_parallel(self.make_tasks(["11", "12", "13", "14", "15"]), CONFIG,
+                                               num_workers=2, engine=ParallelEngines.THREAD,
+                                               tabs_per_browser=2, report_progress=False))
+
+        self.assertEqual(sorted(r["Bug ID"] for r in results), ["11", "12", "13", "14", "15"])
+        self.assertLessEqual(len(drivers), 2)
+        self.assertTrue(all(len(driver.window_handles) == 2 for driver in drivers))
+
+
+if __name__ == "__main__":
+    unittest.main()
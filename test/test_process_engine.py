@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
+from logic import parallel_item_processor
+from logic.parallel_item_processor import (
+    ItemTask, iter_items_parallel, process_items_parallel, init_persistent_worker, process_item_with_worker_driver
+)
+from test.fake_driver import FakeDriver
+from utils.constants import ParallelEngines, ProgressMessages
+
+CONFIG = {"url": "https://dev.azure.com/org/project"}
+
+
+class TestProcessEngine(unittest.TestCase):
+    def setUp(self):
+        self.used_drivers = []
+        patches = [
+            mock.patch.object(parallel_item_processor, "open_authenticated_driver", side_effect=lambda *a: FakeDriver()),
+            mock.patch.object(parallel_item_processor, "process_item_with_driver", side_effect=self.process_item),
+            mock.patch.object(parallel_item_processor, "resolve_chromedriver_path"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.opened = parallel_item_processor.open_authenticated_driver
+        self.tasks = [ItemTask(url=f"{CONFIG['url']}/{bug}", bug_id=str(bug), test_ids=[bug]) for bug in range(3)]
+
+    def process_item(self, task, config, driver):
+        self.used_drivers.append(driver)
+        if task.bug_id == "1":
+            # Chrome crashes while the item is read
+            driver.quit()
+        return {"Bug ID": task.bug_id, "Comments": ""}
+
+    def test_worker_driver_is_reused_until_it_dies(self):
+        init_persistent_worker(CONFIG)
+        self.addCleanup(parallel_item_processor._quit_worker_driver)
+
+        results = [process_item_with_worker_driver(task, CONFIG) for task in self.tasks]
+
+        self.assertEqual([r["Bug ID"] for r in results], ["0", "1", "2"])
+        first, _, second = self.used_drivers
+        # Opened once by the pool initializer, then again after the crash
+        self.assertEqual(self.used_drivers, [first, first, second])
+        self.assertEqual(self.opened.call_count, 2)
+
+    def test_results_stream_back_as_they_finish(self):
+        slow_bug_may_finish = threading.Event()
+
+        def process_single_item(task, config, session_state=None):
+            if task.bug_id == "0":
+                slow_bug_may_finish.wait(5)
+            return {"Bug ID": task.bug_id, "Comments": ""}
+
+        # A thread pool has the process pool's API and sees the patched worker function
+        with mock.patch.object(parallel_item_processor, "process_single_item", side_effect=process_single_item), \
+                mock.patch.object(parallel_item_processor, "create_process_pool", side_effect=lambda *a: ThreadPool(2)), \
+                mock.patch("builtins.print") as printed:
+            results = iter_items_parallel(self.tasks, CONFIG, num_workers=2, engine=ParallelEngines.PROCESS)
+            # Bug 0 is still running while the other two are handed over
+            first = [next(results)["Bug ID"] for _ in range(2)]
+            slow_bug_may_finish.set()
+            rest = [r["Bug ID"] for r in results]
+
+        self.assertEqual(first, ["1", "2"])
+        self.assertEqual(rest, ["0"])
+        progress = [call.args[0] for call in printed.call_args_list
+                    if str(call.args[0]).startswith(ProgressMessages.PROGRESS_PREFIX)]
+        self.assertEqual(progress, [f"{ProgressMessages.PROGRESS_PREFIX} {i}/3" for i in (1, 2, 3)])
+
+    def test_list_api_returns_results_in_task_order(self):
+        def process_single_item(task, config, session_state=None):
+            # The first bugs finish last
+            time.sleep(0.02 * (len(self.tasks) - int(task.bug_id)))
+            return {"Bug ID": task.bug_id, "Comments": ""}
+
+        with mock.patch.object(parallel_item_processor, "process_single_item", side_effect=process_single_item), \
+                mock.patch.object(parallel_item_processor, "create_process_pool", side_effect=lambda *a: ThreadPool(3)), \
+                mock.patch("builtins.print"):
+            results = process_items_parallel(self.tasks, CONFIG, num_workers=3, engine=ParallelEngines.PROCESS)
+
+        self.assertEqual([r["Bug ID"] for r in results], ["0", "1", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os, tempfile, unittest
+
+from utils.results_journal import ResultsJournal
+from utils.std_id_validator import build_result_record
+from utils.constants import Status
+
+
+def make_record(bug_id, comment=Status.MATCH):
+    return build_result_record(bug_id, [1, 2], "1, 2", Status.SUCCESS, comment,
+                               Status.SUCCESS, Status.SUCCESS, Status.SUCCESS)
+
+
+class TestResultsJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = ResultsJournal(os.path.join(self.temp_dir.name, "run.jsonl"))
+
+    def tearDown(self):
+        self.journal.close()
+        self.temp_dir.cleanup()
+
+    def test_resume_keeps_previous_records(self):
+        self.journal.start()
+        self.journal.append(make_record("1"))
+        self.journal.append(make_record("2", Status.TC_IDS_DONT_MATCH))
+        self.journal.close()
+
+        self.journal.start(resume=True)
+        self.journal.append(make_record("2"))
+        self.journal.close()
+
+        records = self.journal.load()
+        self.assertEqual(list(records), ["1", "2"])
+        self.assertEqual(records["2"]["Comments"], Status.MATCH)
+
+        # A new run starts from an empty journal
+        self.journal.start()
+        self.journal.close()
+        self.assertEqual(self.journal.load(), {})
+
+    def test_truncated_last_line_is_ignored(self):
+        self.journal.start()
+        self.journal.append(make_record("1"))
+        self.journal.close()
+        with open(self.journal.path, "a", encoding="utf-8") as f:
+            f.write('{"Bug ID": "2", "STD ID')
+
+        self.journal.start(resume=True)
+        self.journal.append(make_record("3"))
+        self.journal.close()
+
+        self.assertEqual(list(self.journal.load()), ["1", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
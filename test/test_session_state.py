@@ -0,0 +1,23 @@
+import unittest
+
+from logic.parallel_item_processor import open_tabs
+from test.fake_driver import FakeDriver
+
+STATE = {"cookies": [], "origin": "https://dev.azure.com", "local_storage": {"token": "x"}, "session_storage": {}}
+
+
+class TestSessionState(unittest.TestCase):
+    def test_new_tabs_restore_the_web_storage(self):
+        driver = FakeDriver()
+
+        handles = open_tabs(driver, 3, session_state=STATE)
+
+        self.assertEqual(handles, ["tab-1", "tab-2", "tab-3"])
+        self.assertEqual(driver.commands, [
+            ("tab-2", "Page.addScriptToEvaluateOnNewDocument"),
+            ("tab-3", "Page.addScriptToEvaluateOnNewDocument"),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import os, tempfile, unittest
+from datetime import datetime
+from unittest import mock
+
+from openpyxl import Workbook
+
+from infra import working_with_exel
+from infra.std_cache import StdCache
+from infra.working_with_exel import get_bug_to_tests_map, validate_and_summarize, load_std_table
+
+HEADERS = ["ID", "Headline", "Expected Results", "Test Results", "Actual Results", "Defect No", "Comment"]
+ROWS = [
+    (101, "Login", "Logged in", "Pass", "Y", None, " padded "),
+    (102, "Logout", "Logged out", "Fail", "N, crash", "1234", None),
+    (None, "Note", None, None, None, None, None),
+    (104, "Profile", "Saved", "Pass", "Y", 5678.0, True),
+    (105, "Search", "Found", "Fail", "N", 1, datetime(2024, 1, 1)),
+]
+
+
+class TestStdCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = StdCache(os.path.join(self.temp_dir.name, "cache"))
+        self.excel_path = self.write_std("std.xlsx", ROWS)
+
+    def write_std(self, name, rows):
+        path = os.path.join(self.temp_dir.name, name)
+        workbook = Workbook()
+        workbook.active.append(HEADERS)
+        for row in rows:
+            workbook.active.append(row)
+        workbook.save(path)
+        return path
+
+    def run_both(self, cache):
+        bug_map = get_bug_to_tests_map(self.excel_path, cache=cache)
+        with mock.patch("builtins.print"):
+            rules = validate_and_summarize(self.excel_path, cache=cache)
+        return bug_map, rules
+
+    def test_repeat_run_skips_the_workbook(self):
+        working_with_exel._load_std_table.cache_clear()
+        parsed = load_std_table(self.excel_path)
+        first = self.run_both(self.cache)
+
+        # A new process: nothing in memory, the workbook must not be opened again
+        working_with_exel._load_std_table.cache_clear()
+        with mock.patch.object(working_with_exel, "load_workbook", side_effect=AssertionError("workbook parsed")):
+            second = self.run_both(StdCache(self.cache.folder))
+            cached = StdCache(self.cache.folder).load_table(self.excel_path)
+
+        self.assertEqual(second, first)
+        self.assertEqual(cached.headers, parsed.headers)
+        # Cell types survive the cache: 1 and True, 5678.0 and datetimes are read back as they were
+        self.assertEqual([tuple(map(repr, row)) for row in cached.rows],
+                         [tuple(map(repr, row)) for row in parsed.rows])
+
+    def test_bug_map_is_built_from_the_table_of_the_violations_run(self):
+        working_with_exel._load_std_table.cache_clear()
+        expected = get_bug_to_tests_map(self.excel_path)
+        with mock.patch("builtins.print"):
+            validate_and_summarize(self.excel_path, cache=self.cache)
+
+        working_with_exel._load_std_table.cache_clear()
+        bug_validation_cache = StdCache(self.cache.folder)
+        self.assertIsNone(bug_validation_cache.load_bug_map(self.excel_path))
+        with mock.patch.object(working_with_exel, "load_workbook", side_effect=AssertionError("workbook parsed")):
+            bug_map = bug_validation_cache.get_bug_map(self.excel_path)
+
+        self.assertEqual(bug_map, expected)
+        # Stored for the next run
+        self.assertEqual(StdCache(self.cache.folder).load_bug_map(self.excel_path), expected)
+
+    def test_changed_file_is_parsed_again(self):
+        self.run_both(self.cache)
+        self.excel_path = self.write_std("std.xlsx", ROWS[:2])
+
+        self.assertIsNone(self.cache.load_table(self.excel_path))
+        self.assertIsNone(self.cache.load_bug_map(self.excel_path))
+        self.assertEqual(get_bug_to_tests_map(self.excel_path, cache=self.cache), {"1234": [102]})
+
+    def test_least_recently_used_entries_are_removed(self):
+        cache = StdCache(self.cache.folder, max_entries=1)
+        cache.save_table(self.excel_path, load_std_table(self.excel_path))
+        other_path = self.write_std("other.xlsx", ROWS[:1])
+        cache.save_table(other_path, load_std_table(other_path))
+
+        self.assertEqual(os.listdir(cache.folder), [cache.key(other_path)])
+        self.assertIsNone(cache.load_table(self.excel_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
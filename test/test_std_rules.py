@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+
+from infra.std_rules import RULES, Cell, Condition, StdRule, CompiledRules, register_rule, text_lower, get_rule_description
+from infra.working_with_exel import StdTable, normalize_columns, validate_and_summarize
+from utils.constants import STDConstants
+
+HEADERS = normalize_columns(["ID", "Headline", "Expected Results", "Test Results", "Defect No", "Comment"])
+ROWS = [
+    (101, "Login", "Logged in", "Pass", None, "checked twice"),
+    (102, "Logout", "Logged out", "Fail", 1234, None),
+    (103, "Search", "Found", "Pass", None, None),
+]
+
+
+def fail_on_call(value):
+    raise AssertionError("a skipped rule must not read any cell")
+
+
+class TestStdRules(unittest.TestCase):
+    def setUp(self):
+        self.table = StdTable(HEADERS, ROWS)
+
+    def test_registered_rule_is_validated_and_reported(self):
+        register_rule(StdRule(
+            "Rule9", "Comment filled AND Test Results = Pass",
+            Cell("comment", bool) & Cell("results", lambda v: text_lower(v) == STDConstants.PASS),
+            requires=("comment", "results"),
+        ))
+        self.addCleanup(RULES.pop, "Rule9")
+
+        with mock.patch("builtins.print"), self.assertLogs(level="INFO") as logs:
+            rules = validate_and_summarize(self.table)
+
+        self.assertEqual([r["id"] for r in rules["Rule9"]], [101])
+        self.assertEqual(get_rule_description("Rule9"), "Comment filled AND Test Results = Pass")
+        self.assertTrue(any("Rule9" in line and "ms" in line for line in logs.output))
+
+    def test_rule_without_its_columns_is_skipped(self):
+        rules = [StdRule("NeedsActual", "", Cell("actual", fail_on_call), requires=("actual",))]
+        compiled = CompiledRules.for_table(self.table, rules)
+
+        masks, timings = compiled.masks(self.table)
+
+        self.assertEqual(compiled.active, [])
+        self.assertEqual(compiled.empty_results(), {"NeedsActual": []})
+        self.assertEqual(masks, {})
+        self.assertEqual(compiled.violations({"actual_results": "x"}), [])
+
+    def test_undeclared_column_is_rejected(self):
+        with self.assertRaises(ValueError):
+            StdRule("Bad", "", Cell("comment", bool), requires=("results",))
+
+    def test_incomplete_condition_cannot_be_created(self):
+        class RowOnly(Condition):
+            def compile(self, context):
+                return lambda row: True
+
+        with self.assertRaises(TypeError):
+            RowOnly()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os, tempfile, unittest
+from unittest import mock
+
+from openpyxl import Workbook
+
+from infra import working_with_exel
+from infra.working_with_exel import (
+    get_bug_to_tests_map, validate_and_summarize, load_std_table,
+    StdTable, normalize_columns, strip_row
+)
+from infra.std_rules import CompiledRules
+
+ROWS = [
+    (101, "Login", "Logged in", "Pass", "Y", None),
+    (102, "Logout", "Logged out", "Fail", "N, crash", "1234"),
+    (None, "Note", None, None, None, None),
+    (104, "Profile", "Saved", "Pass", "Y", 5678.0),
+    (105, "Search", "Found", "Fail", "N", None),
+]
+
+
+class TestStdTable(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.excel_path = os.path.join(self.temp_dir.name, "std.xlsx")
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["ID", "Headline", "Expected Results", "Test Results", "Actual Results", "Defect No"])
+        for row in ROWS:
+            sheet.append(row)
+        workbook.save(self.excel_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_workbook_is_read_once(self):
+        with mock.patch.object(working_with_exel, "load_workbook", wraps=working_with_exel.load_workbook) as loader:
+            working_with_exel._load_std_table.cache_clear()
+            bug_map = get_bug_to_tests_map(self.excel_path)
+            with mock.patch("builtins.print"):
+                rules = validate_and_summarize(self.excel_path)
+
+        self.assertEqual(loader.call_count, 1)
+        # Test IDs keep their cell type even though the ID column has a blank cell
+        self.assertEqual(bug_map, {"1234": [102], "5678": [104]})
+        self.assertEqual([r["id"] for r in rules["Rule3"]], [104])
+        self.assertEqual([r["id"] for r in rules["Rule4"]], [105])
+        self.assertEqual([r["id"] for r in rules["Rule5"]], [105])
+
+    def test_columns_are_resolved_from_column_map(self):
+        table = load_std_table(self.excel_path)
+
+        self.assertEqual(table.column("bug"), "defect_no")
+        self.assertEqual(table.column("actual"), "actual_results")
+        self.assertIsNone(table.column("comment", required=False))
+        with self.assertRaises(ValueError):
+            table.column("comment")
+
+    def test_streaming_keeps_compact_records(self):
+        with mock.patch("builtins.print"):
+            rules = validate_and_summarize(self.excel_path)
+            streamed = validate_and_summarize(self.excel_path, streaming=True)
+
+        self.assertEqual({k: [r["id"] for r in v] for k, v in streamed.items()},
+                         {k: [r["id"] for r in v] for k, v in rules.items()})
+        self.assertEqual(streamed["Rule4"], [{"row": 6, "id": 105, "headline": "Search"}])
+
+    def test_masks_match_row_checks(self):
+        headers = normalize_columns(["ID", "Headline", "Expected Results", "Test Results", "Actual Results",
+                                     "Defect No", "Comment"])
+        odd = [None, "", "  ", 0, 0.0, 1, 1.0, True, False, float("nan"), "None", " n/a ", "N/A", "pass",
+               "Fail", "Not Tested", "Blocked", "Y", "N, crash", "N,", "n, x", 1234, "55, 66"]
+        rows = [(i, "Test", odd[i % len(odd)], odd[i * 7 % len(odd)], odd[i * 5 % len(odd)],
+                 odd[i * 3 % len(odd)], odd[i * 11 % len(odd)]) for i in range(len(odd) ** 2)]
+        rows.append((999, "Precondition only", None, None, None, None, None))
+        table = StdTable(headers, rows)
+
+        compiled = CompiledRules.for_table(table)
+        expected = compiled.empty_results()
+        for row_dict in table.row_dicts():
+            row_dict = strip_row(row_dict)
+            for rule_name in compiled.violations(row_dict):
+                expected[rule_name].append(row_dict)
+        with mock.patch("builtins.print"):
+            rules = validate_and_summarize(table)
+
+        self.assertEqual(rules, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os, tempfile, threading, unittest
+from http.server import ThreadingHTTPServer
+
+from infra.ado_rest_client import AdoRestClient, parse_ado_url
+from infra.work_item_cache import WorkItemCache
+from logic.parallel_item_processor import ItemTask, build_record_from_form
+from logic.rest_item_processor import iter_items_rest
+from logic.cached_item_processor import iter_items_cached
+
+from test.test_ado_rest_client import CONFIG, PAT, StubAdoHandler, make_work_item
+from utils.constants import Status, WorkItemFields
+
+
+class UnreadFormWorkItem:
+    """Work item form whose fields were not found (e.g. the page was not rendered yet)."""
+
+    def read_fields(self):
+        return {WorkItemFields.ADDITIONAL_INFO: ""}
+
+
+class TestWorkItemCache(unittest.TestCase):
+    def setUp(self):
+        StubAdoHandler.requests = []
+        StubAdoHandler.work_items = {i: make_work_item(i, str(i)) for i in range(1, 6)}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubAdoHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.config = dict(CONFIG, url=f"http://127.0.0.1:{self.server.server_port}/org/Project/_workitems")
+        organization_url, project = parse_ado_url(self.config["url"])
+        self.client = AdoRestClient(organization_url, project, PAT)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = WorkItemCache(organization_url, os.path.join(self.temp_dir.name, "cache.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        self.temp_dir.cleanup()
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_cached(self, tasks, config=None):
+        """Validate the tasks through the cache; return the records and the bug IDs that were fetched."""
+        config = config or self.config
+        fetched = []
+
+        def fetch(pending):
+            fetched.extend(task.bug_id for task in pending)
+            return iter_items_rest(pending, config, self.client, report_progress=False)
+
+        results = list(iter_items_cached(tasks, config, fetch, self.client, self.cache, report_progress=False))
+        return {r["Bug ID"]: r for r in results}, fetched
+
+    def test_unchanged_bugs_are_not_fetched_again(self):
+        tasks = [ItemTask(url="", bug_id=str(i), test_ids=[i]) for i in range(1, 7)]
+
+        first, fetched = self.run_cached(tasks)
+        self.assertEqual(fetched, ["1", "2", "3", "4", "5", "6"])
+
+        second, fetched = self.run_cached(tasks)
+        # Bug 6 does not exist, so it is never cached
+        self.assertEqual(fetched, ["6"])
+        self.assertEqual(first, second)
+        self.assertEqual(second["1"]["Test Case ID Status"], Status.SUCCESS)
+
+    def test_changes_invalidate_entries(self):
+        tasks = [ItemTask(url="", bug_id=str(i), test_ids=[i]) for i in range(1, 6)]
+        self.run_cached(tasks)
+
+        # New revision of bug 2, new expected test IDs for bug 3
+        StubAdoHandler.work_items[2] = make_work_item(2, "20", rev=4)
+        tasks[2] = ItemTask(url="", bug_id="3", test_ids=[30])
+        results, fetched = self.run_cached(tasks)
+        self.assertEqual(fetched, ["2", "3"])
+        self.assertEqual(results["2"]["STD ID in VSTS"], "20")
+        self.assertEqual(results["3"]["Comments"], Status.TC_IDS_DONT_MATCH)
+
+        # Different config values, force_refresh and an expired TTL all fetch everything
+        _, fetched = self.run_cached(tasks, dict(self.config, current_version="v2.2.0"))
+        self.assertEqual(len(fetched), 5)
+        _, fetched = self.run_cached(tasks, dict(self.config, current_version="v2.2.0", force_refresh=True))
+        self.assertEqual(len(fetched), 5)
+        self.cache.ttl_seconds = 0
+        _, fetched = self.run_cached(tasks, dict(self.config, current_version="v2.2.0"))
+        self.assertEqual(len(fetched), 5)
+
+    def test_records_of_unread_forms_are_not_cached(self):
+        tasks = [ItemTask(url="", bug_id=str(i), test_ids=[i]) for i in range(1, 3)]
+
+        def fetch_from_unread_form(pending):
+            for task in pending:
+                yield build_record_from_form(UnreadFormWorkItem(), task.bug_id, task.test_ids, self.config)
+
+        results = list(iter_items_cached(tasks, self.config, fetch_from_unread_form, self.client, self.cache,
+                                         report_progress=False))
+        self.assertTrue(all(r["Comments"].startswith(Status.FAILED_TO_READ) for r in results))
+        self.assertEqual({r["Last Reproduced In Status"] for r in results}, {Status.FAILURE})
+
+        # The glitch is not remembered: the next run reads both bugs again
+        results, fetched = self.run_cached(tasks)
+        self.assertEqual(fetched, ["1", "2"])
+        self.assertEqual(results["1"]["Test Case ID Status"], Status.SUCCESS)
+
+
+if __name__ == "__main__":
+    unittest.main()
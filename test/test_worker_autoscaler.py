@@ -0,0 +1,111 @@
+import threading
+import time
+import unittest
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
+from logic import parallel_item_processor, worker_autoscaler
+from logic.parallel_item_processor import (
+    ItemTask, DriverPool, WorkerWarmup, iter_items_parallel, calibrate_autoscaler, build_error_record
+)
+from logic.worker_autoscaler import WorkerAutoscaler
+from test.fake_driver import FakeDriver
+from utils.constants import Autoscaling, ParallelEngines
+
+CONFIG = {"url": "https://dev.azure.com/org/project"}
+
+
+def process_item(task, config, driver):
+    return {"Bug ID": task.bug_id, "Comments": ""}
+
+
+class TestWorkerAutoscaler(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.object(parallel_item_processor, "open_authenticated_driver", side_effect=lambda *a: FakeDriver(CONFIG["url"])),
+            mock.patch.object(parallel_item_processor, "process_item_with_driver", side_effect=process_item),
+            mock.patch.object(parallel_item_processor, "resolve_chromedriver_path"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.opened = parallel_item_processor.open_authenticated_driver
+        self.tasks = [ItemTask(url=f"{CONFIG['url']}/{bug}", bug_id=str(bug), test_ids=[bug]) for bug in range(6)]
+
+    def test_warmed_up_pool_keeps_its_starting_count(self):
+        with mock.patch.object(WorkerAutoscaler, "memory_limit", return_value=3), \
+                mock.patch.object(WorkerAutoscaler, "initial_workers", autospec=True,
+                                  side_effect=WorkerAutoscaler.initial_workers) as decision, \
+                mock.patch("builtins.print"):
+            warmup = WorkerWarmup(CONFIG, num_workers=4, engine=ParallelEngines.THREAD, autoscale=True).start()
+            results = list(iter_items_parallel(self.tasks, CONFIG, warmup=warmup, report_progress=False))
+
+        self.assertEqual(decision.call_count, 1)
+        self.assertEqual(warmup.initial_workers, 3)
+        self.assertEqual(sorted(r["Bug ID"] for r in results), [str(bug) for bug in range(6)])
+
+    def use_measured_drivers(self, available_mb):
+        """Every driver measures 250 MB; available_mb of memory is free beyond the reserve."""
+        patches = [
+            mock.patch.object(parallel_item_processor, "can_measure_driver_memory", return_value=True),
+            mock.patch.object(worker_autoscaler, "measure_driver_memory_mb", return_value=250),
+            mock.patch.object(worker_autoscaler, "get_available_memory_mb",
+                              return_value=Autoscaling.MEMORY_RESERVE_MB + available_mb),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_starting_count_comes_from_a_measured_driver(self):
+        autoscaler = WorkerAutoscaler(max_workers=8)
+        self.use_measured_drivers(1000)
+
+        workers = calibrate_autoscaler(autoscaler, CONFIG)
+
+        # 1000 MB fit 4 drivers at the measured 250 MB (only 2 at the 400 MB estimate)
+        self.assertEqual(workers, 4)
+        self.assertEqual(self.opened.call_count, 1)
+
+    def test_measured_driver_stays_in_the_pool(self):
+        autoscaler = WorkerAutoscaler(max_workers=8)
+        pool = DriverPool(CONFIG, on_new_driver=autoscaler.observe_driver)
+        self.use_measured_drivers(750)
+
+        workers = calibrate_autoscaler(autoscaler, CONFIG, driver_pool=pool)
+        pool.prefill(workers)
+
+        # The open driver counts as one worker; 750 MB fit 3 more
+        self.assertEqual(workers, 4)
+        self.assertEqual(self.opened.call_count, 4)
+
+    def test_process_engine_scales_down_at_run_time(self):
+        self.use_measured_drivers(1000)
+        lock = threading.Lock()
+        running = []
+        in_flight_at_start = []
+
+        def process_single_item(task, config, session_state=None):
+            with lock:
+                running.append(task)
+                in_flight_at_start.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(task)
+            return build_error_record(task, RuntimeError("chrome not reachable"))
+
+        tasks = [ItemTask(url=f"{CONFIG['url']}/{bug}", bug_id=str(bug), test_ids=[bug]) for bug in range(20)]
+        with mock.patch.object(parallel_item_processor, "process_single_item", side_effect=process_single_item), \
+                mock.patch.object(parallel_item_processor, "create_process_pool",
+                                  side_effect=lambda config, num_workers, *a: ThreadPool(num_workers)), \
+                mock.patch("builtins.print"):
+            results = list(iter_items_parallel(tasks, CONFIG, num_workers=8, engine=ParallelEngines.PROCESS,
+                                               autoscale=True, report_progress=False))
+
+        self.assertEqual(len(results), 20)
+        # Every item fails, so each decision removes a worker: 4 at the start, at most 2 at the end
+        self.assertEqual(max(in_flight_at_start), 4)
+        self.assertLessEqual(max(in_flight_at_start[-3:]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
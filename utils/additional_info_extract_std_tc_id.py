@@ -1,4 +1,5 @@
 import re
+from html import unescape
 
 
 def extract_tc_ids_from_additional_info(std_name: str, additional_info_text: str) -> list[int]:
@@ -32,3 +33,16 @@ def extract_tc_ids_from_additional_info(std_name: str, additional_info_text: str
                 break
 
     return tc_ids
+
+
+def html_to_text(html: str) -> str:
+    """
+    Convert a rich-text field value (as returned by the REST API) to the plain text shown on the form.
+    Block elements and line breaks become new lines so extract_tc_ids_from_additional_info sees the same lines.
+    """
+    if not html:
+        return ""
+    text = re.sub(r"(?i)<br\s*/?>", "\n", html)
+    text = re.sub(r"(?i)</(div|p|li|tr|h[1-6])\s*>", "\n", text)
+    text = re.sub(r"<[^>]+>", "", text)
+    return unescape(text).replace("\xa0", " ")
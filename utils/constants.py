@@ -24,9 +24,17 @@ class Timeouts:
     ELEMENT_VISIBILITY_TIMEOUT = 30
     ELEMENT_CLICKABLE_TIMEOUT = 10
     FIELD_VALIDATION_TIMEOUT = 20
+    # Wall-clock limit for one item in the parallel engine before its driver is killed (config key: item_timeout_seconds)
+    ITEM_DEADLINE = 180
+    
+    # Longest wait for a page to render (work item form fields, app header) before reading it anyway
+    PAGE_READY_TIMEOUT = 30
+    # Wait for the web app to show a work item after client-side navigation, before falling back to a full load
+    SPA_NAVIGATION_TIMEOUT = 10
+    # Limit for a REST request sent from inside the signed-in page
+    IN_PAGE_FETCH_TIMEOUT = 10
     
     # Sleep durations
-    PAGE_LOAD_SLEEP = 3
     INPUT_DELAY_SLEEP = 0.1
     POLL_FREQUENCY = 0.2
 
@@ -38,6 +46,8 @@ class Retries:
     DEFAULT_RETRIES = 3
     NAVIGATION_RETRIES = 3
     CLICK_RETRIES = 3
+    # Extra attempts, each on a fresh driver, for an item that passed its deadline (config key: item_timeout_retries)
+    ITEM_TIMEOUT_RETRIES = 1
 
 # ============================================================================
 # Status Symbols and Messages
@@ -49,6 +59,11 @@ class Status:
     PLACEHOLDER = "---"
     MATCH = "Match"
     EMPTY = ""
+    PROCESSING_ERROR = "Processing error"
+    WORK_ITEM_NOT_FOUND = "Work item not found."
+    ITEM_TIMED_OUT = "Item timed out"
+    # Start of the comment of a record whose form fields could not all be read
+    FAILED_TO_READ = "Failed to read"
     
     # Validation status messages
     STD_ID_EMPTY = "STD ID is empty."
@@ -67,9 +82,151 @@ class BrowserOptions:
         "--disable-dev-shm-usage",
         "--disable-extensions",
         "--disable-infobars",
-        "--disable-blink-features=AutomationControlled"
+        "--disable-blink-features=AutomationControlled",
+        # Background tabs keep loading at full speed (multi-tab workers, see tabs_per_browser)
+        "--disable-background-timer-throttling",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows"
+    ]
+
+
+class ChromeDriverStamp:
+    """Resolved ChromeDriver path, reused while the installed Chrome version is unchanged."""
+    FILE_NAME = "chromedriver_stamp.json"
+    # Set by the parent process so workers (threads and spawned processes) skip the resolution
+    PATH_ENV_VAR = "STE_CHROMEDRIVER_PATH"
+
+
+class LeanBrowser:
+    """Lean browser profile used for scraping (config key: lean_browser)."""
+    # Extra Chrome switches: no background traffic, updates or first-run work
+    ARGUMENTS = [
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--disable-domain-reliability",
+        "--disable-client-side-phishing-detection",
+        "--metrics-recording-only",
+        "--no-first-run",
+        "--mute-audio"
+    ]
+    # Return from driver.get at DOMContentLoaded; the readiness waits decide when the page is usable
+    PAGE_LOAD_STRATEGY = "eager"
+    # DevTools Network.setBlockedURLs patterns: images, fonts, avatars and telemetry beacons
+    BLOCKED_URL_PATTERNS = [
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.svg*", "*.ico*", "*.webp*",
+        "*.woff*", "*.ttf*", "*.eot*",
+        "*/_apis/GraphProfile/MemberAvatars/*",
+        "*/_api/_common/identityImage*",
+        "*browser.events.data.microsoft.com*",
+        "*dc.services.visualstudio.com*",
+        "*js.monitor.azure.com*",
+        "*vortex.data.microsoft.com*"
     ]
 
+# ============================================================================
+# Work Item Fields
+# ============================================================================
+class WorkItemFields:
+    """Names of the work item fields that are validated (as labelled on the work item form)."""
+    STD_ID = "STD ID"
+    STD_NAME = "STDName"
+    LAST_REPRODUCED_IN = "LastRepreducedIn"
+    ITERATION_PATH = "Iteration Path"
+    ADDITIONAL_INFO = "AdditionalInfo"
+
+    # Azure DevOps reference names used by the REST API (config key: rest_field_reference_names)
+    DEFAULT_REFERENCE_NAMES = {
+        STD_ID: "Custom.STDID",
+        STD_NAME: "Custom.STDName",
+        LAST_REPRODUCED_IN: "Custom.LastRepreducedIn",
+        ITERATION_PATH: "System.IterationPath",
+        ADDITIONAL_INFO: "Custom.AdditionalInfo",
+    }
+
+# ============================================================================
+# Fetch Backends
+# ============================================================================
+class FetchBackends:
+    """Ways to read the work item fields (config key: fetch_backend)."""
+    # Scrape the work item form in Chrome
+    BROWSER = "browser"
+    # Read the fields from the Azure DevOps REST API
+    REST = "rest"
+    # Same API, one request per bug issued concurrently from asyncio
+    REST_ASYNC = "rest_async"
+
+    DEFAULT = BROWSER
+
+
+class RestApi:
+    """Azure DevOps REST API settings."""
+    API_VERSION = "7.0"
+    # Maximum number of IDs accepted by the work items batch endpoint
+    BATCH_SIZE = 200
+    REQUEST_TIMEOUT = 30
+    POOL_SIZE = 10
+    # Environment variable read when the config has no rest_api_pat
+    PAT_ENV_VAR = "ADO_PAT"
+    # Retries for throttled (429) and server error (5xx) responses
+    MAX_RETRIES = 5
+    BACKOFF_FACTOR = 0.5
+    MAX_BACKOFF = 30
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # Requests in flight at once for the asyncio fetcher (config key: rest_concurrency)
+    ASYNC_CONCURRENCY = 16
+
+
+class WorkItemCacheSettings:
+    """Local cache of validated bugs, reused while the work item revision is unchanged (config key: use_work_item_cache)."""
+    FILE_NAME = "work_item_cache.sqlite3"
+    # Entries older than this are fetched again even if the revision did not change (config key: cache_ttl_hours)
+    DEFAULT_TTL_HOURS = 24
+    # Fields requested from the REST API to detect changes
+    REVISION_FIELD = "System.Rev"
+    CHANGED_DATE_FIELD = "System.ChangedDate"
+
+
+class StdCacheSettings:
+    """Parsed STD workbooks kept on disk, reused while the Excel file is unchanged (config key: std_cache)."""
+    FOLDER_NAME = "std_cache"
+    # Workbooks kept in the cache; the least recently used ones are removed
+    MAX_ENTRIES = 5
+    # Entries written with another format version are ignored
+    FORMAT_VERSION = 2
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+# ============================================================================
+# Parallel Processing Configuration
+# ============================================================================
+class ParallelEngines:
+    """Engines that can run the parallel item processing (config key: parallel_engine)."""
+    # One Python process per worker (multiprocessing.Pool)
+    PROCESS = "process"
+    # One thread per worker inside the current process (ThreadPoolExecutor)
+    THREAD = "thread"
+
+    DEFAULT = PROCESS
+
+
+class Autoscaling:
+    """Worker autoscaler limits and thresholds (config key: autoscale_workers)."""
+    # Memory used by one headless Chrome (driver + browser processes) until it is measured
+    DEFAULT_DRIVER_MEMORY_MB = 400
+    # Free memory left untouched for the OS and the main process
+    MEMORY_RESERVE_MB = 1024
+    MIN_WORKERS = 1
+
+    # Completed items between two scaling decisions (per current worker)
+    DECISION_WINDOW_PER_WORKER = 2
+    # Scale down when more than this share of recent items raised errors
+    MAX_ERROR_RATE = 0.2
+    # Scale down when the recent median latency is this much slower than the best one seen
+    LATENCY_DEGRADATION_FACTOR = 1.5
+    # Scale up only while the recent median latency stays within this factor of the best one
+    LATENCY_HEADROOM_FACTOR = 1.2
+
 # ============================================================================
 # STD and Validation Constants
 # ============================================================================
@@ -85,6 +242,12 @@ class STDConstants:
     N_A = "n/a"
     NONE = "none"
     NAN = "nan"
+
+    # Cells that pandas.read_excel reads as empty (its default na_values), matched on the whole cell
+    NA_CELL_VALUES = frozenset({
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+        "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    })
     
     # Actual results validation
     ACTUAL_PASS_VALUE = "Y"
@@ -102,6 +265,9 @@ class ReportConfig:
     NO_BUGS_MESSAGE = "All clear! No bugs found ✅"
     NO_VIOLATIONS_MESSAGE = "No violations found ✅"
 
+    # Crash-safe results journal, one JSONL file per Excel file (AppData/ste_tool_studio/journals)
+    JOURNALS_FOLDER_NAME = "journals"
+
 # ============================================================================
 # Excel Column Mapping
 # ============================================================================
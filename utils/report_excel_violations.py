@@ -1,6 +1,7 @@
 import os
 import pandas as pd
 
+from infra.std_rules import get_rule_description
 from utils.utils import save_report_copy
 from utils.constants import ExcelRules, ReportConfig, Status, REPORTS_FOLDER_NAME
 
@@ -33,7 +34,7 @@ def export_excel_violations_html(violations, filename=ReportConfig.VIOLATIONS_RE
                     rows = elem.get("rows") or []
                     normalized.append({
                         "rule_key": rule_key,
-                        "rule_name": ExcelRules.RULE_NAMES.get(rule_key, str(rule_key)),
+                        "rule_name": get_rule_description(rule_key),
                         "rows": rows
                     })
                 return normalized
@@ -47,7 +48,7 @@ def export_excel_violations_html(violations, filename=ReportConfig.VIOLATIONS_RE
         for rule_key, rows in items:
             normalized.append({
                 "rule_key": rule_key,
-                "rule_name": ExcelRules.RULE_NAMES.get(rule_key, str(rule_key)),
+                "rule_name": get_rule_description(rule_key),
                 "rows": rows or []
             })
         return normalized
@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+import logging
+
+from utils.constants import APP_DATA_FOLDER_NAME, ReportConfig
+
+
+def get_journal_path(excel_path):
+    """
+    Returns the journal file of an Excel file: AppData/ste_tool_studio/journals/<name>-<path hash>.jsonl
+    """
+    appdata = os.getenv('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+    folder = os.path.join(appdata, APP_DATA_FOLDER_NAME, ReportConfig.JOURNALS_FOLDER_NAME)
+    os.makedirs(folder, exist_ok=True)
+
+    full_path = os.path.normcase(os.path.abspath(excel_path))
+    path_hash = hashlib.sha1(full_path.encode("utf-8")).hexdigest()[:10]
+    name = os.path.splitext(os.path.basename(excel_path))[0]
+    return os.path.join(folder, f"{name}-{path_hash}.jsonl")
+
+
+class ResultsJournal:
+    """
+    Append-only JSONL file holding every result record of a run as soon as it exists.
+    Each line is flushed and synced to disk, so a crash loses at most the record being written.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    @classmethod
+    def for_excel(cls, excel_path):
+        """Journal of the given Excel file (see get_journal_path)."""
+        return cls(get_journal_path(excel_path))
+
+    def load(self):
+        """
+        Reads the records of the previous run.
+        Returns:
+            dict of Bug ID -> record (the last record wins); a truncated last line is ignored
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Ignoring unreadable line {line_number} of results journal {self.path}")
+                    continue
+                records[str(record.get("Bug ID", "")).strip()] = record
+        return records
+
+    def start(self, resume=False):
+        """
+        Opens the journal for writing.
+        - resume: keep the records of the previous run and append after them; otherwise start empty
+        """
+        self.close()
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if resume and self._file.tell() > 0 and not self._ends_with_newline():
+            # The previous run died in the middle of a line: keep the next record on its own line
+            self._file.write("\n")
+        logging.info(f"Results journal: {self.path} ({'resumed' if resume else 'new run'})")
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def append(self, record):
+        """Writes one record and forces it to disk."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
@@ -1,4 +1,5 @@
-from utils.constants import Status
+from utils.constants import Status, STDConstants, WorkItemFields
+from utils.additional_info_extract_std_tc_id import extract_tc_ids_from_additional_info
 
 
 def validate_std_id(vsts_field_val, expected_test_ids):
@@ -61,3 +62,87 @@ def build_result_record(
         "Iteration Path Status": iteration_path_status or Status.FAILURE,
         "Comments": comment
     }
+
+
+def check_field_values(last_reproduced_in_text, iteration_path_text, std_name_text,
+                       last_reproduced_in_config, iteration_path_config, std_name_config):
+    """
+    Compares the Last Reproduced In, Iteration Path and STD Name values of a bug to the config values.
+    - The iteration path also passes when it matches the config path with its last segment replaced by "Legacy"
+    Returns:
+        tuple of (last_reproduced_status, iteration_path_status, std_name_status)
+    """
+    last_reproduced_status = Status.SUCCESS if last_reproduced_in_text == last_reproduced_in_config else Status.FAILURE
+
+    # Base comparison for iteration path
+    iteration_path_status = Status.SUCCESS if iteration_path_text == iteration_path_config else Status.FAILURE
+
+    # Legacy fallback: replace last segment with "Legacy" if iteration path was not found
+    if iteration_path_status == Status.FAILURE and "/" in iteration_path_config:
+        parts = iteration_path_config.rsplit("/", 1)
+        if iteration_path_text == parts[0] + "/Legacy":
+            iteration_path_status = Status.SUCCESS
+
+    std_name_status = Status.SUCCESS if std_name_text == std_name_config else Status.FAILURE
+
+    return last_reproduced_status, iteration_path_status, std_name_status
+
+
+def validate_additional_info_std_id(additional_info_text, expected_test_ids):
+    """
+    Checks the STD ID fallback written in the Additional Info field.
+    Returns True if the test IDs listed under the default STD name match the expected list.
+    """
+    tc_id_list = extract_tc_ids_from_additional_info(STDConstants.DEFAULT_STD_NAME, additional_info_text or "")
+    return sorted(tc_id_list) == sorted(str(tid) for tid in expected_test_ids)
+
+
+def build_record_from_field_values(bug_id, test_ids, field_values, config):
+    """
+    Runs the full bug validation on field values that were already read (e.g. from the REST API).
+    - bug_id: The Azure Bug ID
+    - test_ids: List of test IDs linked to this bug
+    - field_values: dict keyed by WorkItemFields names; missing fields count as empty
+    - config: Configuration dictionary with current_version, iteration_path and std_name
+
+    Returns:
+        dict in the build_result_record format, identical to what the browser flow produces
+    """
+    bug_id_str = str(bug_id).strip()
+    expected_test_ids = [str(tid) for tid in test_ids]
+
+    if not bug_id_str.isdigit():
+        return build_result_record(
+            bug_id_str, test_ids, Status.PLACEHOLDER, Status.PLACEHOLDER,
+            f"Invalid bug number: {bug_id_str}. ", Status.PLACEHOLDER, Status.PLACEHOLDER, Status.PLACEHOLDER
+        )
+
+    std_id_field_val = field_values.get(WorkItemFields.STD_ID) or ""
+    ok, comment = validate_std_id(std_id_field_val, expected_test_ids)
+    status_str = Status.SUCCESS if ok else Status.FAILURE
+
+    last_reproduced_status, iteration_path_status, std_name_status = check_field_values(
+        field_values.get(WorkItemFields.LAST_REPRODUCED_IN) or "",
+        field_values.get(WorkItemFields.ITERATION_PATH) or "",
+        field_values.get(WorkItemFields.STD_NAME) or "",
+        config.get("current_version", ""),
+        config.get("iteration_path", ""),
+        config.get("std_name", "")
+    )
+
+    # Additional Info fallback when the STD ID field does not match
+    if not ok and validate_additional_info_std_id(field_values.get(WorkItemFields.ADDITIONAL_INFO), expected_test_ids):
+        std_id_field_val = ", ".join(expected_test_ids)
+        status_str = Status.SUCCESS
+        comment = Status.MATCH
+
+    return build_result_record(
+        bug_id_str,
+        test_ids,
+        std_id_field_val,
+        status_str,
+        comment,
+        last_reproduced_status,
+        iteration_path_status,
+        std_name_status
+    )